@@ -0,0 +1,306 @@
+import itertools
+import os
+import re
+import stat
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+
+# Producers embed the run date either as MM_DD_YYYY or YYYY-MM-DD.
+DATE_TOKEN_PATTERN = re.compile(r"(?:^|_)(\d{2}_\d{2}_\d{4}|\d{4}-\d{2}-\d{2})(?=_|$)")
+DATE_TOKEN_FORMATS = ("%m_%d_%Y", "%Y-%m-%d")
+PAGE_NUMBER_PATTERN = re.compile(r"_page_(\d+)")
+DATABASE_SUFFIXES = (".sqlite3", ".sqlite3-wal", ".sqlite3-shm", ".sqlite3-journal")
+# Derived state lives one level down: rewriting a file inside a subdirectory
+# leaves the data directory's own mtime, the catalog's cache key, untouched.
+CACHE_DIR_NAME = ".cache"
+
+_generations = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class AssetVersion:
+    path: str
+    name: str
+    family: str
+    extension: str
+    date_token: str | None
+    size: int
+    mtime: float
+    mtime_ns: int
+    inode: int
+    snapshot_date: date | None = None
+
+    @property
+    def sort_key(self) -> tuple[date, int]:
+        # The embedded run date decides; mtime only orders files of the same
+        # date (or undated ones), so a touch or restore cannot reorder runs.
+        return (self.snapshot_date or date.min, self.mtime_ns)
+
+
+@dataclass(frozen=True)
+class PageRun:
+    """The pages one run of a multi-page chart set produced, in page order."""
+
+    run_date: date | None
+    pages: tuple[AssetVersion, ...]
+
+    @property
+    def page_numbers(self) -> list[int]:
+        return [page_number(page.family) for page in self.pages]
+
+    @property
+    def complete(self) -> bool:
+        # Runs number their pages from 1 without gaps; a hole means the
+        # upload is still in progress (or was cut short).
+        return self.page_numbers == list(range(1, len(self.pages) + 1))
+
+
+def page_number(family: str) -> int:
+    match = PAGE_NUMBER_PATTERN.search(family)
+    return int(match.group(1)) if match else -1
+
+
+def split_asset_name(file_name: str) -> tuple[str, str | None, str]:
+    """Split a file name into (family, date token, lowercase extension)."""
+    stem, extension = os.path.splitext(file_name)
+    matches = list(DATE_TOKEN_PATTERN.finditer(stem))
+    if not matches:
+        return stem, None, extension.lower()
+    match = matches[-1]
+    family = stem[:match.start()] + stem[match.end():]
+    return family, match.group(1), extension.lower()
+
+
+def parse_date_token(date_token: str | None) -> date | None:
+    if date_token is None:
+        return None
+    for date_format in DATE_TOKEN_FORMATS:
+        try:
+            return datetime.strptime(date_token, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+def fold_family(family: str) -> str:
+    return family.replace(" ", "_").upper()
+
+
+class AssetCatalog:
+    def __init__(self, base_dir: str, versions: list[AssetVersion]):
+        self.base_dir = base_dir
+        # Increases with every scan or update, so it names one state of the directory.
+        self.generation = next(_generations)
+        self._versions = list(versions)
+        self._by_family: dict[tuple[str, str], list[AssetVersion]] = {}
+        self._by_folded: dict[tuple[str, str], list[AssetVersion]] = {}
+        for version in versions:
+            self._by_family.setdefault((version.family, version.extension), []).append(version)
+            self._by_folded.setdefault((fold_family(version.family), version.extension), []).append(version)
+        for family_versions in self._by_family.values():
+            family_versions.sort(key=lambda item: item.sort_key)
+        for family_versions in self._by_folded.values():
+            family_versions.sort(key=lambda item: item.sort_key)
+        self._page_runs: dict[tuple[str, str, str], list[PageRun]] = {}
+        self._extension_counts: dict[str, int] = {}
+        for version in versions:
+            self._extension_counts[version.extension] = self._extension_counts.get(version.extension, 0) + 1
+
+    def versions(self, family: str, extension: str) -> list[AssetVersion]:
+        """Return every version of a family, oldest run date first."""
+        return self._by_family.get((family, extension), [])
+
+    def folded_versions(self, family: str, extension: str) -> list[AssetVersion]:
+        """Like ``versions`` but ignoring case and space/underscore differences."""
+        return self._by_folded.get((fold_family(family), extension), [])
+
+    def latest(self, family: str, extension: str) -> str | None:
+        family_versions = self.versions(family, extension)
+        if not family_versions:
+            return None
+        return family_versions[-1].path
+
+    def latest_folded(self, family: str, extension: str) -> str | None:
+        family_versions = self.folded_versions(family, extension)
+        if not family_versions:
+            return None
+        return family_versions[-1].path
+
+    def recent(self, family: str, extension: str, count: int, folded: bool = False) -> list[AssetVersion]:
+        """The ``count`` newest versions of a family, newest first."""
+        family_versions = self.folded_versions(family, extension) if folded else self.versions(family, extension)
+        return family_versions[::-1][:count]
+
+    def page_runs(self, prefix: str, extension: str, suffix: str = "") -> list[PageRun]:
+        """Every run of the ``prefix<n>suffix`` page families, oldest first.
+
+        Pages are grouped by the date in their file names, so pages of
+        different runs never mix. The catalog is immutable, so the grouping
+        is computed once per catalog.
+        """
+        key = (prefix, extension, suffix)
+        runs = self._page_runs.get(key)
+        if runs is None:
+            by_date: dict[date | None, dict[int, AssetVersion]] = {}
+            for family in self.families(prefix, extension):
+                if not family.endswith(suffix) or page_number(family) < 0:
+                    continue
+                for version in self.versions(family, extension):
+                    # Same page and date twice (a re-upload): the newer file wins.
+                    by_date.setdefault(version.snapshot_date, {})[page_number(family)] = version
+            runs = [
+                PageRun(run_date, tuple(pages[number] for number in sorted(pages)))
+                for run_date, pages in sorted(by_date.items(), key=lambda item: item[0] or date.min)
+            ]
+            self._page_runs[key] = runs
+        return runs
+
+    def latest_page_run(self, prefix: str, extension: str, suffix: str = "") -> PageRun | None:
+        """The newest complete run, or the newest run when none is complete."""
+        runs = self.page_runs(prefix, extension, suffix)
+        complete_runs = [run for run in runs if run.complete]
+        if complete_runs:
+            return complete_runs[-1]
+        return runs[-1] if runs else None
+
+    def families(self, prefix: str, extension: str) -> list[str]:
+        return sorted(
+            family
+            for family, family_extension in self._by_family
+            if family_extension == extension and family.startswith(prefix)
+        )
+
+    def asset_count(self, *extensions: str) -> int:
+        return sum(self._extension_counts.get(extension, 0) for extension in extensions)
+
+    def all_versions(self) -> list[AssetVersion]:
+        return list(self._versions)
+
+
+def cache_path(base_dir: str, file_name: str) -> str:
+    return os.path.join(base_dir, CACHE_DIR_NAME, file_name)
+
+
+def is_asset_name(file_name: str) -> bool:
+    # Skip dotfiles, Excel lock files such as "~$summary.xlsx" and the trade
+    # ledger database, whose journal changes on every save.
+    return not file_name.startswith((".", "~$")) and not file_name.endswith(DATABASE_SUFFIXES)
+
+
+def asset_version(path: str, file_name: str, stat_result: os.stat_result) -> AssetVersion:
+    family, date_token, extension = split_asset_name(file_name)
+    return AssetVersion(
+        path=path,
+        name=file_name,
+        family=family,
+        extension=extension,
+        date_token=date_token,
+        size=stat_result.st_size,
+        mtime=stat_result.st_mtime,
+        mtime_ns=stat_result.st_mtime_ns,
+        inode=stat_result.st_ino,
+        snapshot_date=parse_date_token(date_token),
+    )
+
+
+def current_version(version: AssetVersion) -> AssetVersion | None:
+    """Re-stat ``version``'s file, or None if it is gone.
+
+    An in-place overwrite keeps the directory mtime, so without the data
+    watcher a cached catalog's size, mtime and inode can lag the file.
+    """
+    try:
+        stat_result = os.stat(version.path)
+    except OSError:
+        return None
+    if (stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino) == (version.size, version.mtime_ns, version.inode):
+        return version
+    return asset_version(version.path, version.name, stat_result)
+
+
+def scan_asset_versions(base_dir: str) -> list[AssetVersion]:
+    versions = []
+    try:
+        entries = list(os.scandir(base_dir))
+    except OSError:
+        return versions
+    for entry in entries:
+        if not is_asset_name(entry.name):
+            continue
+        try:
+            if not entry.is_file():
+                continue
+            stat_result = entry.stat()
+        except OSError:
+            continue
+        versions.append(asset_version(entry.path, entry.name, stat_result))
+    return versions
+
+
+_catalog_lock = threading.Lock()
+_catalogs: dict[str, tuple[int, AssetCatalog]] = {}
+
+
+def get_asset_catalog(base_dir: str) -> AssetCatalog:
+    """Return the catalog for ``base_dir``, rescanning only when the directory changed.
+
+    Adding, removing or renaming a file bumps the directory mtime, so a single
+    ``os.stat`` per call is enough to decide whether the cached scan is stale.
+    Overwriting a file in place does not, so its entry keeps the old size,
+    mtime and inode until the data watcher folds the change in; callers that
+    key on that identity re-stat it with ``current_version``.
+    """
+    try:
+        dir_mtime_ns = os.stat(base_dir).st_mtime_ns
+    except OSError:
+        dir_mtime_ns = -1
+    with _catalog_lock:
+        cached = _catalogs.get(base_dir)
+        if cached is not None and cached[0] == dir_mtime_ns:
+            return cached[1]
+    catalog = AssetCatalog(base_dir, scan_asset_versions(base_dir))
+    with _catalog_lock:
+        _catalogs[base_dir] = (dir_mtime_ns, catalog)
+    return catalog
+
+
+def cached_asset_catalog(base_dir: str) -> AssetCatalog | None:
+    """The last catalog built for ``base_dir``, without checking whether it is stale."""
+    with _catalog_lock:
+        cached = _catalogs.get(base_dir)
+    return cached[1] if cached is not None else None
+
+
+def update_asset_catalog(base_dir: str, changed_paths: set[str]) -> AssetCatalog:
+    """Re-stat only ``changed_paths`` and fold them into the cached catalog.
+
+    Paths that no longer exist are dropped. Without a cached catalog this
+    falls back to a full scan.
+    """
+    with _catalog_lock:
+        cached = _catalogs.get(base_dir)
+    if cached is None:
+        return get_asset_catalog(base_dir)
+    # Read the directory mtime before touching any file: if more changes land
+    # meanwhile, the stored mtime is already stale and the next lookup rescans.
+    try:
+        dir_mtime_ns = os.stat(base_dir).st_mtime_ns
+    except OSError:
+        dir_mtime_ns = -1
+    versions = {version.path: version for version in cached[1].all_versions()}
+    for path in changed_paths:
+        versions.pop(path, None)
+        file_name = os.path.basename(path)
+        if not is_asset_name(file_name):
+            continue
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISREG(stat_result.st_mode):
+            versions[path] = asset_version(path, file_name, stat_result)
+    catalog = AssetCatalog(base_dir, list(versions.values()))
+    with _catalog_lock:
+        _catalogs[base_dir] = (dir_mtime_ns, catalog)
+    return catalog
@@ -0,0 +1,179 @@
+import argparse
+import os
+import threading
+import time
+
+from asset_catalog import get_asset_catalog
+from image_derivatives import content_hash
+
+BLOB_DIR_NAME = ".blobs"
+BLOB_EXTENSIONS = (".png",)
+
+_index_lock = threading.Lock()
+_indexes: dict[str, tuple[int, dict[int, str]]] = {}
+
+
+def blob_dir(data_dir: str) -> str:
+    return os.path.join(data_dir, BLOB_DIR_NAME)
+
+
+def blob_path(data_dir: str, digest: str, extension: str) -> str:
+    return os.path.join(blob_dir(data_dir), f"{digest}{extension}")
+
+
+def blob_hashes(data_dir: str) -> dict[int, str]:
+    """Map blob inode -> sha256, rescanning only when a blob was added or removed."""
+    directory = blob_dir(data_dir)
+    try:
+        dir_mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        return {}
+    with _index_lock:
+        cached = _indexes.get(directory)
+        if cached is not None and cached[0] == dir_mtime_ns:
+            return cached[1]
+    hashes = {}
+    for entry in os.scandir(directory):
+        if entry.name.startswith("."):
+            continue
+        try:
+            hashes[entry.inode()] = os.path.splitext(entry.name)[0]
+        except OSError:
+            continue
+    with _index_lock:
+        _indexes[directory] = (dir_mtime_ns, hashes)
+    return hashes
+
+
+def blob_matches(path: str, digest: str) -> bool:
+    """Whether ``path`` still holds the bytes of ``digest`` (hashed once per size and mtime)."""
+    try:
+        return content_hash(path) == digest
+    except OSError:
+        return False
+
+
+def evict_blob(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def blob_hash(path: str, inode: int) -> str | None:
+    """The content hash of a logical file that references a blob, or None if it references none.
+
+    Every name of a blob shares its inode, so a producer that rewrites one
+    of them in place changes the blob too. The hash is checked against the
+    bytes (once per size and mtime) and a blob that no longer matches its
+    name is evicted from the store.
+    """
+    data_dir = os.path.dirname(path)
+    digest = blob_hashes(data_dir).get(inode)
+    if digest is None:
+        return None
+    if not blob_matches(path, digest):
+        evict_blob(blob_path(data_dir, digest, os.path.splitext(path)[1].lower()))
+        return None
+    return digest
+
+
+def existing_blob(data_dir: str, digest: str, extension: str) -> str | None:
+    """The blob holding ``digest``, if the store has one whose bytes still match."""
+    target = blob_path(data_dir, digest, extension)
+    if not os.path.exists(target):
+        return None
+    if not blob_matches(target, digest):
+        evict_blob(target)
+        return None
+    return target
+
+
+def link_into_place(source: str, target: str) -> None:
+    temporary = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    os.link(source, temporary)
+    os.replace(temporary, target)
+
+
+def store_blob(path: str, digest: str | None = None) -> bool:
+    """Make ``path`` a hard link to its content's blob; return True if that blob already existed.
+
+    A duplicate then costs no disk, and caches keyed on the inode (PNG
+    validation) or the content hash (derivatives) are shared with every
+    other name of the same bytes.
+    """
+    data_dir = os.path.dirname(path)
+    digest = digest or content_hash(path)
+    extension = os.path.splitext(path)[1].lower()
+    target = existing_blob(data_dir, digest, extension)
+    if target is not None:
+        if not os.path.samefile(target, path):
+            link_into_place(target, path)
+        return True
+    os.makedirs(blob_dir(data_dir), exist_ok=True)
+    link_into_place(path, blob_path(data_dir, digest, extension))
+    return False
+
+
+def prune_blobs(data_dir: str) -> int:
+    """Remove blobs no logical file links to any more."""
+    removed = 0
+    directory = blob_dir(data_dir)
+    if not os.path.isdir(directory):
+        return removed
+    for entry in os.scandir(directory):
+        try:
+            if entry.stat().st_nlink == 1:
+                os.remove(entry.path)
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def dedupe_images(data_dir: str, prune: bool = True) -> dict[str, int]:
+    """Move every image version in the data directory behind the blob store."""
+    counts = {"stored": 0, "deduplicated": 0, "linked": 0, "bytes_saved": 0, "failed": 0, "pruned": 0}
+    hashes = blob_hashes(data_dir)
+    for version in get_asset_catalog(data_dir).all_versions():
+        if version.extension not in BLOB_EXTENSIONS:
+            continue
+        if version.inode in hashes and blob_hash(version.path, version.inode):
+            counts["linked"] += 1
+            continue
+        try:
+            duplicate = store_blob(version.path)
+        except OSError:
+            counts["failed"] += 1
+            continue
+        if duplicate:
+            counts["deduplicated"] += 1
+            counts["bytes_saved"] += version.size
+        else:
+            counts["stored"] += 1
+    if prune:
+        counts["pruned"] = prune_blobs(data_dir)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Deduplicate the data directory's images into a content-addressed blob store.")
+    parser.add_argument(
+        "data_dir",
+        nargs="?",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads"),
+    )
+    parser.add_argument("--no-prune", action="store_true", help="Keep blobs no file links to any more.")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = dedupe_images(args.data_dir, prune=not args.no_prune)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{counts['stored']} stored, {counts['deduplicated']} deduplicated ({counts['bytes_saved'] / 1e6:.1f} MB saved), "
+        f"{counts['linked']} already linked, {counts['failed']} failed, {counts['pruned']} pruned in {elapsed:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+from image_derivatives import CONTAINER_WIDTH, encode_derivative
+from instrumentation import note
+
+CHART_FORMATS = ("png", "svg", "vega-lite")
+CHART_CACHE_ENTRIES = 64
+# Same savefig settings st.pyplot uses.
+CHART_DPI = 200
+BACKGROUND_COLOR = "#0e1117"
+
+
+@dataclass(frozen=True)
+class BarChartStyle:
+    title: str
+    xlabel: str
+    ylabel: str
+    ylim: tuple[float, float]
+    reference_y: float
+    reference_color: str
+    reference_width: float
+    reference_label: str
+    inches_per_bar: float
+    percent_axis: bool = False
+
+
+_chart_lock = threading.Lock()
+_charts: OrderedDict[str, bytes | str | dict] = OrderedDict()
+chart_stats = {"hits": 0, "misses": 0}
+
+
+def bar_chart_key(labels: list[str], values: list[float], colors: list[str], style: BarChartStyle, fmt: str) -> str:
+    payload = json.dumps(
+        [list(map(str, labels)), [float(value) for value in values], list(colors), asdict(style), fmt],
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def draw_bar_chart(labels: list[str], values: list[float], colors: list[str], style: BarChartStyle):
+    # A bare Figure (no pyplot) keeps no global state, so concurrent sessions can render safely.
+    from matplotlib.figure import Figure
+    import matplotlib.ticker as mticker
+
+    fig = Figure(figsize=(max(10, len(labels) * style.inches_per_bar), 6))
+    ax = fig.subplots()
+    ax.bar(labels, values, color=colors, edgecolor="black", linewidth=0.5)
+    ax.set_ylim(*style.ylim)
+    if style.percent_axis:
+        ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f"{x:.0f}%"))
+    ax.axhline(
+        style.reference_y,
+        color=style.reference_color,
+        linestyle="--",
+        linewidth=style.reference_width,
+        label=style.reference_label,
+    )
+    ax.set_title(style.title, fontsize=14, fontweight="bold")
+    ax.set_xlabel(style.xlabel)
+    ax.set_ylabel(style.ylabel)
+    ax.legend(fontsize=9)
+    ax.tick_params(axis="x", rotation=45)
+    fig.patch.set_facecolor(BACKGROUND_COLOR)
+    ax.set_facecolor(BACKGROUND_COLOR)
+    ax.title.set_color("white")
+    ax.xaxis.label.set_color("white")
+    ax.yaxis.label.set_color("white")
+    ax.tick_params(colors="white")
+    for spine in ax.spines.values():
+        spine.set_edgecolor("#444")
+    fig.tight_layout()
+    return fig
+
+
+def bar_chart_vega_lite(labels: list[str], values: list[float], colors: list[str], style: BarChartStyle) -> dict:
+    records = [
+        {"label": str(label), "value": float(value), "color": color}
+        for label, value, color in zip(labels, values, colors)
+    ]
+    y_axis = {"title": style.ylabel}
+    if style.percent_axis:
+        y_axis["labelExpr"] = "format(datum.value, '.0f') + '%'"
+    return {
+        "title": style.title,
+        "data": {"values": records},
+        "layer": [
+            {
+                "mark": {"type": "bar", "stroke": "black", "strokeWidth": 0.5},
+                "encoding": {
+                    "x": {"field": "label", "type": "nominal", "sort": None, "title": style.xlabel, "axis": {"labelAngle": -45}},
+                    "y": {"field": "value", "type": "quantitative", "scale": {"domain": list(style.ylim)}, "axis": y_axis},
+                    "color": {"field": "color", "type": "nominal", "scale": None},
+                    "tooltip": [{"field": "label", "title": style.xlabel}, {"field": "value", "title": style.ylabel}],
+                },
+            },
+            {
+                "data": {"values": [{"y": style.reference_y, "label": style.reference_label}]},
+                "mark": {"type": "rule", "color": style.reference_color, "strokeDash": [6, 4], "strokeWidth": style.reference_width},
+                "encoding": {"y": {"field": "y", "type": "quantitative"}, "tooltip": [{"field": "label"}]},
+            },
+        ],
+    }
+
+
+def encode_bar_chart(labels: list[str], values: list[float], colors: list[str], style: BarChartStyle, fmt: str) -> bytes | str | dict:
+    if fmt == "vega-lite":
+        return bar_chart_vega_lite(labels, values, colors, style)
+    fig = draw_bar_chart(labels, values, colors, style)
+    buffer = io.BytesIO()
+    if fmt == "svg":
+        fig.savefig(buffer, format="svg", bbox_inches="tight")
+        return buffer.getvalue().decode("utf-8")
+    fig.savefig(buffer, format="png", bbox_inches="tight", dpi=CHART_DPI)
+    from PIL import Image
+
+    # Pre-size to the content width so Streamlit serves these bytes as-is
+    # instead of resizing the 200 dpi render on every rerun.
+    with Image.open(io.BytesIO(buffer.getvalue())) as image:
+        image.load()
+        return encode_derivative(image, CONTAINER_WIDTH, "png")
+
+
+def render_bar_chart(
+    labels: list[str],
+    values: list[float],
+    colors: list[str],
+    style: BarChartStyle,
+    fmt: str = "png",
+) -> bytes | str | dict:
+    """Return the encoded chart (PNG bytes, SVG text or a Vega-Lite spec), building it only on a cache miss.
+
+    Charts are keyed by a hash of the plotted data and the style, so an
+    unchanged xlsx never rebuilds its figure.
+    """
+    key = bar_chart_key(labels, values, colors, style, fmt)
+    with _chart_lock:
+        chart = _charts.get(key)
+        if chart is not None:
+            _charts.move_to_end(key)
+            chart_stats["hits"] += 1
+            note("chart_cache", hit=True)
+            return chart
+        chart_stats["misses"] += 1
+    note("chart_cache", hit=False)
+    chart = encode_bar_chart(labels, values, colors, style, fmt)
+    with _chart_lock:
+        _charts[key] = chart
+        while len(_charts) > CHART_CACHE_ENTRIES:
+            _charts.popitem(last=False)
+    return chart
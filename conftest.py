@@ -0,0 +1,3 @@
+# website_test.py is the Streamlit app, not a test module: it matches pytest's
+# *_test.py pattern, and importing it starts the dashboard and its background threads.
+collect_ignore = ["website_test.py"]
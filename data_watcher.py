@@ -0,0 +1,225 @@
+import atexit
+import os
+import threading
+import time
+
+from asset_catalog import cached_asset_catalog, is_asset_name, update_asset_catalog
+from frame_cache import FRAME_CACHE
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+DEFAULT_POLL_SECONDS = 2.0
+# A nightly drop writes a few hundred files back to back; wait for a quiet
+# period so the whole batch is applied as one catalog update.
+DEFAULT_SETTLE_SECONDS = 1.0
+READ_ONLY_EVENT_TYPES = ("opened", "closed_no_write")
+
+
+class _DataDirEventHandler(FileSystemEventHandler):
+    def __init__(self, watcher: "DataDirWatcher"):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event) -> None:
+        # inotify also reports reads; only events that change a file matter.
+        if event.is_directory or event.event_type in READ_ONLY_EVENT_TYPES:
+            return
+        paths = [event.src_path, getattr(event, "dest_path", "")]
+        self.watcher.queue_changes(path for path in paths if path)
+
+
+class DataDirWatcher:
+    """Background watcher that keeps the asset catalog and frame cache in step with the data directory.
+
+    Uses inotify (through watchdog) when available and falls back to polling
+    the directory listing. ``version`` increases after every applied batch so
+    sessions can tell that new data arrived; listeners are then called with
+    the data directory. When the data directory is a symlink that a publish
+    swaps to a new run (see publish.py), the watcher follows it.
+    """
+
+    def __init__(
+        self,
+        data_dir: str,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+    ):
+        self.data_dir = data_dir
+        self.poll_seconds = poll_seconds
+        self.settle_seconds = settle_seconds
+        self.version = 0
+        self.mode = "stopped"
+        self._pending: set[str] = set()
+        self._last_event = 0.0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._observer = None
+        self._threads: list[threading.Thread] = []
+        self._listeners: list = []
+        self._target = os.path.realpath(data_dir)
+
+    def start(self) -> None:
+        if Observer is not None:
+            try:
+                observer = Observer()
+                observer.schedule(_DataDirEventHandler(self), self.data_dir, recursive=False)
+                observer.daemon = True
+                observer.start()
+                self._observer = observer
+                self.mode = "inotify"
+            except Exception:
+                # Out of inotify watches, unsupported filesystem, missing directory...
+                self._observer = None
+        if self._observer is None:
+            self._start_thread(self._poll_loop, "data-dir-poller")
+            self.mode = "polling"
+        self._start_thread(self._apply_loop, "data-dir-apply")
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+        for thread in self._threads:
+            thread.join()
+        self.mode = "stopped"
+
+    def _start_thread(self, target, name: str) -> None:
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def add_listener(self, callback) -> None:
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+
+    def queue_changes(self, paths) -> None:
+        queued = False
+        with self._lock:
+            for path in paths:
+                file_name = os.path.basename(path)
+                # Our own sidecars, scoreboard and temp files are dotfiles.
+                if not is_asset_name(file_name):
+                    continue
+                self._pending.add(os.path.join(self.data_dir, file_name))
+                queued = True
+            if queued:
+                self._last_event = time.monotonic()
+        if queued:
+            self._wake.set()
+
+    def apply_changes(self, paths: set[str]) -> None:
+        update_asset_catalog(self.data_dir, paths)
+        for path in paths:
+            FRAME_CACHE.discard_path(os.path.abspath(path))
+        with self._lock:
+            self.version += 1
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(self.data_dir)
+            except Exception:
+                pass
+
+    def _apply_loop(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.poll_seconds)
+            if self._stopped.is_set():
+                return
+            try:
+                self._check_target()
+            except Exception:
+                pass
+            with self._lock:
+                remaining = self.settle_seconds - (time.monotonic() - self._last_event)
+                if not self._pending:
+                    self._wake.clear()
+                    continue
+                if remaining <= 0:
+                    paths, self._pending = self._pending, set()
+                    self._wake.clear()
+            if remaining > 0:
+                self._stopped.wait(remaining)
+                continue
+            try:
+                self.apply_changes(paths)
+            except Exception:
+                # A failed update leaves the directory mtime check in
+                # get_asset_catalog as the safety net.
+                pass
+
+    def _check_target(self) -> None:
+        target = os.path.realpath(self.data_dir)
+        if target == self._target:
+            return
+        self._target = target
+        if self._observer is not None:
+            # inotify watches the directory the symlink pointed to at schedule time.
+            self._observer.unschedule_all()
+            self._observer.schedule(_DataDirEventHandler(self), self.data_dir, recursive=False)
+        # Unchanged files are hard links with the same size and mtime, so only
+        # what the publish actually replaced is re-read.
+        catalog = cached_asset_catalog(self.data_dir)
+        previous = {version.path: (version.size, version.mtime_ns) for version in catalog.all_versions()} if catalog else {}
+        current = self._snapshot()
+        self.apply_changes({path for path in previous.keys() | current.keys() if previous.get(path) != current.get(path)})
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        snapshot = {}
+        try:
+            entries = list(os.scandir(self.data_dir))
+        except OSError:
+            return snapshot
+        for entry in entries:
+            if not is_asset_name(entry.name):
+                continue
+            try:
+                stat_result = entry.stat()
+            except OSError:
+                continue
+            snapshot[entry.path] = (stat_result.st_size, stat_result.st_mtime_ns)
+        return snapshot
+
+    def _poll_loop(self) -> None:
+        previous = self._snapshot()
+        while not self._stopped.wait(self.poll_seconds):
+            current = self._snapshot()
+            changed = {path for path in previous.keys() | current.keys() if previous.get(path) != current.get(path)}
+            if changed:
+                self.queue_changes(changed)
+            previous = current
+
+
+_watcher_lock = threading.Lock()
+_watchers: dict[str, DataDirWatcher] = {}
+
+
+def start_data_watcher(data_dir: str) -> DataDirWatcher:
+    """Return the process-wide watcher for ``data_dir``, starting it on first use."""
+    with _watcher_lock:
+        watcher = _watchers.get(data_dir)
+        if watcher is None:
+            watcher = DataDirWatcher(data_dir)
+            watcher.start()
+            _watchers[data_dir] = watcher
+    return watcher
+
+
+def stop_data_watchers() -> None:
+    """Stop every watcher, so no observer thread is still running while the interpreter shuts down."""
+    with _watcher_lock:
+        watchers = list(_watchers.values())
+        _watchers.clear()
+    for watcher in watchers:
+        watcher.stop()
+
+
+atexit.register(stop_data_watchers)
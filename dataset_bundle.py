@@ -0,0 +1,85 @@
+import os
+import threading
+
+import pandas as pd
+
+from asset_catalog import AssetCatalog
+from frame_cache import read_csv_cached, read_excel_cached
+from scoreboard import TrendSummary, get_trend_summaries
+from table_view import TableView
+
+
+def file_version(path: str) -> tuple[int, int] | None:
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result.st_size, stat_result.st_mtime_ns
+
+
+class DatasetBundle:
+    """One catalog generation's view of the data, shared by every session in the process.
+
+    Frames are read through FRAME_CACHE on every access, so concurrent
+    viewers share a single copy of each frame and DASHBOARD_FRAME_CACHE_MB
+    still bounds them; the bundle itself keeps only the paths it has served
+    (frames must be treated as read-only). Scoreboard rows and the two
+    all-stocks table views are small and kept here. A data drop produces a
+    new catalog generation and with it a new bundle, which replaces this one
+    as a whole.
+    """
+
+    def __init__(self, data_dir: str, catalog: AssetCatalog):
+        self.data_dir = data_dir
+        self.catalog = catalog
+        self.version = catalog.generation
+        self._lock = threading.Lock()
+        self._frame_paths: set[str] = set()
+        self._summaries: dict[str, TrendSummary] = {}
+        self._views: dict[tuple, tuple[tuple[int, int], TableView]] = {}
+
+    def frame(self, path: str) -> pd.DataFrame:
+        # The frame cache keys on size and mtime, so an in-place rewrite is
+        # picked up even without the data watcher.
+        reader = read_csv_cached if path.lower().endswith(".csv") else read_excel_cached
+        df = reader(path)
+        with self._lock:
+            self._frame_paths.add(path)
+        return df
+
+    def table_view(self, path: str, group_columns: tuple[str, ...] = ()) -> TableView:
+        """The shared TableView over ``frame(path)``, rebuilt only when the file changes."""
+        key = (path, group_columns)
+        version = file_version(path)
+        with self._lock:
+            entry = self._views.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        view = TableView(self.frame(path), group_columns)
+        with self._lock:
+            self._views[key] = (version, view)
+        return view
+
+    def trend_summaries(self, paths: list[str]) -> dict[str, TrendSummary]:
+        summaries = {}
+        with self._lock:
+            for path in paths:
+                summary = self._summaries.get(path)
+                if summary is not None and file_version(path) == (summary.size, summary.mtime_ns):
+                    summaries[path] = summary
+        missing = [path for path in paths if path not in summaries]
+        if missing:
+            loaded = get_trend_summaries(self.data_dir, missing)
+            with self._lock:
+                self._summaries.update(loaded)
+            summaries.update(loaded)
+        return summaries
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "version": self.version,
+                "frames": len(self._frame_paths),
+                "trend_summaries": len(self._summaries),
+                "table_views": len(self._views),
+            }
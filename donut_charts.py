@@ -0,0 +1,118 @@
+import html
+from functools import lru_cache
+
+import numpy as np
+
+from scoreboard import BULL_PCT_LABELS
+
+BULL_PCT_COLORS = ("#F04444", "#FFFFFF", "#FFFFFF", "#2ECC71")
+DONUT_RADIUS = 72.0
+DONUT_STROKE_WIDTH = 28.0
+DONUT_CELL_HEIGHT = 320
+GRID_TITLE_HEIGHT = 48
+
+
+def polar_to_cartesian(center_x: float, center_y: float, radius: float, angles_in_degrees: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    angles_in_radians = np.radians(np.asarray(angles_in_degrees, dtype=float) - 90.0)
+    return center_x + radius * np.cos(angles_in_radians), center_y + radius * np.sin(angles_in_radians)
+
+
+def describe_arcs(center_x: float, center_y: float, radius: float, start_angles: np.ndarray, end_angles: np.ndarray) -> list[str]:
+    """Return one closed SVG pie-slice path per (start, end) angle pair."""
+    start_xs, start_ys = polar_to_cartesian(center_x, center_y, radius, end_angles)
+    end_xs, end_ys = polar_to_cartesian(center_x, center_y, radius, start_angles)
+    large_arc_flags = np.where(np.asarray(end_angles) - np.asarray(start_angles) > 180, "1", "0")
+    return [
+        f"M {center_x} {center_y} "
+        f"L {start_x:.2f} {start_y:.2f} "
+        f"A {radius} {radius} 0 {large_arc_flag} 0 {end_x:.2f} {end_y:.2f} "
+        "Z"
+        for start_x, start_y, large_arc_flag, end_x, end_y in zip(start_xs, start_ys, large_arc_flags, end_xs, end_ys)
+    ]
+
+
+@lru_cache(maxsize=4096)
+def slice_paths(counts: tuple[int, ...], center_x: float = 90.0, center_y: float = 90.0, radius: float = DONUT_RADIUS) -> tuple[tuple[int, str], ...]:
+    """Return (segment index, path) for every non-empty segment of a pie.
+
+    A segment covering the whole circle is drawn as two half arcs, since a
+    single SVG arc cannot start and end on the same point.
+    """
+    count_array = np.asarray(counts, dtype=float)
+    total = count_array.sum()
+    if total <= 0:
+        return ()
+    sweep_angles = 360.0 * (count_array / total)
+    end_angles = np.cumsum(sweep_angles)
+    start_angles = np.concatenate(([0.0], end_angles[:-1]))
+    drawn = np.flatnonzero(count_array > 0)
+
+    segments = []
+    arc_starts = []
+    arc_ends = []
+    for index in drawn:
+        if sweep_angles[index] >= 359.99:
+            segments.extend([index, index])
+            arc_starts.extend([start_angles[index], start_angles[index] + 180.0])
+            arc_ends.extend([start_angles[index] + 180.0, start_angles[index] + 360.0])
+        else:
+            segments.append(index)
+            arc_starts.append(start_angles[index])
+            arc_ends.append(end_angles[index])
+    paths = describe_arcs(center_x, center_y, radius, np.array(arc_starts), np.array(arc_ends))
+    return tuple((int(segment), path) for segment, path in zip(segments, paths))
+
+
+@lru_cache(maxsize=4096)
+def bull_pct_donut_svg(counts: tuple[int, int, int, int]) -> str:
+    total = sum(counts)
+    svg_paths = "".join(
+        f'<path d="{path}" fill="{BULL_PCT_COLORS[segment]}" stroke="#666666" stroke-width="1.5" />'
+        for segment, path in slice_paths(counts)
+    )
+    legend_text = " | ".join(f"{label}: {count}" for label, count in zip(BULL_PCT_LABELS, counts))
+    return f'''
+    <div style="display:flex; justify-content:center; margin:0.35rem 0 0.75rem 0;">
+      <svg width="220" height="220" viewBox="0 0 180 180" role="img" aria-label="BULL_PCT donut chart">
+        <circle cx="90" cy="90" r="{DONUT_RADIUS}" fill="#FFFFFF" stroke="#D0D0D0" stroke-width="1" />
+        {svg_paths}
+        <circle cx="90" cy="90" r="{DONUT_RADIUS - DONUT_STROKE_WIDTH}" fill="#FFFFFF" stroke="#D0D0D0" stroke-width="1" />
+        <text x="90" y="86" text-anchor="middle" font-size="12" font-weight="700" fill="#111111">BULL_PCT</text>
+        <text x="90" y="104" text-anchor="middle" font-size="10" fill="#444444">{total} rows</text>
+      </svg>
+    </div>
+    <div style="text-align:center; font-size:0.8rem; color:#444444; margin-top:-0.35rem; margin-bottom:0.75rem;">
+      {legend_text}
+    </div>
+    '''
+
+
+def bull_pct_donut_grid_html(cells: list[tuple[str, tuple[int, int, int, int] | None, str | None]], columns: int = 4) -> tuple[str, int]:
+    """Build the whole donut grid as one HTML document and return it with its pixel height.
+
+    Each cell is (title, bucket counts, warning); cells with no counts show the
+    warning text in place of the donut.
+    """
+    cell_html = []
+    for title, counts, warning in cells:
+        if counts is not None and sum(counts) > 0:
+            body = bull_pct_donut_svg(counts)
+        elif warning:
+            body = (
+                '<div style="margin:0.5rem; padding:0.75rem 1rem; border-radius:0.5rem; '
+                f'background:#FFFBE6; color:#7A5B00; font-size:0.9rem;">{html.escape(warning)}</div>'
+            )
+        else:
+            body = ""
+        cell_html.append(
+            f'<div style="height:{DONUT_CELL_HEIGHT + GRID_TITLE_HEIGHT}px;">'
+            f'<div style="text-align:center; font-size:1.2rem; font-weight:700; margin-bottom:0.5rem; '
+            f'font-family:sans-serif;">{html.escape(title)}</div>'
+            f"{body}</div>"
+        )
+    rows = -(-len(cells) // columns)
+    document = (
+        f'<div style="display:grid; grid-template-columns:repeat({columns}, minmax(0, 1fr)); column-gap:1rem;">'
+        f'{"".join(cell_html)}</div>'
+    )
+    return document, rows * (DONUT_CELL_HEIGHT + GRID_TITLE_HEIGHT)
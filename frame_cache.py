@@ -0,0 +1,149 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable
+
+import pandas as pd
+
+from instrumentation import note
+from sidecars import read_with_sidecar
+
+DEFAULT_MEMORY_BUDGET_MB = 512
+
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    try:
+        return int(df.memory_usage(index=True, deep=True).sum())
+    except Exception:
+        return 0
+
+
+class FrameCache:
+    """Process-wide LRU of parsed DataFrames bounded by an approximate memory budget.
+
+    Entries are keyed on (path, size, mtime) plus the reader arguments, so a file
+    rewritten in place is re-parsed while unchanged files are never read twice.
+    Cached frames are shared between sessions and must be treated as read-only.
+    """
+
+    def __init__(self, memory_budget_bytes: int):
+        self.memory_budget_bytes = memory_budget_bytes
+        self._entries: OrderedDict[tuple, tuple[pd.DataFrame, int]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._pending: dict[tuple, Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> pd.DataFrame | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, df: pd.DataFrame) -> None:
+        nbytes = frame_nbytes(df)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+            # A single frame larger than the whole budget is returned but not kept.
+            if nbytes > self.memory_budget_bytes:
+                return
+            self._entries[key] = (df, nbytes)
+            self._total_bytes += nbytes
+            while self._total_bytes > self.memory_budget_bytes and self._entries:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_bytes
+
+    def contains(self, key: tuple) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def expect(self, key: tuple, future: Future) -> None:
+        """Register a parse in flight (the warm-up) so readers of ``key`` wait for it instead of parsing again."""
+        with self._lock:
+            self._pending[key] = future
+        future.add_done_callback(lambda _: self._forget(key, future))
+
+    def _forget(self, key: tuple, future: Future) -> None:
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def pending(self, key: tuple) -> Future | None:
+        with self._lock:
+            return self._pending.get(key)
+
+    def discard_path(self, path: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                _, nbytes = self._entries.pop(key)
+                self._total_bytes -= nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "budget_bytes": self.memory_budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+FRAME_CACHE = FrameCache(
+    int(os.environ.get("DASHBOARD_FRAME_CACHE_MB", DEFAULT_MEMORY_BUDGET_MB)) * 1024 * 1024
+)
+
+
+def file_cache_key(path: str, reader_name: str, **kwargs) -> tuple:
+    stat_result = os.stat(path)
+    return (
+        os.path.abspath(path),
+        stat_result.st_size,
+        stat_result.st_mtime_ns,
+        reader_name,
+        tuple(sorted(kwargs.items())),
+    )
+
+
+def load_frame(path: str, reader: Callable[..., pd.DataFrame], reader_name: str, **kwargs) -> pd.DataFrame:
+    started = time.perf_counter()
+    key = file_cache_key(path, reader_name, **kwargs)
+    df = FRAME_CACHE.get(key)
+    if df is not None:
+        note(f"read_{reader_name}", time.perf_counter() - started, hit=True)
+        return df
+    future = FRAME_CACHE.pending(key)
+    if future is not None:
+        try:
+            df = future.result()
+        except Exception:
+            df = None
+        if df is not None:
+            note(f"read_{reader_name}", time.perf_counter() - started, hit=True)
+            return df
+    df = reader(path, **kwargs)
+    FRAME_CACHE.put(key, df)
+    note(f"read_{reader_name}", time.perf_counter() - started, nbytes=key[1], hit=False)
+    return df
+
+
+def read_excel_cached(path: str, **kwargs) -> pd.DataFrame:
+    return load_frame(path, read_with_sidecar, "excel", **kwargs)
+
+
+def read_csv_cached(path: str, **kwargs) -> pd.DataFrame:
+    return load_frame(path, read_with_sidecar, "csv", **kwargs)
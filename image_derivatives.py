@@ -0,0 +1,196 @@
+import argparse
+import hashlib
+import io
+import os
+import threading
+import time
+
+from PIL import Image
+
+from asset_catalog import get_asset_catalog
+from instrumentation import note
+
+DERIVATIVE_DIR_NAME = ".derivatives"
+DERIVATIVE_FORMATS = ("png", "webp")
+# Streamlit caps images at twice its 730px content column, so a
+# use_container_width image never needs more pixels than this.
+CONTAINER_WIDTH = 1460
+# Every fixed width the dashboard displays charts at, plus the container width.
+DISPLAY_WIDTHS = (700, 800, 850, 1200, 1500, CONTAINER_WIDTH)
+WEBP_QUALITY = 90
+
+_hash_lock = threading.Lock()
+_content_hashes: dict[tuple[str, int, int], str] = {}
+_resolved_lock = threading.Lock()
+_resolved: dict[tuple, str] = {}
+
+
+def derivative_dir(data_dir: str) -> str:
+    return os.path.join(data_dir, DERIVATIVE_DIR_NAME)
+
+
+def content_hash(source_path: str, stat_result: os.stat_result | None = None) -> str:
+    """Return the sha256 of a file, hashing each (path, size, mtime) only once."""
+    if stat_result is None:
+        stat_result = os.stat(source_path)
+    key = (os.path.abspath(source_path), stat_result.st_size, stat_result.st_mtime_ns)
+    with _hash_lock:
+        cached = _content_hashes.get(key)
+    if cached is not None:
+        return cached
+    digest = hashlib.sha256()
+    with open(source_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    with _hash_lock:
+        _content_hashes[key] = digest.hexdigest()
+    return digest.hexdigest()
+
+
+def derivative_path(source_path: str, width: int, fmt: str = "png", stat_result: os.stat_result | None = None) -> str:
+    # Named by content rather than file name, so re-uploading identical bytes
+    # under a new date reuses the derivative and an edited file never does.
+    data_dir = os.path.dirname(source_path)
+    return os.path.join(derivative_dir(data_dir), f"{content_hash(source_path, stat_result)[:16]}_{width}.{fmt}")
+
+
+def encode_derivative(image: Image.Image, width: int, fmt: str) -> bytes:
+    if image.width > width:
+        height = max(1, round(image.height * width / image.width))
+        image = image.resize((width, height), resample=Image.LANCZOS)
+    buffer = io.BytesIO()
+    if fmt == "webp":
+        image.save(buffer, "WEBP", quality=WEBP_QUALITY, method=4)
+    else:
+        # Charts and tables use few colours, so a 256-colour palette is
+        # visually lossless and several times smaller than truecolour PNG.
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        method = Image.Quantize.FASTOCTREE if image.mode == "RGBA" else Image.Quantize.MEDIANCUT
+        image.quantize(256, method=method).save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def write_derivative(source_path: str, width: int, fmt: str = "png") -> str:
+    """Return the path to serve for ``source_path`` at ``width``, creating the derivative if needed.
+
+    Falls back to the source itself when it is already narrow enough and the
+    derivative would not be smaller.
+    """
+    stat_result = os.stat(source_path)
+    target = derivative_path(source_path, width, fmt, stat_result)
+    if os.path.exists(target):
+        return target
+    with Image.open(source_path) as image:
+        image.load()
+        source_width = image.width
+        data = encode_derivative(image, width, fmt)
+    if source_width <= width and fmt == "png" and len(data) >= stat_result.st_size:
+        return source_path
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    temp_target = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_target, "wb") as f:
+            f.write(data)
+        os.replace(temp_target, target)
+    finally:
+        if os.path.exists(temp_target):
+            os.remove(temp_target)
+    return target
+
+
+def ensure_derivative(source_path: str, width: int, fmt: str = "png") -> str:
+    """Like ``write_derivative`` but memoized per source version and never raising.
+
+    Any failure (unreadable image, read-only data directory) serves the original file.
+    """
+    try:
+        stat_result = os.stat(source_path)
+    except OSError:
+        return source_path
+    key = (os.path.abspath(source_path), stat_result.st_size, stat_result.st_mtime_ns, width, fmt)
+    with _resolved_lock:
+        cached = _resolved.get(key)
+    if cached is not None and os.path.exists(cached):
+        note("image_derivative", hit=True)
+        return cached
+    note("image_derivative", hit=False)
+    try:
+        resolved = write_derivative(source_path, width, fmt)
+    except Exception:
+        resolved = source_path
+    with _resolved_lock:
+        _resolved[key] = resolved
+    return resolved
+
+
+def prune_derivatives(data_dir: str, keep_hashes: set[str]) -> int:
+    removed = 0
+    directory = derivative_dir(data_dir)
+    if not os.path.isdir(directory):
+        return removed
+    for entry in os.scandir(directory):
+        if entry.name.split("_", 1)[0] not in keep_hashes:
+            try:
+                os.remove(entry.path)
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def build_derivatives(
+    data_dir: str,
+    widths: tuple[int, ...] = DISPLAY_WIDTHS,
+    fmt: str = "png",
+    prune: bool = True,
+) -> dict[str, int]:
+    """Pre-generate derivatives for the newest version of every PNG family."""
+    counts = {"written": 0, "fresh": 0, "original": 0, "failed": 0, "pruned": 0}
+    catalog = get_asset_catalog(data_dir)
+    keep_hashes: set[str] = set()
+    for family in catalog.families("", ".png"):
+        for version in catalog.versions(family, ".png"):
+            try:
+                keep_hashes.add(content_hash(version.path)[:16])
+            except OSError:
+                continue
+        latest_path = catalog.latest(family, ".png")
+        for width in widths:
+            try:
+                if os.path.exists(derivative_path(latest_path, width, fmt)):
+                    counts["fresh"] += 1
+                    continue
+                resolved = write_derivative(latest_path, width, fmt)
+            except Exception:
+                counts["failed"] += 1
+                continue
+            counts["original" if resolved == latest_path else "written"] += 1
+    if prune:
+        counts["pruned"] = prune_derivatives(data_dir, keep_hashes)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write resized chart derivatives for the newest version of every PNG.")
+    parser.add_argument(
+        "data_dir",
+        nargs="?",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads"),
+    )
+    parser.add_argument("--widths", type=int, nargs="+", default=list(DISPLAY_WIDTHS))
+    parser.add_argument("--format", choices=DERIVATIVE_FORMATS, default="png")
+    parser.add_argument("--no-prune", action="store_true", help="Keep derivatives whose source file is gone or changed.")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = build_derivatives(args.data_dir, tuple(args.widths), args.format, prune=not args.no_prune)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{counts['written']} written, {counts['fresh']} fresh, {counts['original']} served as-is, "
+        f"{counts['failed']} failed, {counts['pruned']} pruned in {elapsed:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import argparse
+import os
+import re
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from blob_store import BLOB_DIR_NAME, blob_hash
+from image_derivatives import DERIVATIVE_DIR_NAME
+
+DEFAULT_PORT = 8502
+# Loopback only: the server sits outside the dashboard's password gate, so
+# exposing it (or fronting it with a proxy) must be a deliberate choice.
+DEFAULT_HOST = "127.0.0.1"
+# Every served name embeds its content hash, so a URL's bytes never change.
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+ROUTES = {
+    "derivatives": (DERIVATIVE_DIR_NAME, re.compile(r"[0-9a-f]{16}_\d+\.(png|webp)")),
+    "blobs": (BLOB_DIR_NAME, re.compile(r"[0-9a-f]{64}\.png")),
+}
+CONTENT_TYPES = {".png": "image/png", ".webp": "image/webp"}
+
+
+def image_url_path(served_path: str) -> str | None:
+    """The server path for a file ``show_image`` serves, or None if its name is not content-addressed."""
+    directory, name = os.path.split(served_path)
+    if os.path.basename(directory) == DERIVATIVE_DIR_NAME and ROUTES["derivatives"][1].fullmatch(name):
+        return f"/derivatives/{name}"
+    try:
+        inode = os.stat(served_path).st_ino
+    except OSError:
+        return None
+    digest = blob_hash(served_path, inode)
+    return f"/blobs/{digest}{os.path.splitext(name)[1].lower()}" if digest else None
+
+
+class ImageRequestHandler(BaseHTTPRequestHandler):
+    data_dir = ""
+
+    def do_GET(self) -> None:
+        self.serve(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self.serve(send_body=False)
+
+    def serve(self, send_body: bool) -> None:
+        parts = self.path.split("?", 1)[0].strip("/").split("/")
+        route = ROUTES.get(parts[0]) if len(parts) == 2 else None
+        if route is None or not route[1].fullmatch(parts[1]):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        name = parts[1]
+        etag = f'"{os.path.splitext(name)[0]}"'
+        if etag in (tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", CACHE_CONTROL)
+            self.end_headers()
+            return
+        try:
+            with open(os.path.join(self.data_dir, route[0], name), "rb") as f:
+                data = f.read()
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", CONTENT_TYPES[os.path.splitext(name)[1]])
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", CACHE_CONTROL)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def make_image_server(data_dir: str, host: str, port: int) -> ThreadingHTTPServer:
+    handler = type("BoundImageRequestHandler", (ImageRequestHandler,), {"data_dir": data_dir})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+_server_lock = threading.Lock()
+_servers: dict[str, ThreadingHTTPServer | None] = {}
+
+
+def start_image_server(data_dir: str, port: int = DEFAULT_PORT, host: str = DEFAULT_HOST) -> bool:
+    """Serve ``data_dir``'s derivatives and blobs on a daemon thread, once per process; return whether it runs."""
+    with _server_lock:
+        if data_dir not in _servers:
+            try:
+                server = make_image_server(data_dir, host, port)
+            except OSError:
+                # Port taken (another dashboard process, or a standalone server).
+                server = None
+            else:
+                threading.Thread(target=server.serve_forever, name="image-server", daemon=True).start()
+            _servers[data_dir] = server
+        return _servers[data_dir] is not None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve chart derivatives and image blobs with immutable caching headers.")
+    parser.add_argument(
+        "data_dir",
+        nargs="?",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads"),
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Interface to listen on (default {DEFAULT_HOST}).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    print(f"Serving {args.data_dir} images on http://{args.host}:{args.port}")
+    make_image_server(args.data_dir, args.host, args.port).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
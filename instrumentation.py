@@ -0,0 +1,97 @@
+import functools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+SETUP_SECTION = "(setup)"
+
+
+class RunProfile:
+    """Counters for one script run, grouped by section (tab) and category."""
+
+    def __init__(self):
+        self.section = SETUP_SECTION
+        self.sections: dict[str, dict[str, dict[str, float]]] = {}
+
+    def add(self, category: str, seconds: float = 0.0, nbytes: int = 0, hit: bool | None = None) -> None:
+        stats = self.sections.setdefault(self.section, {}).setdefault(
+            category,
+            {"calls": 0, "seconds": 0.0, "bytes": 0, "hits": 0, "misses": 0},
+        )
+        stats["calls"] += 1
+        stats["seconds"] += seconds
+        stats["bytes"] += nbytes
+        if hit is True:
+            stats["hits"] += 1
+        elif hit is False:
+            stats["misses"] += 1
+
+
+_active_profile: ContextVar[RunProfile | None] = ContextVar("active_profile", default=None)
+
+
+def start_profile() -> RunProfile:
+    # Each Streamlit script run executes in its own thread context, so
+    # concurrent sessions never record into each other's profile.
+    profile = RunProfile()
+    _active_profile.set(profile)
+    return profile
+
+
+def stop_profile() -> None:
+    _active_profile.set(None)
+
+
+def note(category: str, seconds: float = 0.0, nbytes: int = 0, hit: bool | None = None) -> None:
+    """Record one event on the active profile; a no-op when profiling is off."""
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.add(category, seconds, nbytes, hit)
+
+
+@contextmanager
+def measure(category: str):
+    if _active_profile.get() is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        note(category, time.perf_counter() - started)
+
+
+def timed(category: str):
+    """Decorator that records the wall time of every call under ``category``."""
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _active_profile.get() is None:
+                return function(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                note(category, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def section(label: str):
+    """Attribute everything recorded inside the block to ``label`` and time it as "total"."""
+    profile = _active_profile.get()
+    if profile is None:
+        yield
+        return
+    previous = profile.section
+    profile.section = label
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add("total", time.perf_counter() - started)
+        profile.section = previous
@@ -0,0 +1,76 @@
+import argparse
+import os
+
+from asset_catalog import AssetCatalog, PageRun, get_asset_catalog
+
+# (prefix, extension, suffix) of every multi-page chart set the tabs show.
+PAGE_RUN_SETS = (
+    ("fed_rates_spy_page_", ".png", "_graph"),
+    ("mercury_retrograde_spy_page_", ".png", "_graph"),
+    ("spy_daily_data_page_", ".png", "_graph"),
+)
+ARCHIVE_DIR_NAME = ".archive"
+
+
+def superseded_runs(catalog: AssetCatalog, keep: int = 1) -> list[PageRun]:
+    """Runs older than the ``keep`` newest complete runs of each chart set.
+
+    Incomplete runs newer than those are left alone: they may still be uploading.
+    """
+    superseded = []
+    for prefix, extension, suffix in PAGE_RUN_SETS:
+        runs = catalog.page_runs(prefix, extension, suffix)
+        complete_runs = [run for run in runs if run.complete]
+        if len(complete_runs) < keep:
+            continue
+        cutoff = runs.index(complete_runs[-keep])
+        superseded.extend(runs[:cutoff])
+    return superseded
+
+
+def archive_superseded_runs(data_dir: str, keep: int = 1, delete: bool = False, dry_run: bool = False) -> dict[str, int]:
+    """Move (or delete) the pages of superseded runs out of the data directory.
+
+    Archived pages land in ``.archive/<run date>/``, which the asset catalog
+    never scans, so page counts and scan time stay bounded.
+    """
+    counts = {"runs": 0, "pages": 0, "failed": 0}
+    for run in superseded_runs(get_asset_catalog(data_dir), keep):
+        counts["runs"] += 1
+        archive_dir = os.path.join(data_dir, ARCHIVE_DIR_NAME, run.run_date.isoformat() if run.run_date else "undated")
+        for page in run.pages:
+            if dry_run:
+                counts["pages"] += 1
+                continue
+            try:
+                if delete:
+                    os.remove(page.path)
+                else:
+                    os.makedirs(archive_dir, exist_ok=True)
+                    os.replace(page.path, os.path.join(archive_dir, page.name))
+            except OSError:
+                counts["failed"] += 1
+                continue
+            counts["pages"] += 1
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Archive the pages of superseded Fed, Mercury and 20/50 MA chart runs.")
+    parser.add_argument(
+        "data_dir",
+        nargs="?",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads"),
+    )
+    parser.add_argument("--keep", type=int, default=1, help="Complete runs to keep per chart set (default 1).")
+    parser.add_argument("--delete", action="store_true", help=f"Delete superseded pages instead of moving them to {ARCHIVE_DIR_NAME}/.")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be archived.")
+    args = parser.parse_args()
+
+    counts = archive_superseded_runs(args.data_dir, max(1, args.keep), args.delete, args.dry_run)
+    action = "would be archived" if args.dry_run else ("deleted" if args.delete else "archived")
+    print(f"{counts['pages']} pages of {counts['runs']} superseded runs {action}, {counts['failed']} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import atexit
+import os
+import threading
+from dataclasses import asdict, dataclass
+
+import pandas as pd
+
+from asset_catalog import cache_path
+from instrumentation import note
+
+VALIDATION_FILE_NAME = "png_validation.parquet"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+@dataclass(frozen=True)
+class PngCheck:
+    path: str
+    inode: int
+    size: int
+    mtime_ns: int
+    valid: bool
+
+
+def read_png_signature(file_path: str) -> bool:
+    try:
+        if os.path.getsize(file_path) <= len(PNG_SIGNATURE):
+            return False
+        with open(file_path, "rb") as image_file:
+            return image_file.read(len(PNG_SIGNATURE)) == PNG_SIGNATURE
+    except OSError:
+        return False
+
+
+def validation_path(data_dir: str) -> str:
+    return cache_path(data_dir, VALIDATION_FILE_NAME)
+
+
+def read_validations(data_dir: str) -> dict[str, PngCheck]:
+    try:
+        table = pd.read_parquet(validation_path(data_dir))
+        checks = {}
+        for record in table.to_dict("records"):
+            check = PngCheck(**record)
+            checks[check.path] = check
+    except Exception:
+        # Missing, unreadable or written by an older schema: re-check lazily.
+        return {}
+    return checks
+
+
+def write_validations(data_dir: str, checks: dict[str, PngCheck]) -> None:
+    table = pd.DataFrame([asdict(check) for check in checks.values()])
+    target = validation_path(data_dir)
+    temp_target = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        table.to_parquet(temp_target, index=False)
+        os.replace(temp_target, target)
+    except Exception:
+        # A read-only data directory only loses persistence across restarts.
+        if os.path.exists(temp_target):
+            os.remove(temp_target)
+
+
+FLUSH_DELAY_SECONDS = 2.0
+
+_validation_lock = threading.Lock()
+_write_lock = threading.Lock()
+_validations: dict[str, dict[str, PngCheck]] = {}
+_dirty: set[str] = set()
+_flush_timers: dict[str, threading.Timer] = {}
+
+
+def flush_validations(data_dir: str) -> None:
+    """Persist the checks recorded since the last flush, dropping files that no longer exist."""
+    # One writer at a time, each snapshotting under the lock, so a slow write never lands after a newer one.
+    with _write_lock:
+        with _validation_lock:
+            _flush_timers.pop(data_dir, None)
+            dirty = data_dir in _dirty
+            _dirty.discard(data_dir)
+            checks = dict(_validations.get(data_dir, {}))
+        live_checks = {path: check for path, check in checks.items() if os.path.exists(path)}
+        if not dirty and len(live_checks) == len(checks):
+            return
+        with _validation_lock:
+            current = _validations.get(data_dir, {})
+            for path in checks.keys() - live_checks.keys():
+                if current.get(path) is checks[path]:
+                    del current[path]
+        write_validations(data_dir, live_checks)
+
+
+def schedule_flush(data_dir: str) -> None:
+    """Persist a burst of misses (a cold start checks every PNG) in one write once it settles."""
+    with _validation_lock:
+        if data_dir in _flush_timers:
+            return
+        timer = threading.Timer(FLUSH_DELAY_SECONDS, flush_validations, args=(data_dir,))
+        timer.daemon = True
+        _flush_timers[data_dir] = timer
+    timer.start()
+
+
+def flush_all_validations() -> None:
+    """Cancel the pending debounce timers and write what they would have written."""
+    with _validation_lock:
+        timers = list(_flush_timers.values())
+        data_dirs = set(_dirty)
+    for timer in timers:
+        timer.cancel()
+    for data_dir in data_dirs:
+        flush_validations(data_dir)
+
+
+atexit.register(flush_all_validations)
+
+
+def check_png(file_path: str, inode: int, size: int, mtime_ns: int) -> bool:
+    """Return whether ``file_path`` is a PNG, reopening it only when its identity changed."""
+    data_dir = os.path.dirname(file_path)
+    with _validation_lock:
+        if data_dir not in _validations:
+            _validations[data_dir] = read_validations(data_dir)
+        checks = _validations[data_dir]
+        check = checks.get(file_path)
+    if check is not None and (check.inode, check.size, check.mtime_ns) == (inode, size, mtime_ns):
+        note("png_validation", hit=True)
+        return check.valid
+    note("png_validation", hit=False)
+
+    check = PngCheck(file_path, inode, size, mtime_ns, read_png_signature(file_path))
+    with _validation_lock:
+        checks[file_path] = check
+        _dirty.add(data_dir)
+    schedule_flush(data_dir)
+    return check.valid
+
+
+def is_valid_png(file_path: str, stat_result: os.stat_result | None = None) -> bool:
+    if stat_result is None:
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return False
+    return check_png(file_path, stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
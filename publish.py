@@ -0,0 +1,324 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from functools import partial
+
+from asset_catalog import DATABASE_SUFFIXES, is_asset_name
+from blob_store import BLOB_EXTENSIONS, blob_dir, blob_matches, existing_blob, link_into_place, store_blob
+from sidecars import SIDECAR_SOURCE_EXTENSIONS, fresh_sidecar_path, prune_sidecars, read_source, sidecar_dir, sidecar_name, write_sidecar_frame
+
+MANIFEST_FILE_NAME = ".run_manifest.json"
+READY_FILE_NAME = ".ready"
+DEFAULT_KEEP_RUNS = 3
+DEFAULT_POLL_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class StagedFile:
+    name: str
+    size: int
+    sha256: str
+    rows: int | None = None
+    error: str | None = None
+
+
+def runs_dir(data_dir: str) -> str:
+    return os.path.abspath(data_dir) + ".runs"
+
+
+def state_dir(data_dir: str) -> str:
+    return os.path.abspath(data_dir) + ".state"
+
+
+def staging_dir(data_dir: str) -> str:
+    return os.path.abspath(data_dir) + ".staging"
+
+
+def validate_file(path: str, blob_root: str = "", sidecar_root: str = "") -> StagedFile:
+    """Worker: hash one staged file and check that it parses completely.
+
+    An image whose blob is already in ``blob_root`` was validated when it
+    was first published, so only its hash is computed. A parsed xlsx/csv is
+    also written to ``sidecar_root`` as its Parquet sidecar.
+    """
+    name = os.path.basename(path)
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    rows = None
+    error = None
+    try:
+        if name.lower().endswith(SIDECAR_SOURCE_EXTENSIONS):
+            df = read_source(path)
+            rows = len(df)
+            if sidecar_root:
+                write_sidecar_frame(df, os.path.join(sidecar_root, sidecar_name(name, os.stat(path))))
+        elif name.lower().endswith(".png") and not blob_matches(os.path.join(blob_root, f"{digest.hexdigest()}.png"), digest.hexdigest()):
+            from PIL import Image
+
+            # verify() walks every chunk and its CRC, so a truncated upload fails.
+            with Image.open(path) as image:
+                image.verify()
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    return StagedFile(name, size, digest.hexdigest(), rows, error)
+
+
+def validate_batch(batch_dir: str, workers: int | None = None, blob_root: str = "", sidecar_root: str = "") -> list[StagedFile]:
+    names = sorted(name for name in os.listdir(batch_dir) if name != READY_FILE_NAME)
+    invalid = [
+        StagedFile(name, 0, "", error="not a publishable file name")
+        for name in names
+        if not is_asset_name(name) or not os.path.isfile(os.path.join(batch_dir, name))
+    ]
+    paths = [os.path.join(batch_dir, name) for name in names if os.path.isfile(os.path.join(batch_dir, name)) and is_asset_name(name)]
+    workers = workers or os.cpu_count() or 1
+    validate = partial(validate_file, blob_root=blob_root, sidecar_root=sidecar_root)
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(min(workers, len(paths))) as executor:
+            files = list(executor.map(validate, paths, chunksize=4))
+    else:
+        files = [validate(path) for path in paths]
+    return sorted(files + invalid, key=lambda staged: staged.name)
+
+
+def new_run_id(files: list[StagedFile]) -> str:
+    digest = hashlib.sha256("".join(f"{staged.name}:{staged.sha256}" for staged in files).encode("utf-8"))
+    return f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-{digest.hexdigest()[:8]}"
+
+
+def unique_path(path: str) -> str:
+    """``path``, or ``path-2``, ``path-3``... when it is taken (a retry within the same second)."""
+    candidate = path
+    counter = 1
+    while os.path.lexists(candidate):
+        counter += 1
+        candidate = f"{path}-{counter}"
+    return candidate
+
+
+def read_manifest(run_dir: str) -> dict | None:
+    try:
+        with open(os.path.join(run_dir, MANIFEST_FILE_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def link_tree(source: str, target: str, skip: set[str]) -> None:
+    """Recreate ``source`` under ``target`` with hard links (symlinks are copied as links)."""
+    os.makedirs(target, exist_ok=True)
+    for entry in os.scandir(source):
+        if entry.name in skip:
+            continue
+        destination = os.path.join(target, entry.name)
+        if entry.is_symlink():
+            os.symlink(os.readlink(entry.path), destination)
+        elif entry.is_dir():
+            link_tree(entry.path, destination, set())
+        else:
+            os.link(entry.path, destination)
+
+
+def swap_symlink(link_path: str, target: str) -> None:
+    temporary = f"{link_path}.{os.getpid()}.tmp"
+    os.symlink(target, temporary)
+    # rename(2) over the old link is atomic: readers see the old run or the new one, never neither.
+    os.replace(temporary, link_path)
+
+
+def move_databases(run_dir: str, state: str) -> None:
+    """Move databases created inside a run to the shared state directory, leaving symlinks behind.
+
+    Each file is hard-linked into ``state`` before the run's name turns into a
+    symlink, so a connection opened at any moment finds the same database
+    and journal files.
+    """
+    os.makedirs(state, exist_ok=True)
+    names = [
+        entry.name
+        for entry in os.scandir(run_dir)
+        if entry.name.endswith(DATABASE_SUFFIXES) and not entry.is_symlink()
+    ]
+    for name in names:
+        if not os.path.exists(os.path.join(state, name)):
+            os.link(os.path.join(run_dir, name), os.path.join(state, name))
+    for name in names:
+        if name.endswith(".sqlite3"):
+            # SQLite resolves the link, so -wal/-shm are opened next to the real file.
+            swap_symlink(os.path.join(run_dir, name), os.path.join(state, name))
+    for name in names:
+        if not name.endswith(".sqlite3"):
+            os.remove(os.path.join(run_dir, name))
+
+
+def adopt_data_dir(data_dir: str) -> str:
+    """Turn a plain data directory into a symlink to its first run; return the active run directory.
+
+    Databases move to the ``.state`` directory and each run links to them, so
+    the trade ledger and trend history survive every publish. Run this first
+    conversion while the dashboard is stopped: renaming the directory it has
+    open is the one step that is not atomic for readers.
+    """
+    data_dir = os.path.abspath(data_dir)
+    if os.path.islink(data_dir):
+        return os.path.realpath(data_dir)
+    os.makedirs(runs_dir(data_dir), exist_ok=True)
+    move_databases(data_dir, state_dir(data_dir))
+    run_dir = os.path.join(runs_dir(data_dir), f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-initial")
+    os.rename(data_dir, run_dir)
+    os.symlink(run_dir, data_dir)
+    return run_dir
+
+
+def prune_runs(data_dir: str, keep: int) -> int:
+    """Delete all but the ``keep`` newest runs (never the active one)."""
+    active = os.path.realpath(data_dir)
+    runs = sorted(entry.path for entry in os.scandir(runs_dir(data_dir)) if entry.is_dir())
+    pruned = 0
+    for run_dir in runs[:-keep] if keep > 0 else []:
+        if os.path.realpath(run_dir) != active:
+            shutil.rmtree(run_dir, ignore_errors=True)
+            pruned += 1
+    return pruned
+
+
+def install_sidecars(sidecar_root: str, run_dir: str) -> None:
+    """Move the sidecars written during validation into the run, dropping those of replaced sources."""
+    target_dir = sidecar_dir(run_dir)
+    for name in os.listdir(sidecar_root):
+        os.makedirs(target_dir, exist_ok=True)
+        # copy2 kept each source's size and mtime, so the sidecar names still match.
+        shutil.move(os.path.join(sidecar_root, name), os.path.join(target_dir, name))
+    sources = [entry.path for entry in os.scandir(run_dir) if entry.name.lower().endswith(SIDECAR_SOURCE_EXTENSIONS)]
+    prune_sidecars(run_dir, {fresh_sidecar_path(path) for path in sources} - {None})
+
+
+def publish_batch(data_dir: str, batch_dir: str, workers: int | None = None, keep_runs: int = DEFAULT_KEEP_RUNS) -> dict:
+    """Validate a staged batch and publish it as the new active run in one symlink swap.
+
+    The new run starts as hard links to every file of the active run, then
+    takes the batch files (replacing same-named ones; images go through the
+    blob store, so known bytes are linked rather than copied), the Parquet
+    sidecars parsed during validation and a manifest. Only then does the
+    data directory symlink move, so readers never see a partial batch.
+    Raises ValueError without publishing if any file fails validation; a
+    run that fails halfway is removed.
+    """
+    sidecar_root = tempfile.mkdtemp(prefix=".sidecars-", dir=os.path.dirname(os.path.abspath(data_dir)))
+    try:
+        files = validate_batch(batch_dir, workers, blob_dir(data_dir), sidecar_root)
+        failed = [staged for staged in files if staged.error]
+        if failed:
+            raise ValueError("; ".join(f"{staged.name}: {staged.error}" for staged in failed))
+        if not files:
+            raise ValueError(f"{batch_dir} has no files to publish")
+
+        active_dir = adopt_data_dir(data_dir)
+        # A database first opened after the last publish lives in the run itself.
+        move_databases(active_dir, state_dir(data_dir))
+        run_dir = unique_path(os.path.join(runs_dir(data_dir), new_run_id(files)))
+        run_id = os.path.basename(run_dir)
+        staging_run_dir = f"{run_dir}.partial"
+        shutil.rmtree(staging_run_dir, ignore_errors=True)
+        try:
+            manifest = build_run(active_dir, staging_run_dir, batch_dir, files, sidecar_root, run_id)
+            os.rename(staging_run_dir, run_dir)
+        except BaseException:
+            shutil.rmtree(staging_run_dir, ignore_errors=True)
+            raise
+        swap_symlink(os.path.abspath(data_dir), run_dir)
+        prune_runs(data_dir, keep_runs)
+        return manifest
+    finally:
+        shutil.rmtree(sidecar_root, ignore_errors=True)
+
+
+def build_run(active_dir: str, staging_run_dir: str, batch_dir: str, files: list[StagedFile], sidecar_root: str, run_id: str) -> dict:
+    """Assemble the next run in ``staging_run_dir``: the active run's files, the batch, its sidecars and the manifest."""
+    names = {staged.name for staged in files}
+    link_tree(active_dir, staging_run_dir, skip=names | {MANIFEST_FILE_NAME})
+    for staged in files:
+        destination = os.path.join(staging_run_dir, staged.name)
+        extension = os.path.splitext(staged.name)[1].lower()
+        blob = existing_blob(staging_run_dir, staged.sha256, extension) if extension in BLOB_EXTENSIONS else None
+        if extension not in BLOB_EXTENSIONS:
+            shutil.copy2(os.path.join(batch_dir, staged.name), destination)
+        elif blob is not None:
+            # Known bytes: link the existing blob instead of copying the upload.
+            link_into_place(blob, destination)
+        else:
+            shutil.copy2(os.path.join(batch_dir, staged.name), destination)
+            store_blob(destination, staged.sha256)
+    install_sidecars(sidecar_root, staging_run_dir)
+    previous = read_manifest(active_dir)
+    manifest = {
+        "run_id": run_id,
+        "published_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "previous_run_id": previous["run_id"] if previous else None,
+        "files": [asdict(staged) for staged in files if not staged.error],
+    }
+    with open(os.path.join(staging_run_dir, MANIFEST_FILE_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def watch_staging(data_dir: str, workers: int | None = None, keep_runs: int = DEFAULT_KEEP_RUNS, poll_seconds: float = DEFAULT_POLL_SECONDS) -> None:
+    """Publish every ``<data_dir>.staging/<batch>/`` once the producer drops a ``.ready`` file into it."""
+    root = staging_dir(data_dir)
+    os.makedirs(root, exist_ok=True)
+    while True:
+        for entry in sorted(os.scandir(root), key=lambda entry: entry.name):
+            if not entry.is_dir() or ".rejected" in entry.name:
+                continue
+            if not os.path.exists(os.path.join(entry.path, READY_FILE_NAME)):
+                continue
+            try:
+                manifest = publish_batch(data_dir, entry.path, workers, keep_runs)
+            except Exception as exc:
+                os.rename(entry.path, unique_path(f"{entry.path}.rejected"))
+                print(f"{entry.name} rejected: {exc}", flush=True)
+                continue
+            shutil.rmtree(entry.path, ignore_errors=True)
+            print(f"{entry.name} published as run {manifest['run_id']} ({len(manifest['files'])} files)", flush=True)
+        time.sleep(poll_seconds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Validate a batch of uploads and publish it atomically as a new data run.")
+    parser.add_argument(
+        "data_dir",
+        nargs="?",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads"),
+    )
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--batch", metavar="DIR", help="Publish the files in DIR.")
+    action.add_argument("--watch", action="store_true", help="Publish batches from <data_dir>.staging/ as they become ready.")
+    parser.add_argument("--workers", type=int, default=0, help="Validation processes (default: the CPU count).")
+    parser.add_argument("--keep-runs", type=int, default=DEFAULT_KEEP_RUNS, help=f"Runs to keep for rollback (default {DEFAULT_KEEP_RUNS}).")
+    args = parser.parse_args()
+
+    if args.watch:
+        watch_staging(args.data_dir, args.workers or None, args.keep_runs)
+        return
+    started = time.perf_counter()
+    try:
+        manifest = publish_batch(args.data_dir, args.batch, args.workers or None, args.keep_runs)
+    except ValueError as exc:
+        raise SystemExit(f"Not published: {exc}")
+    elapsed = time.perf_counter() - started
+    print(f"Run {manifest['run_id']} published with {len(manifest['files'])} files in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+from asset_catalog import DATE_TOKEN_FORMATS, DATE_TOKEN_PATTERN, is_asset_name, parse_date_token
+from synthetic_uploads import generate_uploads
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(SCRIPT_DIR, "website_test.py")
+
+
+def shift_date_token(date_token: str, trading_days_back: int) -> str:
+    day = parse_date_token(date_token)
+    # Written back in the token's own format, so the catalog parses the copy the same way.
+    date_format = next((date_format for date_format in DATE_TOKEN_FORMATS if day and day.strftime(date_format) == date_token), None)
+    if date_format is None:
+        return date_token
+    while trading_days_back > 0:
+        day -= timedelta(days=1)
+        if day.weekday() < 5:
+            trading_days_back -= 1
+    return day.strftime(date_format)
+
+
+def replicate_snapshot(source_dir: str, target_dir: str, dates: int) -> int:
+    """Copy every dated file of ``source_dir`` back over ``dates`` trading days; return the file count.
+
+    Older copies get older mtimes, the way a directory that has accumulated
+    daily drops looks.
+    """
+    os.makedirs(target_dir, exist_ok=True)
+    written = 0
+    now = time.time()
+    for entry in os.scandir(source_dir):
+        if not is_asset_name(entry.name) or not entry.is_file():
+            continue
+        stem, extension = os.path.splitext(entry.name)
+        matches = list(DATE_TOKEN_PATTERN.finditer(stem))
+        if not matches:
+            shutil.copyfile(entry.path, os.path.join(target_dir, entry.name))
+            written += 1
+            continue
+        match = matches[-1]
+        for days_back in range(dates):
+            token = shift_date_token(match.group(1), days_back)
+            file_name = f"{stem[:match.start(1)]}{token}{stem[match.end(1):]}{extension}"
+            target = os.path.join(target_dir, file_name)
+            shutil.copyfile(entry.path, target)
+            mtime = now - days_back * 86400
+            os.utime(target, (mtime, mtime))
+            written += 1
+    return written
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is kilobytes on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def timed_run(app) -> float:
+    started = time.perf_counter()
+    app.run()
+    elapsed = time.perf_counter() - started
+    if app.exception:
+        raise RuntimeError(f"Script raised: {app.exception[0].message}")
+    return elapsed
+
+
+def measure_tree(data_dir: str, timeout: float) -> dict:
+    """Drive the dashboard against ``data_dir`` in this process and return its timings."""
+    os.environ["DASHBOARD_DATA_DIR"] = data_dir
+    # The watcher and warm-up threads only add noise to a one-shot measurement:
+    # a warm-up racing the first runs would make "cold" timings depend on how
+    # far it got.
+    os.environ["DASHBOARD_WATCH_DATA_DIR"] = "0"
+    os.environ["DASHBOARD_WARMUP"] = "0"
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    app.session_state["password_correct"] = True
+    result = {"cold_start_s": timed_run(app)}
+    result["cold_start_rss_mb"] = peak_rss_mb()
+    result["warm_rerun_s"] = timed_run(app)
+
+    # Only the default "Mindset" tab is open so far, so every tab present is a main tab.
+    main_labels = [tab.label for tab in app.tabs]
+    tabs = {}
+    for label in main_labels:
+        app.session_state["main_tabs"] = label
+        cold = timed_run(app)
+        warm = timed_run(app)
+        tabs[label] = {"cold_s": cold, "warm_s": warm}
+    result["tabs"] = tabs
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def run_child(data_dir: str, timeout: float) -> dict:
+    # Each tree is measured in a fresh interpreter so cold start, module-level
+    # caches and peak RSS are not inherited from the previous tree.
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", data_dir, "--timeout", str(timeout)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def print_report(results: list[dict]) -> None:
+    for result in results:
+        print(
+            f"\n{result['label']}: {result['files']} files | cold {result['cold_start_s']:.2f}s | "
+            f"warm {result['warm_rerun_s']:.2f}s | peak RSS {result['peak_rss_mb']:.0f} MB"
+        )
+        for label, timing in result["tabs"].items():
+            print(f"  {label:40s} cold {timing['cold_s']:6.2f}s  warm {timing['warm_s']:6.2f}s")
+
+
+def find_regressions(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    baseline_by_label = {result["label"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        previous = baseline_by_label.get(result["label"])
+        if previous is None:
+            continue
+        checks = [("cold start", result["cold_start_s"], previous["cold_start_s"])]
+        checks.append(("warm rerun", result["warm_rerun_s"], previous["warm_rerun_s"]))
+        for label, timing in result["tabs"].items():
+            if label in previous["tabs"]:
+                checks.append((f"{label} warm", timing["warm_s"], previous["tabs"][label]["warm_s"]))
+        checks.append(("peak RSS", result["peak_rss_mb"], previous["peak_rss_mb"]))
+        for name, current, before in checks:
+            # Sub-100ms timings are dominated by noise; only flag real slowdowns.
+            if current > before * (1 + tolerance) and current - before > 0.1:
+                regressions.append(f"{result['label']} {name}: {before:.2f} -> {current:.2f}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time cold, warm and per-tab reruns of the dashboard over upload trees of growing size.")
+    parser.add_argument("--source", default=os.path.join(SCRIPT_DIR, "uploads"), help="Snapshot replicated into each tree.")
+    parser.add_argument("--dates", type=int, nargs="+", default=[1, 5, 10], help="Trading days of history per tree.")
+    parser.add_argument("--synthetic", action="store_true", help="Generate trees with synthetic_uploads instead of replicating --source.")
+    parser.add_argument("--tickers", type=int, default=400, help="Synthetic trees only.")
+    parser.add_argument("--industries", type=int, default=76, help="Synthetic trees only.")
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--json", help="Write the results to this file.")
+    parser.add_argument("--baseline", help="Compare against a previous --json file and exit 1 on regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown against the baseline.")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_tree(args.child, args.timeout)))
+        return
+
+    results = []
+    for dates in args.dates:
+        with tempfile.TemporaryDirectory(prefix="dashboard-bench-") as work_dir:
+            data_dir = os.path.join(work_dir, "uploads")
+            if args.synthetic:
+                files = generate_uploads(data_dir, tickers=args.tickers, industries=args.industries, dates=dates)
+                label = f"{args.tickers}t/{args.industries}i/{dates}d"
+            else:
+                files = replicate_snapshot(args.source, data_dir, dates)
+                label = f"{dates}d"
+            result = run_child(data_dir, args.timeout)
+        result.update({"label": label, "files": files})
+        results.append(result)
+        print(f"{result['label']}: measured {files} files", file=sys.stderr)
+
+    print_report(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
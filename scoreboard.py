@@ -0,0 +1,230 @@
+import argparse
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+import pandas as pd
+
+from asset_catalog import cache_path
+from frame_cache import read_excel_cached
+from instrumentation import note
+
+SCOREBOARD_FILE_NAME = "trend_scoreboard.parquet"
+SUMMARY_FAMILY_PREFIX = "CURRENT_TREND_SUMMARY"
+MISSING_SCORE = -10**9
+TREND_TIMEFRAMES = ("DAILY", "WEEKLY", "MONTHLY")
+BULL_PCT_LABELS = ("0", "33.33", "66.67", "100")
+
+
+@dataclass(frozen=True)
+class TrendSummary:
+    path: str
+    size: int
+    mtime_ns: int
+    readable: bool
+    rows: int
+    # Numeric BULL_PCT values, or -1 when the column is missing.
+    bull_pct_rows: int
+    # BULL_PCT bucket counts for 0 / 33.33 / 66.67 / 100, or -1 when the column is missing.
+    bull_pct_0: int
+    bull_pct_33: int
+    bull_pct_67: int
+    bull_pct_100: int
+    # BULL/BEAR counts per timeframe, or -1 when the *_CURRENT_TREND column is missing.
+    daily_bull: int
+    daily_bear: int
+    weekly_bull: int
+    weekly_bear: int
+    monthly_bull: int
+    monthly_bear: int
+
+    @property
+    def bull_pct_counts(self) -> list[int] | None:
+        if self.bull_pct_0 < 0:
+            return None
+        return [self.bull_pct_0, self.bull_pct_33, self.bull_pct_67, self.bull_pct_100]
+
+    @property
+    def score(self) -> int:
+        if not self.readable or self.bull_pct_rows <= 0:
+            return MISSING_SCORE
+        return self.bull_pct_100 - self.bull_pct_0
+
+    def trend_counts(self) -> list[tuple[str, int, int]]:
+        """Return (timeframe, bull, bear) for every timeframe column present."""
+        counts = []
+        for timeframe in TREND_TIMEFRAMES:
+            bull_count = getattr(self, f"{timeframe.lower()}_bull")
+            bear_count = getattr(self, f"{timeframe.lower()}_bear")
+            if bull_count >= 0:
+                counts.append((timeframe, bull_count, bear_count))
+        return counts
+
+
+def find_normalized_column(df: pd.DataFrame, name: str) -> str | None:
+    for column in df.columns:
+        if str(column).strip().upper().replace(" ", "_") == name:
+            return column
+    return None
+
+
+def count_bull_pct_buckets(df: pd.DataFrame) -> list[int] | None:
+    """Return [numeric rows, 0, 33.33, 66.67, 100] bucket counts for the BULL_PCT column."""
+    bull_pct_column = find_normalized_column(df, "BULL_PCT")
+    if bull_pct_column is None:
+        return None
+    numeric_values = pd.to_numeric(df[bull_pct_column], errors="coerce").dropna().round(2)
+    return [
+        len(numeric_values),
+        int((numeric_values == 0.0).sum()),
+        int(((numeric_values >= 32.99) & (numeric_values <= 33.67)).sum()),
+        int(((numeric_values >= 66.0) & (numeric_values <= 67.34)).sum()),
+        int((numeric_values == 100.0).sum()),
+    ]
+
+
+def count_trends(df: pd.DataFrame, timeframe: str) -> tuple[int, int] | None:
+    trend_column = find_normalized_column(df, f"{timeframe}_CURRENT_TREND")
+    if trend_column is None:
+        return None
+    trend_values = df[trend_column].dropna().astype(str).str.upper()
+    return int((trend_values == "BULL").sum()), int((trend_values == "BEAR").sum())
+
+
+def summarize_trend_frame(df: pd.DataFrame, path: str = "", size: int = 0, mtime_ns: int = 0) -> TrendSummary:
+    bull_pct_counts = count_bull_pct_buckets(df) or [-1, -1, -1, -1, -1]
+    trend_fields = {}
+    for timeframe in TREND_TIMEFRAMES:
+        bull_count, bear_count = count_trends(df, timeframe) or (-1, -1)
+        trend_fields[f"{timeframe.lower()}_bull"] = bull_count
+        trend_fields[f"{timeframe.lower()}_bear"] = bear_count
+    return TrendSummary(
+        path=path,
+        size=size,
+        mtime_ns=mtime_ns,
+        readable=True,
+        rows=len(df),
+        bull_pct_rows=bull_pct_counts[0],
+        bull_pct_0=bull_pct_counts[1],
+        bull_pct_33=bull_pct_counts[2],
+        bull_pct_67=bull_pct_counts[3],
+        bull_pct_100=bull_pct_counts[4],
+        **trend_fields,
+    )
+
+
+def unreadable_summary(path: str, size: int, mtime_ns: int) -> TrendSummary:
+    return TrendSummary(path, size, mtime_ns, False, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1)
+
+
+def summarize_trend_file(path: str, stat_result: os.stat_result) -> TrendSummary:
+    try:
+        df = read_excel_cached(path)
+    except Exception:
+        return unreadable_summary(path, stat_result.st_size, stat_result.st_mtime_ns)
+    return summarize_trend_frame(df, path, stat_result.st_size, stat_result.st_mtime_ns)
+
+
+def scoreboard_path(data_dir: str) -> str:
+    return cache_path(data_dir, SCOREBOARD_FILE_NAME)
+
+
+def read_scoreboard(data_dir: str) -> dict[str, TrendSummary]:
+    try:
+        table = pd.read_parquet(scoreboard_path(data_dir))
+        summaries = {}
+        for record in table.to_dict("records"):
+            summary = TrendSummary(**record)
+            summaries[summary.path] = summary
+    except Exception:
+        # Missing, unreadable or written by an older schema: rebuild from the files.
+        return {}
+    return summaries
+
+
+def write_scoreboard(data_dir: str, summaries: dict[str, TrendSummary]) -> None:
+    table = pd.DataFrame([asdict(summary) for summary in summaries.values()])
+    target = scoreboard_path(data_dir)
+    temp_target = f"{target}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        table.to_parquet(temp_target, index=False)
+        os.replace(temp_target, target)
+    except Exception:
+        # A read-only data directory only loses persistence across restarts.
+        if os.path.exists(temp_target):
+            os.remove(temp_target)
+
+
+_scoreboard_lock = threading.Lock()
+_scoreboards: dict[str, dict[str, TrendSummary]] = {}
+
+
+def get_trend_summaries(data_dir: str, paths: list[str]) -> dict[str, TrendSummary]:
+    """Return the scoreboard rows for ``paths``, parsing only files that changed."""
+    with _scoreboard_lock:
+        if data_dir not in _scoreboards:
+            _scoreboards[data_dir] = read_scoreboard(data_dir)
+        summaries = _scoreboards[data_dir]
+
+    results = {}
+    changed = False
+    for path in paths:
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            continue
+        summary = summaries.get(path)
+        if summary is None or summary.size != stat_result.st_size or summary.mtime_ns != stat_result.st_mtime_ns:
+            note("scoreboard", hit=False)
+            summary = summarize_trend_file(path, stat_result)
+            with _scoreboard_lock:
+                summaries[path] = summary
+            changed = True
+        else:
+            note("scoreboard", hit=True)
+        results[path] = summary
+
+    if changed:
+        store_trend_summaries(data_dir, {})
+    return results
+
+
+def store_trend_summaries(data_dir: str, new_summaries: dict[str, TrendSummary]) -> None:
+    """Merge precomputed rows (e.g. from the warm-up) into the scoreboard and persist it."""
+    with _scoreboard_lock:
+        if data_dir not in _scoreboards:
+            _scoreboards[data_dir] = read_scoreboard(data_dir)
+        summaries = {**_scoreboards[data_dir], **new_summaries}
+        live_summaries = {path: summary for path, summary in summaries.items() if os.path.exists(path)}
+        _scoreboards[data_dir] = live_summaries
+    write_scoreboard(data_dir, live_summaries)
+
+
+def build_scoreboard(data_dir: str) -> dict[str, TrendSummary]:
+    paths = [
+        entry.path
+        for entry in os.scandir(data_dir)
+        if entry.is_file() and entry.name.startswith(SUMMARY_FAMILY_PREFIX) and entry.name.endswith(".xlsx")
+    ]
+    return get_trend_summaries(data_dir, paths)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precompute the BULL_PCT / trend scoreboard for every CURRENT_TREND_SUMMARY xlsx.")
+    parser.add_argument(
+        "data_dir",
+        nargs="?",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads"),
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    summaries = build_scoreboard(args.data_dir)
+    elapsed = time.perf_counter() - started
+    print(f"{len(summaries)} summaries scored into {scoreboard_path(args.data_dir)} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
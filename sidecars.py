@@ -0,0 +1,150 @@
+import argparse
+import os
+import time
+
+import pandas as pd
+
+SIDECAR_DIR_NAME = ".sidecars"
+SIDECAR_SOURCE_EXTENSIONS = (".xlsx", ".csv")
+
+
+def sidecar_dir(data_dir: str) -> str:
+    return os.path.join(data_dir, SIDECAR_DIR_NAME)
+
+
+def sidecar_name(file_name: str, stat_result: os.stat_result) -> str:
+    # The source size and mtime are part of the name, so freshness is an
+    # existence check and a rewritten source can never be served a stale sidecar.
+    return f"{file_name}.{stat_result.st_size}-{stat_result.st_mtime_ns}.parquet"
+
+
+def sidecar_path(source_path: str, stat_result: os.stat_result | None = None) -> str:
+    if stat_result is None:
+        stat_result = os.stat(source_path)
+    data_dir, file_name = os.path.split(source_path)
+    return os.path.join(sidecar_dir(data_dir), sidecar_name(file_name, stat_result))
+
+
+def fresh_sidecar_path(source_path: str, stat_result: os.stat_result | None = None) -> str | None:
+    try:
+        path = sidecar_path(source_path, stat_result)
+    except OSError:
+        return None
+    if os.path.exists(path):
+        return path
+    return None
+
+
+def read_source(source_path: str) -> pd.DataFrame:
+    if source_path.lower().endswith(".csv"):
+        return pd.read_csv(source_path)
+    return pd.read_excel(source_path)
+
+
+def read_with_sidecar(source_path: str, **kwargs) -> pd.DataFrame:
+    """Read a xlsx/csv file, preferring its Parquet sidecar when one is fresh."""
+    if not kwargs:
+        path = fresh_sidecar_path(source_path)
+        if path:
+            try:
+                return pd.read_parquet(path)
+            except Exception:
+                pass
+    if source_path.lower().endswith(".csv"):
+        return pd.read_csv(source_path, **kwargs)
+    return pd.read_excel(source_path, **kwargs)
+
+
+def write_sidecar_frame(df: pd.DataFrame, target: str) -> bool:
+    """Store an already parsed source frame as the sidecar ``target``; return False if it cannot be represented."""
+    temp_target = f"{target}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        df.to_parquet(temp_target, index=True)
+        # Only publish sidecars that read back identically (object columns can
+        # come back with None where openpyxl produced NaN, for example).
+        pd.testing.assert_frame_equal(pd.read_parquet(temp_target), df)
+        os.replace(temp_target, target)
+    except Exception:
+        # Mixed-type object columns and non-string headers cannot be stored
+        # as Parquet (nor can anything in a read-only data directory); those
+        # files keep being read from the original source.
+        if os.path.exists(temp_target):
+            os.remove(temp_target)
+        return False
+    return True
+
+
+def write_sidecar(source_path: str) -> str | None:
+    """Convert one source file to Parquet; return None if it cannot be represented."""
+    stat_result = os.stat(source_path)
+    target = sidecar_path(source_path, stat_result)
+    if os.path.exists(target):
+        return target
+    return target if write_sidecar_frame(read_source(source_path), target) else None
+
+
+def prune_sidecars(data_dir: str, keep: set[str]) -> int:
+    removed = 0
+    directory = sidecar_dir(data_dir)
+    if not os.path.isdir(directory):
+        return removed
+    for entry in os.scandir(directory):
+        if entry.path not in keep:
+            try:
+                os.remove(entry.path)
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def ingest_sidecars(data_dir: str, prune: bool = True) -> dict[str, int]:
+    counts = {"written": 0, "fresh": 0, "skipped": 0, "failed": 0, "pruned": 0}
+    keep: set[str] = set()
+    for entry in os.scandir(data_dir):
+        if not entry.is_file() or entry.name.startswith((".", "~$")):
+            continue
+        if not entry.name.lower().endswith(SIDECAR_SOURCE_EXTENSIONS):
+            continue
+        existing = fresh_sidecar_path(entry.path)
+        if existing:
+            keep.add(existing)
+            counts["fresh"] += 1
+            continue
+        try:
+            written = write_sidecar(entry.path)
+        except Exception:
+            counts["failed"] += 1
+            continue
+        if written:
+            keep.add(written)
+            counts["written"] += 1
+        else:
+            counts["skipped"] += 1
+    if prune:
+        counts["pruned"] = prune_sidecars(data_dir, keep)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write Parquet sidecars for every xlsx/csv in the data directory.")
+    parser.add_argument(
+        "data_dir",
+        nargs="?",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads"),
+    )
+    parser.add_argument("--no-prune", action="store_true", help="Keep sidecars whose source file is gone or changed.")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = ingest_sidecars(args.data_dir, prune=not args.no_prune)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{counts['written']} written, {counts['fresh']} fresh, {counts['skipped']} not representable, "
+        f"{counts['failed']} failed, {counts['pruned']} pruned in {elapsed:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
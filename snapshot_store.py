@@ -0,0 +1,473 @@
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from datetime import date, timedelta
+
+import pandas as pd
+
+import sqlite_store
+from asset_catalog import fold_family, get_asset_catalog
+from sidecars import read_with_sidecar
+
+SNAPSHOT_DB_FILE_NAME = "snapshot_history.sqlite3"
+TREND_FAMILY_PREFIX = "CURRENT_TREND_SUMMARY"
+SUMMARY_DATA_SUFFIX = "_SUMMARY_DATA"
+TREND_TIMEFRAMES = {"DAILY": "daily_trend", "WEEKLY": "weekly_trend", "MONTHLY": "monthly_trend"}
+# Normalised source header -> table column, per snapshot kind.
+TREND_COLUMNS = {
+    "TICKER": "ticker",
+    "SECTOR": "sector",
+    "INDUSTRY": "industry",
+    "MONTHLY_CURRENT_TREND": "monthly_trend",
+    "WEEKLY_CURRENT_TREND": "weekly_trend",
+    "DAILY_CURRENT_TREND": "daily_trend",
+    "BULL_PCT": "bull_pct",
+}
+SUMMARY_DATA_COLUMNS = {
+    "TICKER": "ticker",
+    "SECTOR": "sector",
+    "INDUSTRY": "industry",
+    "DATE": "bar_date",
+    "OPEN": "open",
+    "HIGH": "high",
+    "LOW": "low",
+    "CLOSE": "close",
+    "CANDLE_RANGE": "candle_range",
+    "CANDLE_SIGNAL": "candle_signal",
+}
+NUMERIC_COLUMNS = {"bull_pct", "open", "high", "low", "close", "candle_range"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    family TEXT NOT NULL,
+    snapshot_date TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (family, snapshot_date)
+);
+CREATE TABLE IF NOT EXISTS trend_rows (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+    ticker TEXT NOT NULL,
+    sector TEXT,
+    industry TEXT,
+    monthly_trend TEXT,
+    weekly_trend TEXT,
+    daily_trend TEXT,
+    bull_pct REAL,
+    PRIMARY KEY (snapshot_id, ticker)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS trend_rows_ticker ON trend_rows (ticker, snapshot_id);
+CREATE TABLE IF NOT EXISTS summary_rows (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+    ticker TEXT NOT NULL,
+    sector TEXT,
+    industry TEXT,
+    bar_date TEXT,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    candle_range REAL,
+    candle_signal TEXT
+);
+CREATE INDEX IF NOT EXISTS summary_rows_snapshot ON summary_rows (snapshot_id);
+CREATE INDEX IF NOT EXISTS summary_rows_ticker ON summary_rows (ticker, snapshot_id);
+CREATE TABLE IF NOT EXISTS trend_streaks (
+    family TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    trend TEXT NOT NULL,
+    streak INTEGER NOT NULL,
+    since TEXT NOT NULL,
+    PRIMARY KEY (family, timeframe, ticker)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS streak_state (
+    family TEXT PRIMARY KEY,
+    through_date TEXT NOT NULL
+);
+"""
+
+
+def snapshot_db_path(data_dir: str) -> str:
+    return os.path.join(data_dir, SNAPSHOT_DB_FILE_NAME)
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    return sqlite_store.connect(db_path, SCHEMA)
+
+
+def snapshot_kind(family: str) -> str | None:
+    if family.startswith(TREND_FAMILY_PREFIX):
+        return "trend"
+    if family.endswith(SUMMARY_DATA_SUFFIX):
+        return "summary"
+    return None
+
+
+def normalise_header(column) -> str:
+    return str(column).strip().upper().replace(" ", "_")
+
+
+def snapshot_records(df: pd.DataFrame, columns: dict[str, str]) -> tuple[list[str], list[tuple]]:
+    df = df.rename(columns=normalise_header)
+    present = [header for header in columns if header in df.columns]
+    names = [columns[header] for header in present]
+    records = []
+    for values in df[present].itertuples(index=False, name=None):
+        row = []
+        for name, value in zip(names, values):
+            if pd.isna(value):
+                row.append(None)
+            elif name in NUMERIC_COLUMNS:
+                try:
+                    row.append(float(value))
+                except (TypeError, ValueError):
+                    row.append(None)
+            elif isinstance(value, (pd.Timestamp, date)):
+                row.append(value.strftime("%Y-%m-%d"))
+            else:
+                row.append(str(value).strip())
+        records.append(tuple(row))
+    if "ticker" in names:
+        ticker_index = names.index("ticker")
+        records = [record for record in records if record[ticker_index]]
+    return names, records
+
+
+def read_snapshot(path: str, kind: str) -> tuple[list[str], list[tuple]]:
+    columns = TREND_COLUMNS if kind == "trend" else SUMMARY_DATA_COLUMNS
+    names, records = snapshot_records(read_with_sidecar(path), columns)
+    if kind == "trend" and "ticker" in names:
+        # A ticker listed twice in one snapshot keeps its last row.
+        records = list({record[0]: record for record in records}.values())
+    return names, records
+
+
+def rebuild_streaks(connection: sqlite3.Connection, family: str) -> None:
+    """Recompute every ticker's current streak in ``family`` from the full history."""
+    connection.execute("DELETE FROM trend_streaks WHERE family = ?", (family,))
+    for timeframe, column in TREND_TIMEFRAMES.items():
+        connection.execute(
+            f"""
+            INSERT INTO trend_streaks (family, timeframe, ticker, trend, streak, since)
+            WITH ranked AS (
+                SELECT id, snapshot_date, ROW_NUMBER() OVER (ORDER BY snapshot_date DESC) AS back
+                FROM snapshots WHERE family = :family
+            ),
+            latest AS (
+                SELECT t.ticker, t.{column} AS trend
+                FROM ranked r JOIN trend_rows t ON t.snapshot_id = r.id
+                WHERE r.back = 1 AND t.{column} IS NOT NULL
+            ),
+            hits AS (
+                SELECT t.ticker, r.snapshot_date,
+                       r.back - ROW_NUMBER() OVER (PARTITION BY t.ticker ORDER BY r.back) AS gap
+                FROM ranked r
+                JOIN trend_rows t ON t.snapshot_id = r.id
+                JOIN latest l ON l.ticker = t.ticker AND l.trend = t.{column}
+            )
+            SELECT :family, :timeframe, h.ticker, l.trend, COUNT(*), MIN(h.snapshot_date)
+            FROM hits h JOIN latest l ON l.ticker = h.ticker
+            WHERE h.gap = 0
+            GROUP BY h.ticker
+            """,
+            {"family": family, "timeframe": timeframe},
+        )
+
+
+def extend_streaks(connection: sqlite3.Connection, family: str, snapshot_id: int, snapshot_date: str) -> None:
+    """Advance the stored streaks by one snapshot that follows the previous newest one."""
+    for timeframe, column in TREND_TIMEFRAMES.items():
+        connection.execute(
+            f"""
+            INSERT OR REPLACE INTO trend_streaks (family, timeframe, ticker, trend, streak, since)
+            SELECT :family, :timeframe, t.ticker, t.{column},
+                   CASE WHEN s.trend = t.{column} THEN s.streak + 1 ELSE 1 END,
+                   CASE WHEN s.trend = t.{column} THEN s.since ELSE :snapshot_date END
+            FROM trend_rows t
+            LEFT JOIN trend_streaks s ON s.family = :family AND s.timeframe = :timeframe AND s.ticker = t.ticker
+            WHERE t.snapshot_id = :snapshot_id AND t.{column} IS NOT NULL
+            """,
+            {"family": family, "timeframe": timeframe, "snapshot_id": snapshot_id, "snapshot_date": snapshot_date},
+        )
+        # Tickers missing from (or without a trend in) the new snapshot broke their streak.
+        connection.execute(
+            f"""
+            DELETE FROM trend_streaks
+            WHERE family = :family AND timeframe = :timeframe AND ticker NOT IN (
+                SELECT ticker FROM trend_rows WHERE snapshot_id = :snapshot_id AND {column} IS NOT NULL
+            )
+            """,
+            {"family": family, "timeframe": timeframe, "snapshot_id": snapshot_id},
+        )
+
+
+def update_streaks(connection: sqlite3.Connection, family: str, snapshot_id: int, snapshot_date: str) -> None:
+    row = connection.execute("SELECT through_date FROM streak_state WHERE family = ?", (family,)).fetchone()
+    previous = connection.execute(
+        "SELECT MAX(snapshot_date) FROM snapshots WHERE family = ? AND snapshot_date < ?", (family, snapshot_date)
+    ).fetchone()[0]
+    newest = connection.execute("SELECT MAX(snapshot_date) FROM snapshots WHERE family = ?", (family,)).fetchone()[0]
+    if newest == snapshot_date and row is not None and row[0] == previous:
+        # The usual nightly case: O(tickers) instead of rescanning the history.
+        extend_streaks(connection, family, snapshot_id, snapshot_date)
+    else:
+        # First snapshot, a rewritten newest day, or a backfilled older day
+        # (which can join two runs).
+        rebuild_streaks(connection, family)
+    connection.execute(
+        "INSERT OR REPLACE INTO streak_state (family, through_date) VALUES (?, ?)", (family, newest)
+    )
+
+
+def store_snapshot(
+    connection: sqlite3.Connection,
+    family: str,
+    snapshot_date: str,
+    path: str,
+    stat_result: os.stat_result,
+    names: list[str],
+    records: list[tuple],
+) -> int:
+    """Store one dated file, replacing an earlier ingest of the same family and date; return its row count."""
+    if "ticker" not in names:
+        return 0
+    kind = snapshot_kind(family)
+    table = "trend_rows" if kind == "trend" else "summary_rows"
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        connection.execute("DELETE FROM snapshots WHERE family = ? AND snapshot_date = ?", (family, snapshot_date))
+        cursor = connection.execute(
+            "INSERT INTO snapshots (family, snapshot_date, path, size, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+            (family, snapshot_date, path, stat_result.st_size, stat_result.st_mtime_ns),
+        )
+        snapshot_id = cursor.lastrowid
+        connection.executemany(
+            f"INSERT INTO {table} (snapshot_id, {', '.join(names)}) VALUES (?, {', '.join('?' * len(names))})",
+            [(snapshot_id, *record) for record in records],
+        )
+        if kind == "trend":
+            update_streaks(connection, family, snapshot_id, snapshot_date)
+        connection.execute("COMMIT")
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+    return len(records)
+
+
+_ingest_lock = threading.Lock()
+_ingested: dict[str, dict[tuple[str, str], tuple[int, int]]] = {}
+
+
+def pending_snapshots(data_dir: str, ingested: dict[tuple[str, str], tuple[int, int]]) -> tuple[list[tuple], int]:
+    """Return (family, date, version) for every new or rewritten dated file, oldest first, and the unchanged count."""
+    pending = {}
+    unchanged = 0
+    for version in get_asset_catalog(data_dir).all_versions():
+        if version.snapshot_date is None or version.extension not in (".xlsx", ".csv"):
+            continue
+        # Sector files change casing and separators between runs; fold them
+        # so every day of one sector lands in the same history.
+        family = fold_family(version.family)
+        if snapshot_kind(family) is None:
+            continue
+        key = (family, version.snapshot_date.isoformat())
+        stored = ingested.get(key)
+        if stored is not None and (stored == (version.size, version.mtime_ns) or stored[1] > version.mtime_ns):
+            unchanged += 1
+            continue
+        if key not in pending or pending[key].mtime_ns < version.mtime_ns:
+            pending[key] = version
+    # Chronological order lets each family's streaks advance one day at a time.
+    ordered = sorted(pending.items(), key=lambda item: (item[0][1], item[0][0]))
+    return [(family, snapshot_date, version) for (family, snapshot_date), version in ordered], unchanged
+
+
+def ingest_snapshots(data_dir: str, workers: int = 1) -> dict[str, int]:
+    """Ingest every dated trend-summary and summary-data file not yet in the store.
+
+    Cheap when nothing is new: the (family, date) -> (size, mtime) map of past
+    ingests is kept in memory, so only new or rewritten files are read. With
+    ``workers`` > 1 the files are parsed in a process pool (for backfills).
+    """
+    counts = {"ingested": 0, "rows": 0, "unchanged": 0, "failed": 0}
+    db_path = snapshot_db_path(data_dir)
+    with _ingest_lock, closing(connect(db_path)) as connection:
+        if db_path not in _ingested:
+            _ingested[db_path] = {
+                (family, snapshot_date): (size, mtime_ns)
+                for family, snapshot_date, size, mtime_ns in connection.execute(
+                    "SELECT family, snapshot_date, size, mtime_ns FROM snapshots"
+                )
+            }
+        ingested = _ingested[db_path]
+        pending, counts["unchanged"] = pending_snapshots(data_dir, ingested)
+        if not pending:
+            return counts
+        paths = [version.path for _, _, version in pending]
+        kinds = [snapshot_kind(family) for family, _, _ in pending]
+        executor = ProcessPoolExecutor(workers) if workers > 1 and len(pending) > 1 else None
+        try:
+            parsed = executor.map(read_snapshot_safely, paths, kinds, chunksize=8) if executor else map(read_snapshot_safely, paths, kinds)
+            for (family, snapshot_date, version), result in zip(pending, parsed):
+                try:
+                    if result is None:
+                        raise ValueError(f"unreadable snapshot {version.path}")
+                    counts["rows"] += store_snapshot(connection, family, snapshot_date, version.path, os.stat(version.path), *result)
+                except Exception:
+                    counts["failed"] += 1
+                    continue
+                ingested[(family, snapshot_date)] = (version.size, version.mtime_ns)
+                counts["ingested"] += 1
+        finally:
+            if executor:
+                executor.shutdown()
+    return counts
+
+
+def read_snapshot_safely(path: str, kind: str) -> tuple[list[str], list[tuple]] | None:
+    try:
+        return read_snapshot(path, kind)
+    except Exception:
+        return None
+
+
+_background_lock = threading.Lock()
+_background: dict[str, tuple[threading.Thread, object]] = {}
+
+
+def start_background_ingest(data_dir: str) -> bool:
+    """Ingest new snapshots on a daemon thread, once per catalog version; return whether one is running."""
+    catalog = get_asset_catalog(data_dir)
+    with _background_lock:
+        thread, ingested_catalog = _background.get(data_dir, (None, None))
+        if thread is not None and thread.is_alive():
+            return True
+        if ingested_catalog is catalog:
+            return False
+        thread = threading.Thread(target=ingest_snapshots, args=(data_dir,), name="snapshot-ingest", daemon=True)
+        thread.start()
+        _background[data_dir] = (thread, catalog)
+    return True
+
+
+def query_frame(db_path: str, query: str, params: tuple | dict) -> pd.DataFrame:
+    with closing(connect(db_path)) as connection:
+        return pd.read_sql_query(query, connection, params=params)
+
+
+def window_start(db_path: str, family: str, days: int) -> str:
+    # Windows end at the family's newest snapshot, so a stale data drop still shows its last N days.
+    with closing(connect(db_path)) as connection:
+        latest = connection.execute("SELECT MAX(snapshot_date) FROM snapshots WHERE family = ?", (family,)).fetchone()[0]
+    if latest is None:
+        return "9999-12-31"
+    return (date.fromisoformat(latest) - timedelta(days=days)).isoformat()
+
+
+def bull_pct_history(db_path: str, family: str, days: int = 90) -> pd.DataFrame:
+    """Average BULL_PCT and per-timeframe BULL counts for every snapshot of a trend family."""
+    family = fold_family(family)
+    return query_frame(
+        db_path,
+        """
+        SELECT s.snapshot_date AS date,
+               ROUND(AVG(t.bull_pct), 2) AS bull_pct,
+               SUM(t.daily_trend = 'BULL') AS daily_bull,
+               SUM(t.weekly_trend = 'BULL') AS weekly_bull,
+               SUM(t.monthly_trend = 'BULL') AS monthly_bull,
+               COUNT(*) AS tickers
+        FROM snapshots s JOIN trend_rows t ON t.snapshot_id = s.id
+        WHERE s.family = ? AND s.snapshot_date > ?
+        GROUP BY s.snapshot_date
+        ORDER BY s.snapshot_date
+        """,
+        (family, window_start(db_path, family, days)),
+    )
+
+
+def trend_streaks(
+    db_path: str,
+    family: str = "CURRENT_TREND_SUMMARY_ALL_STOCKS",
+    timeframe: str = "DAILY",
+    trend: str = "BULL",
+    min_snapshots: int = 5,
+) -> pd.DataFrame:
+    """Tickers whose ``timeframe`` trend has been ``trend`` in each of the latest ``min_snapshots`` snapshots.
+
+    Streaks count consecutive snapshots (trading days for daily drops) and are
+    kept current at ingest time, so this is an indexed lookup.
+    """
+    family = fold_family(family)
+    return query_frame(
+        db_path,
+        """
+        SELECT s.ticker, t.sector, t.industry, s.streak, s.since
+        FROM trend_streaks s
+        LEFT JOIN trend_rows t ON t.ticker = s.ticker AND t.snapshot_id = (
+            SELECT id FROM snapshots WHERE family = :family ORDER BY snapshot_date DESC LIMIT 1
+        )
+        WHERE s.family = :family AND s.timeframe = :timeframe AND s.trend = :trend AND s.streak >= :min_snapshots
+        ORDER BY s.streak DESC, s.ticker
+        """,
+        {"family": family, "timeframe": timeframe.upper(), "trend": trend.upper(), "min_snapshots": min_snapshots},
+    )
+
+
+def ticker_trend_history(db_path: str, ticker: str, family: str = "CURRENT_TREND_SUMMARY_ALL_STOCKS", days: int = 90) -> pd.DataFrame:
+    family = fold_family(family)
+    return query_frame(
+        db_path,
+        """
+        SELECT s.snapshot_date AS date, t.daily_trend, t.weekly_trend, t.monthly_trend, t.bull_pct
+        FROM trend_rows t JOIN snapshots s ON s.id = t.snapshot_id
+        WHERE t.ticker = ? AND s.family = ? AND s.snapshot_date > ?
+        ORDER BY s.snapshot_date
+        """,
+        (ticker.upper(), family, window_start(db_path, family, days)),
+    )
+
+
+def summary_data_history(db_path: str, ticker: str, timeframe: str = "daily", days: int = 90) -> pd.DataFrame:
+    """OHLC rows of one ticker from the dated ``<timeframe>_summary_data`` snapshots."""
+    family = fold_family(f"{timeframe}_summary_data")
+    return query_frame(
+        db_path,
+        """
+        SELECT s.snapshot_date AS date, r.bar_date, r.open, r.high, r.low, r.close, r.candle_range, r.candle_signal
+        FROM summary_rows r JOIN snapshots s ON s.id = r.snapshot_id
+        WHERE r.ticker = ? AND s.family = ? AND s.snapshot_date > ?
+        ORDER BY s.snapshot_date
+        """,
+        (ticker.upper(), family, window_start(db_path, family, days)),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ingest dated trend-summary and summary-data files into the history store.")
+    parser.add_argument(
+        "data_dir",
+        nargs="?",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads"),
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processes parsing files during a backfill.")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = ingest_snapshots(args.data_dir, workers=args.workers)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{counts['ingested']} snapshots ({counts['rows']} rows) ingested, {counts['unchanged']} unchanged, "
+        f"{counts['failed']} failed in {elapsed:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
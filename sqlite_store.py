@@ -0,0 +1,40 @@
+import sqlite3
+import threading
+
+BUSY_TIMEOUT_SECONDS = 10.0
+
+_keepalive_lock = threading.Lock()
+_keepalive: dict[str, sqlite3.Connection] = {}
+
+
+def keep_wal_open(db_path: str) -> None:
+    """Hold one connection to ``db_path`` open for the life of the process.
+
+    SQLite deletes the -wal/-shm files when the last connection closes. The
+    trade ledger opens a connection per call, so every save and read created
+    and deleted them next to the uploads, bumping the data directory's mtime
+    and forcing an asset catalog rescan. A process-wide keepalive leaves them
+    in place.
+    """
+    with _keepalive_lock:
+        if db_path in _keepalive:
+            return
+        keepalive = sqlite3.connect(db_path, check_same_thread=False)
+        # SQLite opens the file lazily; one read attaches it to the WAL.
+        keepalive.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        _keepalive[db_path] = keepalive
+
+
+def connect(db_path: str, schema: str) -> sqlite3.Connection:
+    """Open a WAL-mode connection to ``db_path`` (autocommit; use explicit BEGIN), creating ``schema`` if needed.
+
+    WAL lets every viewer read while one session commits; writers queue on the
+    busy timeout instead of failing with "database is locked".
+    """
+    connection = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA foreign_keys=ON")
+    connection.executescript(schema)
+    keep_wal_open(db_path)
+    return connection
@@ -0,0 +1,411 @@
+import argparse
+import io
+import os
+import time
+import zlib
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from PIL import Image, ImageDraw
+
+TRENDS = ("BULL", "BEAR")
+CANDLE_SIGNALS = ("No Signal", "Bullish Wick", "Bearish Wick")
+CANDLE_SIGNAL_WEIGHTS = (0.9, 0.055, 0.045)
+ETF_TICKERS = (
+    "SPY", "QQQ", "IWM", "DIA", "XLK", "XLV", "XLF", "XLE", "XLY", "XLP", "XLI", "XLB",
+    "XLU", "XLRE", "XLC", "SMH", "IBB", "KRE", "XHB", "ITB", "GDX", "ARKK", "TAN", "JETS",
+)
+# Sector file name -> SECTOR column value, matching the producer's naming.
+SECTOR_FILES = {
+    "MAG7": "Technology",
+    "SEMICONDUCTORS": "Technology",
+    "SOFTWARE": "Technology",
+    "ALL_OTHER_TECHNOLOGY": "Technology",
+    "Basic Material": "Basic Material",
+    "Communication": "Communication",
+    "Consumer Defensive": "Consumer Defensive",
+    "Consumer Discretionary": "Consumer Discretionary",
+    "Energy": "Energy",
+    "Financial": "Financial",
+    "Healthcare": "Healthcare",
+    "Industrial": "Industrial",
+    "Real Estate": "Real Estate",
+    "UTILITY": "Utility",
+}
+INDUSTRY_WORDS = (
+    "Aerospace Defense", "Airlines", "Auto Parts", "Banks Regional", "Biotechnology", "Building Materials",
+    "Chemicals", "Credit Services", "Drug Manufacturers", "Gold", "Insurance", "Lodging", "Medical Devices",
+    "Oil And Gas", "Packaging", "Railroads", "Restaurants", "Semiconductors", "Software Application", "Solar",
+    "Specialty Retail", "Steel", "Telecom Services", "Utilities Regulated",
+)
+# Chart files the dashboard displays; "{d}" is MM_DD_YYYY and "{iso}" is YYYY-MM-DD.
+CHART_TEMPLATES = (
+    "BULL_Percentage_Trend_Daily_{d}.png",
+    "BULL_Percentage_Trend_Weekly_{d}.png",
+    "BULL_Percentage_Trend_Monthly_{d}.png",
+    "BULL_Percentage_Trend_Daily_ALL_STOCKS_{d}.png",
+    "BULL_Percentage_Trend_Weekly_ALL_STOCKS_{d}.png",
+    "BULL_Percentage_Trend_Monthly_ALL_STOCKS_{d}.png",
+    "CURRENT_TREND_SUMMARY_TABLE_{d}.png",
+    "CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_{d}.png",
+    "daily_close_above_below_count_{d}.png",
+    "weekly_close_above_below_count_{d}.png",
+    "monthly_close_above_below_count_{d}.png",
+    "daily_tail_candle_count_{d}.png",
+    "weekly_tail_candle_count_{d}.png",
+    "monthly_tail_candle_count_{d}.png",
+    "daily_tail_candle_count_separate_{d}.png",
+    "weekly_tail_candle_count_separate_{d}.png",
+    "monthly_tail_candle_count_separate_{d}.png",
+    "spy_seasonality_{d}.png",
+    "qqq_seasonality_{d}.png",
+    "iwm_seasonality_{d}.png",
+    "VIX_seasonality_{d}.png",
+    "sector_etf_yearly_gain_table_{iso}.png",
+    "etf_ytd_bar_chart_{iso}.png",
+    "etf_qtd_bar_chart_{iso}.png",
+    "earnings_calendar_{d}_graph.png",
+    "naaim_plot_{d}.png",
+    "naaim_spy_combined_{d}_graph.png",
+    "spy_uvxy_positive_{d}_graph.png",
+    "spy_vix_positive_{d}_graph.png",
+    "spy_weekday_{iso}_graph.png",
+    "vix_weekday_{iso}_graph.png",
+    "vix_analysis_{iso}_graph.png",
+    "spy_last_10_weeks_{iso}_graph.png",
+    "mercury_retrograde_summary_{d}_graph.png",
+    *(f"fed_rates_spy_page_{page}_{{d}}_graph.png" for page in range(1, 7)),
+    *(f"mercury_retrograde_spy_page_{page}_{{d}}_graph.png" for page in range(1, 8)),
+    *(f"spy_daily_data_{{iso}}_page_{page}_graph.png" for page in range(1, 7)),
+)
+UNDATED_CHARTS = (
+    "Daily_SPY_Gain_Chart.png",
+    "SPY_Daily_Positive_Count_Ghart.png",
+    "MONTHLY_SPY_Gain_Chart.png",
+    "YEARLY_SPY_Gain_Chart.png",
+)
+
+
+def ticker_symbol(index: int) -> str:
+    letters = ""
+    index += 26 + 26 * 26  # skip the one- and two-letter symbols
+    while index >= 0:
+        letters = chr(ord("A") + index % 26) + letters
+        index = index // 26 - 1
+    return letters
+
+
+def industry_name(index: int) -> str:
+    word = INDUSTRY_WORDS[index % len(INDUSTRY_WORDS)]
+    generation = index // len(INDUSTRY_WORDS)
+    return word if generation == 0 else f"{word} {generation + 1}"
+
+
+def industry_token(name: str) -> str:
+    return name.upper().replace(" ", "_")
+
+
+def trading_days(end_date: date, count: int) -> list[date]:
+    """Return ``count`` weekdays ending at ``end_date``, newest first."""
+    days = []
+    day = end_date
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(day)
+        day -= timedelta(days=1)
+    return days
+
+
+def build_universe(tickers: int, industries: int) -> pd.DataFrame:
+    industries = max(1, min(industries, tickers))
+    sector_files = list(SECTOR_FILES)
+    rows = []
+    for index in range(tickers):
+        industry_index = index % industries
+        sector_file = sector_files[industry_index % len(sector_files)]
+        rows.append(
+            {
+                "TICKER": ticker_symbol(index),
+                "SECTOR_FILE": sector_file,
+                "SECTOR": SECTOR_FILES[sector_file],
+                "INDUSTRY": industry_name(industry_index),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def trend_frame(rng: np.random.Generator, tickers: pd.DataFrame, with_sector: bool = True) -> pd.DataFrame:
+    trends = rng.choice(TRENDS, size=(len(tickers), 3))
+    df = pd.DataFrame({"TICKER": tickers["TICKER"].to_numpy()})
+    if with_sector:
+        df["SECTOR"] = tickers["SECTOR"].to_numpy()
+        df["INDUSTRY"] = tickers["INDUSTRY"].to_numpy()
+    df["MONTHLY_CURRENT_TREND"] = trends[:, 0]
+    df["WEEKLY_CURRENT_TREND"] = trends[:, 1]
+    df["DAILY_CURRENT_TREND"] = trends[:, 2]
+    df["BULL_PCT"] = ((trends == "BULL").sum(axis=1) * 100 / 3).round(2)
+    return df.sort_values("BULL_PCT", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def ytd_frame(rng: np.random.Generator, tickers: pd.DataFrame | None, etf_tickers: tuple[str, ...] = ()) -> pd.DataFrame:
+    symbols = list(etf_tickers) if tickers is None else tickers["TICKER"].tolist()
+    count = len(symbols)
+    df = pd.DataFrame(
+        {
+            "TICKER": symbols,
+            "YTD_GAIN": rng.normal(8, 25, count).round(2),
+            "AVG_YEARLY_GAIN": rng.normal(12, 10, count).round(2),
+            "BEST_YEARLY_GAIN": rng.uniform(20, 250, count).round(2),
+            "WORST_YEARLY_GAIN": -rng.uniform(5, 70, count).round(2),
+            "%_FROM_ATH": -rng.uniform(0, 90, count).round(2),
+            "Sector": "Unknown" if tickers is None else tickers["SECTOR"].to_numpy(),
+            "Industry": "Unknown" if tickers is None else tickers["INDUSTRY"].to_numpy(),
+        }
+    )
+    return df.sort_values("YTD_GAIN", ascending=False).reset_index(drop=True)
+
+
+def candle_strength_frame(rng: np.random.Generator, symbols: list[str]) -> pd.DataFrame:
+    strengths = rng.uniform(0, 100, size=(len(symbols), 3)).round(2)
+    df = pd.DataFrame(
+        {
+            "TICKER": symbols,
+            "D_CLOSE_STRENGTH": strengths[:, 0],
+            "W_CLOSE_STRENGTH": strengths[:, 1],
+            "M_CLOSE_STRENGTH": strengths[:, 2],
+            "CLOSE_SCORE": strengths.mean(axis=1).round(2),
+        }
+    )
+    return df.sort_values("CLOSE_SCORE", ascending=False).reset_index(drop=True)
+
+
+def summary_data_frame(rng: np.random.Generator, tickers: pd.DataFrame, day: date) -> pd.DataFrame:
+    count = len(tickers)
+    close = rng.uniform(5, 800, count).round(2)
+    high = (close * rng.uniform(1.0, 1.05, count)).round(2)
+    low = (close * rng.uniform(0.95, 1.0, count)).round(2)
+    open_ = rng.uniform(low, high).round(2)
+    return pd.DataFrame(
+        {
+            "Ticker": tickers["TICKER"].to_numpy(),
+            "Sector": tickers["SECTOR"].to_numpy(),
+            "Industry": tickers["INDUSTRY"].to_numpy(),
+            "Date": day.isoformat(),
+            "Close": close,
+            "High": high,
+            "Low": low,
+            "Open": open_,
+            "Candle Range": (high - low).round(2),
+            "Candle Signal": rng.choice(CANDLE_SIGNALS, size=count, p=CANDLE_SIGNAL_WEIGHTS),
+        }
+    )
+
+
+def earnings_frame(rng: np.random.Generator, tickers: pd.DataFrame, day: date) -> pd.DataFrame:
+    offsets = rng.integers(-3, 30, len(tickers))
+    return pd.DataFrame(
+        {
+            "Stock": tickers["TICKER"].to_numpy(),
+            "Earnings Date": [(day + timedelta(days=int(offset))).strftime("%m/%d/%Y") for offset in offsets],
+            "Sector": tickers["SECTOR"].to_numpy(),
+            "Industry": tickers["INDUSTRY"].to_numpy(),
+        }
+    )
+
+
+def average_moves_frame(rng: np.random.Generator, tickers: pd.DataFrame) -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "TICKER": tickers["TICKER"].to_numpy(),
+            "AVG_DAILY_PCT_MOVE": rng.uniform(0.5, 6, len(tickers)).round(2),
+            "AVERAGE_VOLUME": rng.integers(100_000, 50_000_000, len(tickers)),
+        }
+    )
+    return df.sort_values("AVG_DAILY_PCT_MOVE", ascending=False).reset_index(drop=True)
+
+
+def signals_frame(rng: np.random.Generator, day: date, rows: int = 100) -> pd.DataFrame:
+    signal_days = trading_days(day, rows * 3)[::3]
+    df = pd.DataFrame(
+        {
+            "SIGNAL_DATE": [signal_day.strftime("%m-%d-%Y") for signal_day in signal_days],
+            "UVXY_SPY_POSITIVE": rng.choice([True, None], rows),
+            "VIX_SPY_POSITIVE": rng.choice([True, None], rows),
+            "MACD_BEAR": rng.choice([True, None], rows),
+        }
+    )
+    for horizon in range(1, 6):
+        df[f"PNL_{horizon}_Day"] = rng.normal(0.1, 1.5, rows).round(2)
+    return df
+
+
+def mercury_frame(day: date) -> pd.DataFrame:
+    # Three retrogrades a year of roughly three weeks each.
+    starts = [date(year, month, 5) for year in range(2006, day.year + 1) for month in (2, 6, 10)]
+    return pd.DataFrame(
+        {
+            "Start Date": [start.isoformat() for start in starts],
+            "End Date": [(start + timedelta(days=23)).isoformat() for start in starts],
+        }
+    )
+
+
+def xlsx_bytes(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+def chart_png_bytes(rng: np.random.Generator, title: str, size: tuple[int, int]) -> bytes:
+    width, height = size
+    # Drawing straight into a 4-colour palette image keeps encoding cheap.
+    image = Image.new("P", size, 0)
+    image.putpalette([0x0E, 0x11, 0x17, 0x2E, 0xCC, 0x71, 0xE7, 0x4C, 0x3C, 0xFF, 0xFF, 0xFF])
+    draw = ImageDraw.Draw(image)
+    bars = 24
+    bar_width = width / (bars * 1.5)
+    for index, value in enumerate(rng.uniform(0.05, 0.9, bars)):
+        left = bar_width * (0.5 + index * 1.5)
+        draw.rectangle([left, (height - 20) * (1 - value), left + bar_width, height - 20], fill=1 if value > 0.45 else 2)
+    draw.text((20, 10), title, fill=3)
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class PayloadPool:
+    """Generates ``variants`` distinct payloads per file kind and cycles them across dates.
+
+    Writing hundreds of thousands of xlsx files is dominated by openpyxl, so
+    history reuses a small pool of bytes while the newest date always gets
+    its own payload.
+    """
+
+    def __init__(self, variants: int, seed: int):
+        self.variants = max(1, variants)
+        self.seed = seed
+        self._payloads: dict[tuple[str, int], bytes] = {}
+
+    def get(self, kind: str, date_index: int, build) -> bytes:
+        variant = date_index % self.variants
+        key = (kind, variant)
+        if key not in self._payloads:
+            rng = np.random.default_rng([self.seed, variant, zlib.crc32(kind.encode())])
+            self._payloads[key] = build(rng)
+        return self._payloads[key]
+
+
+def write_file(target_dir: str, file_name: str, payload: bytes, mtime: float) -> None:
+    path = os.path.join(target_dir, file_name)
+    with open(path, "wb") as f:
+        f.write(payload)
+    os.utime(path, (mtime, mtime))
+
+
+def generate_uploads(
+    target_dir: str,
+    tickers: int = 400,
+    industries: int = 76,
+    dates: int = 1,
+    end_date: date = date(2026, 8, 21),
+    png_size: tuple[int, int] = (1600, 900),
+    variants: int = 3,
+    seed: int = 0,
+) -> int:
+    """Write a synthetic uploads tree and return the number of files written."""
+    os.makedirs(target_dir, exist_ok=True)
+    universe = build_universe(tickers, industries)
+    industry_groups = {name: group for name, group in universe.groupby("INDUSTRY", sort=False)}
+    sector_groups = {name: group for name, group in universe.groupby("SECTOR_FILE", sort=False)}
+    etfs = pd.DataFrame({"TICKER": list(ETF_TICKERS)})
+    pool = PayloadPool(variants, seed)
+    written = 0
+
+    for date_index, day in enumerate(trading_days(end_date, dates)):
+        d = day.strftime("%m_%d_%Y")
+        iso = day.isoformat()
+        # Files of one run land in the evening of their trading day.
+        mtime = datetime(day.year, day.month, day.day, 18).timestamp()
+
+        files = {
+            f"CURRENT_TREND_SUMMARY_{d}.xlsx": ("etf_trend", lambda rng: xlsx_bytes(trend_frame(rng, etfs, with_sector=False))),
+            f"CURRENT_TREND_SUMMARY_ALL_STOCKS_{d}.xlsx": ("all_trend", lambda rng: xlsx_bytes(trend_frame(rng, universe))),
+            f"ytd_analysis_{d}.xlsx": ("etf_ytd", lambda rng: xlsx_bytes(ytd_frame(rng, None, ETF_TICKERS))),
+            f"all_stocks_ytd_analysis_{d}.xlsx": ("all_ytd", lambda rng: xlsx_bytes(ytd_frame(rng, universe))),
+            f"ETF_CANDLE_STRENGTH_{iso}.xlsx": ("etf_candle", lambda rng: xlsx_bytes(candle_strength_frame(rng, list(ETF_TICKERS)))),
+            f"ALL_STOCKS_CANDLE_STRENGTH_{iso}.xlsx": (
+                "all_candle",
+                lambda rng: xlsx_bytes(candle_strength_frame(rng, universe["TICKER"].tolist())),
+            ),
+            f"earnings_calendar_{d}.csv": ("earnings", lambda rng, day=day: earnings_frame(rng, universe, day).to_csv(index=False).encode()),
+            f"AVERAGE_PCT_MOVES_{d}.xlsx": ("moves", lambda rng: xlsx_bytes(average_moves_frame(rng, universe))),
+            f"spy_combined_positive_signals_{d}.xlsx": ("signals", lambda rng, day=day: xlsx_bytes(signals_frame(rng, day))),
+            f"mercury_retrograde_{d}.xlsx": ("mercury", lambda rng, day=day: xlsx_bytes(mercury_frame(day))),
+        }
+        for timeframe in ("daily", "weekly", "monthly"):
+            files[f"{timeframe}_summary_data_{d}.xlsx"] = (
+                f"{timeframe}_summary",
+                lambda rng, day=day: xlsx_bytes(summary_data_frame(rng, universe, day)),
+            )
+        for sector_file, group in sector_groups.items():
+            files[f"CURRENT_TREND_SUMMARY_ALL_STOCKS_{sector_file}_{d}.xlsx"] = (
+                f"sector_{sector_file}",
+                lambda rng, group=group: xlsx_bytes(trend_frame(rng, group)),
+            )
+            files[f"CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_{sector_file}_{d}.png"] = (
+                f"table_{sector_file}",
+                lambda rng, name=sector_file: chart_png_bytes(rng, name, png_size),
+            )
+        for name, group in industry_groups.items():
+            token = industry_token(name)
+            files[f"CURRENT_TREND_SUMMARY_ALL_STOCKS_INDUSTRIES_{token}_{d}.xlsx"] = (
+                f"industry_{token}",
+                lambda rng, group=group: xlsx_bytes(trend_frame(rng, group)),
+            )
+            files[f"CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_INDUSTRIES_{token}_{d}.png"] = (
+                f"table_{token}",
+                lambda rng, token=token: chart_png_bytes(rng, token, png_size),
+            )
+        for template in CHART_TEMPLATES:
+            file_name = template.format(d=d, iso=iso)
+            files[file_name] = (template, lambda rng, template=template: chart_png_bytes(rng, template, png_size))
+        if date_index == 0:
+            for file_name in UNDATED_CHARTS:
+                files[file_name] = (file_name, lambda rng, file_name=file_name: chart_png_bytes(rng, file_name, png_size))
+
+        for file_name, (kind, build) in files.items():
+            write_file(target_dir, file_name, pool.get(kind, date_index, build), mtime)
+            written += 1
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write a synthetic, schema-faithful uploads tree for load testing.")
+    parser.add_argument("target_dir")
+    parser.add_argument("--tickers", type=int, default=400)
+    parser.add_argument("--industries", type=int, default=76)
+    parser.add_argument("--dates", type=int, default=1, help="Trading days of history, ending at --end-date.")
+    parser.add_argument("--end-date", type=date.fromisoformat, default=date(2026, 8, 21))
+    parser.add_argument("--png-size", type=int, nargs=2, default=[1600, 900], metavar=("WIDTH", "HEIGHT"))
+    parser.add_argument("--variants", type=int, default=3, help="Distinct payloads per file kind, cycled across dates.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    written = generate_uploads(
+        args.target_dir,
+        tickers=args.tickers,
+        industries=args.industries,
+        dates=args.dates,
+        end_date=args.end_date,
+        png_size=tuple(args.png_size),
+        variants=args.variants,
+        seed=args.seed,
+    )
+    elapsed = time.perf_counter() - started
+    print(f"{written} files written to {args.target_dir} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import bisect
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+PAGE_SIZES = (50, 100, 250, 500)
+
+
+def normalize_column_name(name) -> str:
+    return str(name).strip().lower().replace(" ", "").replace("_", "")
+
+
+@dataclass(frozen=True)
+class GroupIndex:
+    """Categorical codes of one column plus the row positions of every category."""
+
+    categories: list[str]
+    codes: np.ndarray
+    positions: list[np.ndarray]
+
+    @classmethod
+    def build(cls, values: pd.Series) -> tuple["GroupIndex", pd.Categorical]:
+        text = values.astype(str).where(values.notna())
+        categories = sorted(value for value in text.dropna().unique() if value.strip())
+        categorical = pd.Categorical(text, categories=categories)
+        codes = categorical.codes
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        # Uncategorised rows (blank or missing) sort first under code -1.
+        uncategorised = len(codes) - int(counts.sum())
+        positions = np.split(order[uncategorised:], np.cumsum(counts)[:-1])
+        return cls(categories, codes, positions), categorical
+
+    def code(self, value: str) -> int | None:
+        index = bisect.bisect_left(self.categories, value)
+        return index if index < len(self.categories) and self.categories[index] == value else None
+
+
+class TableView:
+    """Server-side filtering, sorting, projection and paging over one read-only frame.
+
+    ``group_columns`` (matched case- and separator-insensitively) become
+    categoricals with a GroupIndex each, and every column is mapped to the
+    values of the next one that occur with it (sector -> industries), so
+    filter options and filtered rows are index lookups rather than string
+    scans. Sort orders are computed once per column and shared by every
+    session; a rerun only slices the visible page out of the frame.
+    """
+
+    def __init__(self, df: pd.DataFrame, group_columns: tuple[str, ...] = ()):
+        df = df.reset_index(drop=True)
+        by_name = {normalize_column_name(column): column for column in df.columns}
+        self.groups: dict[str, GroupIndex] = {}
+        for wanted in group_columns:
+            column = by_name.get(normalize_column_name(wanted))
+            if column is None or str(column) in self.groups:
+                continue
+            self.groups[str(column)], categorical = GroupIndex.build(df[column])
+            df[column] = categorical
+        self.df = df
+        self.columns = [str(column) for column in df.columns]
+        self.group_columns = list(self.groups)
+        self._children: dict[tuple[str, str], list[list[str]]] = {}
+        for parent, child in zip(self.group_columns, self.group_columns[1:]):
+            child_group = self.groups[child]
+            self._children[(parent, child)] = [
+                [child_group.categories[code] for code in np.unique(child_group.codes[positions]) if code >= 0]
+                for positions in self.groups[parent].positions
+            ]
+        self._lock = threading.Lock()
+        self._orders: dict[tuple[str, bool], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def column(self, name: str) -> pd.Series:
+        return self.df[self.df.columns[self.columns.index(name)]]
+
+    def options(self, name: str, filters: dict[str, list[str]]) -> list[str]:
+        """Values of group column ``name`` that still occur under ``filters``."""
+        group = self.groups[name]
+        selected = [column for column, selection in filters.items() if selection and column != name]
+        if not selected:
+            return group.categories
+        if len(selected) == 1 and (selected[0], name) in self._children:
+            parent = self.groups[selected[0]]
+            children = self._children[(selected[0], name)]
+            codes = (parent.code(value) for value in filters[selected[0]])
+            return sorted({value for code in codes if code is not None for value in children[code]})
+        codes = np.unique(group.codes[self.filter_rows({column: filters[column] for column in selected})])
+        return [group.categories[code] for code in codes if code >= 0]
+
+    def filter_rows(self, filters: dict[str, list[str]]) -> np.ndarray | None:
+        """Sorted positions of rows matching every non-empty selection, or None when nothing is filtered."""
+        rows = None
+        for name, selection in filters.items():
+            if not selection:
+                continue
+            group = self.groups[name]
+            codes = (group.code(value) for value in selection)
+            parts = [group.positions[code] for code in codes if code is not None]
+            column_rows = np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.intp)
+            rows = column_rows if rows is None else np.intersect1d(rows, column_rows, assume_unique=True)
+        return rows
+
+    def _order(self, name: str, ascending: bool) -> np.ndarray:
+        key = (name, ascending)
+        with self._lock:
+            order = self._orders.get(key)
+        if order is None:
+            values = self.column(name)
+            try:
+                ordered = values.sort_values(ascending=ascending, kind="stable", na_position="last")
+            except TypeError:
+                # Mixed text and numbers in one column: fall back to text order.
+                ordered = values.astype(str).sort_values(ascending=ascending, kind="stable")
+            order = ordered.index.to_numpy()
+            with self._lock:
+                self._orders[key] = order
+        return order
+
+    def rows(self, filtered: np.ndarray | None, sort_by: str | None = None, ascending: bool = True) -> np.ndarray:
+        """The ``filtered`` row positions (every row when None) in ``sort_by`` order, or file order when None."""
+        if sort_by is None:
+            return np.arange(len(self.df)) if filtered is None else filtered
+        order = self._order(sort_by, ascending)
+        if filtered is None:
+            return order
+        keep = np.zeros(len(self.df), dtype=bool)
+        keep[filtered] = True
+        return order[keep[order]]
+
+    def page(self, rows: np.ndarray, columns: list[str] | None, page: int, page_size: int) -> pd.DataFrame:
+        """The ``page``-th window (0-based) of ``rows``, projected to ``columns``."""
+        window = rows[page * page_size:(page + 1) * page_size]
+        positions = [self.columns.index(name) for name in columns] if columns else slice(None)
+        return self.df.iloc[window, positions]
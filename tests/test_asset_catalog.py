@@ -0,0 +1,114 @@
+import os
+from datetime import date
+
+import pytest
+
+from asset_catalog import current_version, get_asset_catalog, split_asset_name
+
+
+def write_files(directory, names_and_mtimes):
+    for name, mtime in names_and_mtimes:
+        path = directory / name
+        path.write_bytes(b"x")
+        os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.parametrize(
+    ("file_name", "expected"),
+    [
+        ("CURRENT_TREND_SUMMARY_08_21_2026.xlsx", ("CURRENT_TREND_SUMMARY", "08_21_2026", ".xlsx")),
+        ("ALL_STOCKS_CANDLE_STRENGTH_2026-08-21.XLSX", ("ALL_STOCKS_CANDLE_STRENGTH", "2026-08-21", ".xlsx")),
+        ("fed_funds_08_21_2026_page_2.png", ("fed_funds_page_2", "08_21_2026", ".png")),
+        ("trade_tracker.xlsx", ("trade_tracker", None, ".xlsx")),
+        # Only a whole underscore-delimited token is a date.
+        ("SPY_2026-08-21x.csv", ("SPY_2026-08-21x", None, ".csv")),
+    ],
+)
+def test_split_asset_name(file_name, expected):
+    assert split_asset_name(file_name) == expected
+
+
+def test_split_asset_name_uses_last_date_token():
+    assert split_asset_name("REPORT_01_02_2026_08_21_2026.xlsx") == ("REPORT_01_02_2026", "08_21_2026", ".xlsx")
+
+
+def test_versions_ordered_by_file_name_date_across_formats(tmp_path):
+    # mtimes deliberately disagree with the dates (a restore or a touch).
+    write_files(
+        tmp_path,
+        [
+            ("SUMMARY_2026-08-21.xlsx", 100),
+            ("SUMMARY_08_19_2026.xlsx", 300),
+            ("SUMMARY_2026-08-20.xlsx", 200),
+            ("SUMMARY_12_31_2025.xlsx", 400),
+        ],
+    )
+    catalog = get_asset_catalog(str(tmp_path))
+
+    versions = catalog.versions("SUMMARY", ".xlsx")
+
+    assert [version.snapshot_date for version in versions] == [
+        date(2025, 12, 31),
+        date(2026, 8, 19),
+        date(2026, 8, 20),
+        date(2026, 8, 21),
+    ]
+    assert catalog.latest("SUMMARY", ".xlsx") == str(tmp_path / "SUMMARY_2026-08-21.xlsx")
+    assert [version.name for version in catalog.recent("SUMMARY", ".xlsx", 2)] == [
+        "SUMMARY_2026-08-21.xlsx",
+        "SUMMARY_2026-08-20.xlsx",
+    ]
+
+
+def test_mtime_breaks_ties_and_orders_undated_versions_first(tmp_path):
+    write_files(
+        tmp_path,
+        [
+            ("SUMMARY_08_21_2026.xlsx", 100),
+            ("SUMMARY_2026-08-21.xlsx", 200),
+            ("SUMMARY.xlsx", 900),
+        ],
+    )
+    catalog = get_asset_catalog(str(tmp_path))
+
+    versions = catalog.versions("SUMMARY", ".xlsx")
+
+    # Same date in both formats: the newer file wins. No date sorts before any dated run.
+    assert [version.name for version in versions] == [
+        "SUMMARY.xlsx",
+        "SUMMARY_08_21_2026.xlsx",
+        "SUMMARY_2026-08-21.xlsx",
+    ]
+
+
+def test_folded_versions_merge_spelling_variants_in_date_order(tmp_path):
+    write_files(
+        tmp_path,
+        [
+            ("Trend Summary_08_20_2026.xlsx", 500),
+            ("TREND_SUMMARY_2026-08-21.xlsx", 100),
+        ],
+    )
+    catalog = get_asset_catalog(str(tmp_path))
+
+    assert [version.name for version in catalog.folded_versions("trend summary", ".xlsx")] == [
+        "Trend Summary_08_20_2026.xlsx",
+        "TREND_SUMMARY_2026-08-21.xlsx",
+    ]
+
+
+def test_in_place_overwrite_keeps_the_catalog_but_current_version_sees_it(tmp_path):
+    write_files(tmp_path, [("chart_08_21_2026.png", 100)])
+    stale = get_asset_catalog(str(tmp_path)).versions("chart", ".png")[-1]
+    dir_mtime_ns = os.stat(tmp_path).st_mtime_ns
+
+    (tmp_path / "chart_08_21_2026.png").write_bytes(b"rewritten")
+    os.utime(tmp_path / "chart_08_21_2026.png", (200, 200))
+
+    assert os.stat(tmp_path).st_mtime_ns == dir_mtime_ns
+    assert get_asset_catalog(str(tmp_path)).versions("chart", ".png")[-1] == stale
+    fresh = current_version(stale)
+    assert (fresh.size, fresh.mtime) == (len(b"rewritten"), 200)
+    assert current_version(fresh) is fresh
+    (tmp_path / "chart_08_21_2026.png").unlink()
+    assert current_version(fresh) is None
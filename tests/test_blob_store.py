@@ -0,0 +1,51 @@
+import os
+
+from blob_store import blob_dir, blob_hash, dedupe_images, prune_blobs
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"chart" * 20
+
+
+def write_png(path, data, mtime):
+    path.write_bytes(data)
+    os.utime(path, (mtime, mtime))
+
+
+def test_dedupe_links_identical_images_to_one_blob_and_is_idempotent(tmp_path):
+    write_png(tmp_path / "chart_08_20_2026.png", PNG_BYTES, 100)
+    write_png(tmp_path / "chart_08_21_2026.png", PNG_BYTES, 200)
+
+    first = dedupe_images(str(tmp_path))
+    second = dedupe_images(str(tmp_path))
+
+    assert (first["stored"], first["deduplicated"], first["bytes_saved"]) == (1, 1, len(PNG_BYTES))
+    assert (second["stored"], second["deduplicated"], second["linked"]) == (0, 0, 2)
+    assert os.path.samefile(tmp_path / "chart_08_20_2026.png", tmp_path / "chart_08_21_2026.png")
+    assert len(os.listdir(blob_dir(str(tmp_path)))) == 1
+
+
+def test_prune_removes_blobs_no_file_links_to(tmp_path):
+    write_png(tmp_path / "chart_08_21_2026.png", PNG_BYTES, 100)
+    dedupe_images(str(tmp_path))
+
+    assert prune_blobs(str(tmp_path)) == 0
+    (tmp_path / "chart_08_21_2026.png").unlink()
+    assert prune_blobs(str(tmp_path)) == 1
+    assert os.listdir(blob_dir(str(tmp_path))) == []
+
+
+def test_in_place_rewrite_evicts_the_blob_instead_of_serving_stale_bytes(tmp_path):
+    path = tmp_path / "chart_08_21_2026.png"
+    write_png(path, PNG_BYTES, 100)
+    write_png(tmp_path / "chart_08_20_2026.png", PNG_BYTES, 100)
+    dedupe_images(str(tmp_path))
+    inode = os.stat(path).st_ino
+
+    # A producer truncating and rewriting the file writes through the shared inode.
+    write_png(path, PNG_BYTES + b"redrawn", 300)
+
+    assert blob_hash(str(path), inode) is None
+    assert os.listdir(blob_dir(str(tmp_path))) == []
+    counts = dedupe_images(str(tmp_path))
+    assert (counts["stored"], counts["deduplicated"]) == (1, 1)
+    (blob,) = os.listdir(blob_dir(str(tmp_path)))
+    assert blob_hash(str(path), os.stat(path).st_ino) == os.path.splitext(blob)[0]
@@ -0,0 +1,88 @@
+import os
+import threading
+from concurrent.futures import Future
+
+import pandas as pd
+import pytest
+
+from frame_cache import FRAME_CACHE, FrameCache, file_cache_key, frame_nbytes, load_frame
+
+
+def small_frame(value):
+    return pd.DataFrame({"value": [value] * 10})
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "SPY_08_21_2026.csv"
+    path.write_text("value\n1\n")
+    yield str(path)
+    FRAME_CACHE.discard_path(str(path))
+
+
+class CountingReader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        return pd.read_csv(path)
+
+
+def test_put_evicts_least_recently_used_frames_past_the_budget():
+    nbytes = frame_nbytes(small_frame(0))
+    cache = FrameCache(memory_budget_bytes=nbytes * 2 + nbytes // 2)
+    cache.put(("a",), small_frame(1))
+    cache.put(("b",), small_frame(2))
+    cache.get(("a",))
+
+    cache.put(("c",), small_frame(3))
+
+    assert [cache.contains((key,)) for key in "abc"] == [True, False, True]
+    assert cache.stats()["bytes"] == nbytes * 2
+
+
+def test_frame_larger_than_the_budget_is_not_kept():
+    cache = FrameCache(memory_budget_bytes=1)
+
+    cache.put(("big",), small_frame(1))
+
+    assert not cache.contains(("big",))
+    assert cache.stats()["bytes"] == 0
+
+
+def test_rewriting_a_file_changes_its_key_and_forces_a_reparse(csv_path):
+    reader = CountingReader()
+    load_frame(csv_path, reader, "test")
+    load_frame(csv_path, reader, "test")
+    assert reader.calls == 1
+
+    with open(csv_path, "w") as f:
+        f.write("value\n1\n2\n")
+    os.utime(csv_path, ns=(0, os.stat(csv_path).st_mtime_ns + 1))
+
+    assert list(load_frame(csv_path, reader, "test")["value"]) == [1, 2]
+    assert reader.calls == 2
+
+
+def test_reader_waits_for_a_pending_parse_instead_of_parsing_again(csv_path):
+    reader = CountingReader()
+    key = file_cache_key(csv_path, "test")
+    future = Future()
+    FRAME_CACHE.expect(key, future)
+    parsed = small_frame(7)
+    threading.Timer(0.05, future.set_result, [parsed]).start()
+
+    assert load_frame(csv_path, reader, "test") is parsed
+    assert reader.calls == 0
+    assert FRAME_CACHE.pending(key) is None
+
+
+def test_failed_pending_parse_falls_back_to_reading_the_file(csv_path):
+    reader = CountingReader()
+    future = Future()
+    FRAME_CACHE.expect(file_cache_key(csv_path, "test"), future)
+    threading.Timer(0.05, future.set_exception, [ValueError("worker died")]).start()
+
+    assert list(load_frame(csv_path, reader, "test")["value"]) == [1]
+    assert reader.calls == 1
@@ -0,0 +1,76 @@
+import http.client
+import threading
+
+import pytest
+
+from blob_store import BLOB_DIR_NAME
+from image_derivatives import DERIVATIVE_DIR_NAME
+from image_server import CACHE_CONTROL, make_image_server
+
+DERIVATIVE_NAME = "0123456789abcdef_800.webp"
+BLOB_NAME = f"{'ab' * 32}.png"
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("data")
+    (tmp_path / DERIVATIVE_DIR_NAME).mkdir()
+    (tmp_path / DERIVATIVE_DIR_NAME / DERIVATIVE_NAME).write_bytes(b"webp bytes")
+    (tmp_path / BLOB_DIR_NAME).mkdir()
+    (tmp_path / BLOB_DIR_NAME / BLOB_NAME).write_bytes(b"png bytes")
+    (tmp_path / "secret.png").write_bytes(b"not served")
+    server = make_image_server(str(tmp_path), "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def get(server, path, headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+    try:
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        return response, response.read()
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize(
+    ("path", "body", "content_type"),
+    [(f"/derivatives/{DERIVATIVE_NAME}", b"webp bytes", "image/webp"), (f"/blobs/{BLOB_NAME}", b"png bytes", "image/png")],
+)
+def test_serves_content_addressed_files_as_immutable(server, path, body, content_type):
+    response, data = get(server, path)
+
+    assert response.status == 200
+    assert data == body
+    assert response.getheader("Content-Type") == content_type
+    assert response.getheader("Cache-Control") == CACHE_CONTROL
+    assert response.getheader("Access-Control-Allow-Origin") is None
+
+    revalidated, data = get(server, path, {"If-None-Match": response.getheader("ETag")})
+
+    assert revalidated.status == 304
+    assert data == b""
+    assert revalidated.getheader("Cache-Control") == CACHE_CONTROL
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/derivatives/../secret.png",
+        "/derivatives/..%2Fsecret.png",
+        "/blobs/../../secret.png",
+        f"/blobs/../{BLOB_DIR_NAME}/{BLOB_NAME}",
+        f"/derivatives/{DERIVATIVE_DIR_NAME}/{DERIVATIVE_NAME}",
+        "/secret.png",
+        f"/blobs/{'cd' * 32}.png",
+    ],
+)
+def test_rejects_paths_outside_the_served_names(server, path):
+    response, _ = get(server, path)
+
+    assert response.status == 404
@@ -0,0 +1,82 @@
+import os
+from datetime import date
+
+from asset_catalog import AssetVersion, PageRun, get_asset_catalog
+from page_runs import archive_superseded_runs, superseded_runs
+
+PREFIX = "fed_rates_spy_page_"
+
+
+def page(number: int) -> AssetVersion:
+    family = f"{PREFIX}{number}_graph"
+    return AssetVersion(f"/{family}.png", f"{family}.png", family, ".png", None, 1, 0.0, 0, number)
+
+
+def write_run(directory, date_token: str, pages: list[int], mtime: int) -> None:
+    for number in pages:
+        path = directory / f"{PREFIX}{number}_{date_token}_graph.png"
+        path.write_bytes(b"x")
+        os.utime(path, (mtime, mtime))
+
+
+def test_page_run_complete_only_when_pages_are_numbered_from_one_without_gaps():
+    assert PageRun(None, (page(1), page(2), page(3))).complete
+    assert PageRun(None, (page(1),)).complete
+    assert not PageRun(None, (page(1), page(3))).complete
+    assert not PageRun(None, (page(2), page(3))).complete
+
+
+def test_page_runs_group_pages_by_file_name_date(tmp_path):
+    write_run(tmp_path, "08_19_2026", [1, 2, 3], mtime=300)
+    write_run(tmp_path, "2026-08-20", [1, 2], mtime=100)
+    catalog = get_asset_catalog(str(tmp_path))
+
+    runs = catalog.page_runs(PREFIX, ".png", "_graph")
+
+    assert [run.run_date for run in runs] == [date(2026, 8, 19), date(2026, 8, 20)]
+    assert [run.page_numbers for run in runs] == [[1, 2, 3], [1, 2]]
+
+
+def test_latest_page_run_skips_a_newer_run_still_uploading(tmp_path):
+    write_run(tmp_path, "08_19_2026", [1, 2, 3], mtime=100)
+    write_run(tmp_path, "08_20_2026", [1, 3], mtime=200)
+    catalog = get_asset_catalog(str(tmp_path))
+
+    run = catalog.latest_page_run(PREFIX, ".png", "_graph")
+
+    assert run.run_date == date(2026, 8, 19)
+    assert run.complete
+
+
+def test_superseded_runs_keep_newest_complete_and_any_newer_incomplete(tmp_path):
+    write_run(tmp_path, "08_18_2026", [1, 2], mtime=100)
+    write_run(tmp_path, "08_19_2026", [2], mtime=200)
+    write_run(tmp_path, "08_20_2026", [1, 2], mtime=300)
+    write_run(tmp_path, "08_21_2026", [1, 3], mtime=400)
+    catalog = get_asset_catalog(str(tmp_path))
+
+    assert [run.run_date for run in superseded_runs(catalog, keep=1)] == [date(2026, 8, 18), date(2026, 8, 19)]
+    assert [run.run_date for run in superseded_runs(catalog, keep=2)] == []
+    assert superseded_runs(catalog, keep=3) == []
+
+
+def test_superseded_runs_leave_a_set_without_complete_runs_alone(tmp_path):
+    write_run(tmp_path, "08_19_2026", [2, 3], mtime=100)
+    write_run(tmp_path, "08_20_2026", [2], mtime=200)
+
+    assert superseded_runs(get_asset_catalog(str(tmp_path))) == []
+
+
+def test_archive_moves_superseded_pages_out_of_the_catalog(tmp_path):
+    write_run(tmp_path, "08_19_2026", [1, 2], mtime=100)
+    write_run(tmp_path, "08_20_2026", [1, 2], mtime=200)
+
+    counts = archive_superseded_runs(str(tmp_path))
+
+    assert counts == {"runs": 1, "pages": 2, "failed": 0}
+    assert sorted(os.listdir(tmp_path / ".archive" / "2026-08-19")) == [
+        f"{PREFIX}1_08_19_2026_graph.png",
+        f"{PREFIX}2_08_19_2026_graph.png",
+    ]
+    runs = get_asset_catalog(str(tmp_path)).page_runs(PREFIX, ".png", "_graph")
+    assert [run.run_date for run in runs] == [date(2026, 8, 20)]
@@ -0,0 +1,14 @@
+import os
+
+from png_validation import PngCheck, read_validations, write_validations
+
+
+def test_rewriting_validations_leaves_the_data_directory_mtime_alone(tmp_path):
+    check = PngCheck(path=str(tmp_path / "fed_funds_08_21_2026.png"), inode=1, size=10, mtime_ns=20, valid=True)
+    write_validations(str(tmp_path), {check.path: check})
+    dir_mtime_ns = os.stat(tmp_path).st_mtime_ns
+
+    write_validations(str(tmp_path), {check.path: check})
+
+    assert os.stat(tmp_path).st_mtime_ns == dir_mtime_ns
+    assert read_validations(str(tmp_path)) == {check.path: check}
@@ -0,0 +1,108 @@
+import os
+import sqlite3
+
+import pytest
+from PIL import Image
+
+import publish
+from publish import MANIFEST_FILE_NAME, publish_batch, read_manifest, runs_dir, state_dir
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    directory = tmp_path / "uploads"
+    directory.mkdir()
+    (directory / "SPY_08_20_2026.csv").write_text("date,close\n2026-08-20,1\n")
+    return directory
+
+
+@pytest.fixture
+def batch_dir(tmp_path):
+    directory = tmp_path / "batch"
+    directory.mkdir()
+    (directory / "SPY_08_21_2026.csv").write_text("date,close\n2026-08-21,2\n2026-08-22,3\n")
+    Image.new("RGB", (4, 4), "red").save(directory / "chart_08_21_2026.png")
+    return directory
+
+
+def test_publish_swaps_the_data_directory_to_a_complete_run(data_dir, batch_dir):
+    manifest = publish_batch(str(data_dir), str(batch_dir), workers=1)
+
+    assert os.path.islink(data_dir)
+    active = os.path.realpath(data_dir)
+    assert os.path.dirname(active) == runs_dir(str(data_dir))
+    assert os.path.basename(active) == manifest["run_id"]
+    # The new run carries the previous files plus the batch.
+    assert {"SPY_08_20_2026.csv", "SPY_08_21_2026.csv", "chart_08_21_2026.png"} <= set(os.listdir(data_dir))
+    assert read_manifest(str(data_dir))["run_id"] == manifest["run_id"]
+    assert {staged["name"]: staged["rows"] for staged in manifest["files"]} == {
+        "SPY_08_21_2026.csv": 2,
+        "chart_08_21_2026.png": None,
+    }
+    assert manifest["previous_run_id"] is None
+
+
+def test_second_publish_records_the_previous_run(data_dir, batch_dir):
+    first = publish_batch(str(data_dir), str(batch_dir), workers=1)
+    second = publish_batch(str(data_dir), str(batch_dir), workers=1)
+
+    # Same batch within the same second still gets its own run.
+    assert second["run_id"] != first["run_id"]
+    assert second["previous_run_id"] == first["run_id"]
+    assert os.path.basename(os.path.realpath(data_dir)) == second["run_id"]
+    assert not [name for name in os.listdir(runs_dir(str(data_dir))) if name.endswith(".partial")]
+
+
+def test_invalid_batch_is_rejected_without_touching_the_data_directory(data_dir, batch_dir):
+    (batch_dir / "broken_08_21_2026.png").write_bytes(b"\x89PNG\r\n\x1a\ntruncated")
+
+    with pytest.raises(ValueError, match="broken_08_21_2026.png"):
+        publish_batch(str(data_dir), str(batch_dir), workers=1)
+
+    assert not os.path.islink(data_dir)
+    assert "SPY_08_21_2026.csv" not in os.listdir(data_dir)
+
+
+def test_unpublishable_names_are_rejected(data_dir, batch_dir):
+    (batch_dir / "~$lock.xlsx").write_bytes(b"")
+
+    with pytest.raises(ValueError, match="not a publishable file name"):
+        publish_batch(str(data_dir), str(batch_dir), workers=1)
+
+
+def test_failed_build_leaves_no_partial_run(data_dir, batch_dir, monkeypatch):
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(publish, "install_sidecars", fail)
+
+    with pytest.raises(OSError, match="disk full"):
+        publish_batch(str(data_dir), str(batch_dir), workers=1)
+
+    assert [name for name in os.listdir(runs_dir(str(data_dir))) if name.endswith(".partial")] == []
+    assert not [name for name in os.listdir(data_dir.parent) if name.startswith(".sidecars-")]
+
+
+def test_databases_move_to_shared_state_and_survive_publishes(data_dir, batch_dir):
+    ledger = data_dir / "trade_tracker.sqlite3"
+    with sqlite3.connect(ledger) as connection:
+        connection.execute("CREATE TABLE trades (ticker TEXT)")
+        connection.execute("INSERT INTO trades VALUES ('SPY')")
+    connection.close()
+
+    publish_batch(str(data_dir), str(batch_dir), workers=1)
+
+    shared = os.path.join(state_dir(str(data_dir)), "trade_tracker.sqlite3")
+    assert os.path.isfile(shared)
+    assert os.path.realpath(data_dir / "trade_tracker.sqlite3") == shared
+    with sqlite3.connect(data_dir / "trade_tracker.sqlite3") as connection:
+        connection.execute("INSERT INTO trades VALUES ('QQQ')")
+    connection.close()
+
+    publish_batch(str(data_dir), str(batch_dir), workers=1)
+
+    with sqlite3.connect(data_dir / "trade_tracker.sqlite3") as connection:
+        tickers = [row[0] for row in connection.execute("SELECT ticker FROM trades ORDER BY ticker")]
+    connection.close()
+    assert tickers == ["QQQ", "SPY"]
+    assert MANIFEST_FILE_NAME in os.listdir(data_dir)
@@ -0,0 +1,23 @@
+import os
+
+from scoreboard import TrendSummary, read_scoreboard, write_scoreboard
+
+
+def make_summary(path):
+    counts = dict.fromkeys(
+        ["bull_pct_rows", "bull_pct_0", "bull_pct_33", "bull_pct_67", "bull_pct_100"]
+        + [f"{timeframe}_{side}" for timeframe in ("daily", "weekly", "monthly") for side in ("bull", "bear")],
+        1,
+    )
+    return TrendSummary(path=path, size=10, mtime_ns=20, readable=True, rows=3, **counts)
+
+
+def test_rewriting_the_scoreboard_leaves_the_data_directory_mtime_alone(tmp_path):
+    summary = make_summary(str(tmp_path / "CURRENT_TREND_SUMMARY_08_21_2026.xlsx"))
+    write_scoreboard(str(tmp_path), {summary.path: summary})
+    dir_mtime_ns = os.stat(tmp_path).st_mtime_ns
+
+    write_scoreboard(str(tmp_path), {summary.path: summary})
+
+    assert os.stat(tmp_path).st_mtime_ns == dir_mtime_ns
+    assert read_scoreboard(str(tmp_path)) == {summary.path: summary}
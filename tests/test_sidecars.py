@@ -0,0 +1,42 @@
+import os
+
+import pandas as pd
+
+from sidecars import fresh_sidecar_path, ingest_sidecars, read_with_sidecar, sidecar_dir, write_sidecar_frame
+
+
+def write_csv(path, values, mtime):
+    pd.DataFrame({"value": values}).to_csv(path, index=False)
+    os.utime(path, (mtime, mtime))
+
+
+def test_stale_sidecar_is_ignored_and_pruned(tmp_path):
+    source = tmp_path / "SPY_08_21_2026.csv"
+    write_csv(source, [1, 2], 100)
+    assert ingest_sidecars(str(tmp_path))["written"] == 1
+    stale = fresh_sidecar_path(str(source))
+
+    write_csv(source, [1, 2, 3], 200)
+
+    assert fresh_sidecar_path(str(source)) is None
+    assert list(read_with_sidecar(str(source))["value"]) == [1, 2, 3]
+    counts = ingest_sidecars(str(tmp_path))
+    assert (counts["written"], counts["pruned"]) == (1, 1)
+    assert not os.path.exists(stale)
+    assert os.listdir(sidecar_dir(str(tmp_path))) == [os.path.basename(fresh_sidecar_path(str(source)))]
+
+
+def test_frame_that_does_not_round_trip_is_not_written(tmp_path, monkeypatch):
+    target = os.path.join(sidecar_dir(str(tmp_path)), "SPY_08_21_2026.csv.3-4.parquet")
+    # Parquet hands back something other than what was stored.
+    monkeypatch.setattr(pd, "read_parquet", lambda path: pd.DataFrame({"value": [None]}))
+
+    assert not write_sidecar_frame(pd.DataFrame({"value": [1.0]}), target)
+    assert os.listdir(sidecar_dir(str(tmp_path))) == []
+
+
+def test_frame_that_cannot_be_stored_is_not_written(tmp_path):
+    target = os.path.join(sidecar_dir(str(tmp_path)), "mixed.xlsx.3-4.parquet")
+
+    assert not write_sidecar_frame(pd.DataFrame({"value": [1, "one"]}), target)
+    assert os.listdir(sidecar_dir(str(tmp_path))) == []
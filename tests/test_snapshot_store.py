@@ -0,0 +1,70 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from snapshot_store import bull_pct_history, ingest_snapshots, snapshot_db_path, start_background_ingest, trend_streaks
+
+DATES = ("08_19_2026", "08_20_2026", "08_21_2026")
+
+
+def write_trend_summary(directory, date_token, msft_daily, mtime):
+    path = directory / f"CURRENT_TREND_SUMMARY_ALL_STOCKS_{date_token}.csv"
+    pd.DataFrame(
+        {
+            "Ticker": ["AAPL", "MSFT", "XOM"],
+            "Sector": ["Technology", "Technology", "Energy"],
+            "Industry": ["Hardware", "Software", "Oil"],
+            "DAILY_CURRENT_TREND": ["BULL", msft_daily, "BEAR"],
+            "WEEKLY_CURRENT_TREND": ["BULL", "BULL", "BEAR"],
+            "MONTHLY_CURRENT_TREND": ["BULL", "BULL", "BULL"],
+            "BULL_PCT": [100.0, 66.67, 33.33],
+        }
+    ).to_csv(path, index=False)
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    for offset, date_token in enumerate(DATES):
+        write_trend_summary(tmp_path, date_token, "BEAR" if date_token == DATES[-1] else "BULL", 100 + offset)
+    return tmp_path
+
+
+def test_ingest_then_query_history_and_streaks(data_dir):
+    counts = ingest_snapshots(str(data_dir))
+    db_path = snapshot_db_path(str(data_dir))
+
+    assert (counts["ingested"], counts["rows"], counts["failed"]) == (3, 9, 0)
+    history = bull_pct_history(db_path, "CURRENT_TREND_SUMMARY_ALL_STOCKS")
+    assert list(history["date"]) == ["2026-08-19", "2026-08-20", "2026-08-21"]
+    assert list(history["daily_bull"]) == [2, 2, 1]
+    assert list(history["tickers"]) == [3, 3, 3]
+    streaks = trend_streaks(db_path, min_snapshots=3)
+    assert list(streaks["ticker"]) == ["AAPL"]
+    assert list(streaks["streak"]) == [3]
+    assert list(streaks["since"]) == ["2026-08-19"]
+    assert list(trend_streaks(db_path, trend="BEAR", min_snapshots=1)["ticker"]) == ["XOM", "MSFT"]
+
+
+def test_second_ingest_reads_only_new_files(data_dir):
+    ingest_snapshots(str(data_dir))
+    write_trend_summary(data_dir, "08_24_2026", "BULL", 200)
+
+    counts = ingest_snapshots(str(data_dir))
+
+    assert (counts["ingested"], counts["unchanged"]) == (1, 3)
+    streaks = trend_streaks(snapshot_db_path(str(data_dir)), min_snapshots=1)
+    assert dict(zip(streaks["ticker"], streaks["streak"])) == {"AAPL": 4, "MSFT": 1}
+
+
+def test_background_ingest_runs_once_per_catalog(data_dir):
+    assert start_background_ingest(str(data_dir))
+    deadline = time.monotonic() + 30
+    # True while the thread runs; False once it finished this catalog version.
+    while start_background_ingest(str(data_dir)):
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+
+    assert len(bull_pct_history(snapshot_db_path(str(data_dir)), "CURRENT_TREND_SUMMARY_ALL_STOCKS")) == 3
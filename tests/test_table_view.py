@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from table_view import TableView
+
+
+@pytest.fixture
+def view():
+    df = pd.DataFrame(
+        {
+            "Ticker": ["AAPL", "XOM", "MSFT", "CVX", "JPM", "NVDA", "BAC"],
+            "Sector": ["Technology", "Energy", "Technology", "Energy", "Financial", "Technology", None],
+            "Industry": ["Hardware", "Oil", "Software", "Oil", "Banks", "Semis", "Banks"],
+            "YTD %": [12.0, -3.0, 8.5, np.nan, 20.0, 45.0, 5.0],
+        }
+    )
+    return TableView(df, group_columns=("sector", "industry"))
+
+
+def tickers(view, rows):
+    return list(view.column("Ticker").iloc[rows])
+
+
+def test_empty_selections_filter_nothing(view):
+    assert view.filter_rows({}) is None
+    assert view.filter_rows({"Sector": [], "Industry": []}) is None
+    assert len(view.rows(None)) == len(view)
+
+
+def test_filter_rows_intersects_selections_across_columns(view):
+    assert tickers(view, view.filter_rows({"Sector": ["Technology"]})) == ["AAPL", "MSFT", "NVDA"]
+    assert tickers(view, view.filter_rows({"Sector": ["Technology", "Energy"], "Industry": ["Oil", "Semis"]})) == [
+        "XOM",
+        "CVX",
+        "NVDA",
+    ]
+    assert len(view.filter_rows({"Sector": ["Utilities"]})) == 0
+
+
+def test_options_follow_the_parent_selection(view):
+    assert view.options("Sector", {}) == ["Energy", "Financial", "Technology"]
+    assert view.options("Industry", {"Sector": ["Technology"]}) == ["Hardware", "Semis", "Software"]
+    # Banks also occurs on a row without a sector, which the Financial selection excludes.
+    assert view.options("Industry", {"Sector": ["Financial"]}) == ["Banks"]
+
+
+def test_rows_sort_with_missing_values_last_in_both_directions(view):
+    assert tickers(view, view.rows(None, "YTD %")) == ["XOM", "BAC", "MSFT", "AAPL", "JPM", "NVDA", "CVX"]
+    assert tickers(view, view.rows(None, "YTD %", ascending=False)) == ["NVDA", "JPM", "AAPL", "MSFT", "BAC", "XOM", "CVX"]
+
+
+def test_rows_sort_only_the_filtered_rows(view):
+    filtered = view.filter_rows({"Sector": ["Technology"]})
+
+    assert tickers(view, view.rows(filtered, "YTD %", ascending=False)) == ["NVDA", "AAPL", "MSFT"]
+    assert tickers(view, view.rows(filtered)) == ["AAPL", "MSFT", "NVDA"]
+
+
+def test_page_slices_the_window_and_projects_columns(view):
+    rows = view.rows(None, "Ticker")
+
+    first = view.page(rows, ["Ticker", "YTD %"], page=0, page_size=3)
+    last = view.page(rows, None, page=2, page_size=3)
+
+    assert list(first.columns) == ["Ticker", "YTD %"]
+    assert list(first["Ticker"]) == ["AAPL", "BAC", "CVX"]
+    assert list(last["Ticker"]) == ["XOM"]
+    assert list(last.columns) == view.columns
+    assert view.page(rows, None, page=3, page_size=3).empty
@@ -0,0 +1,116 @@
+import pandas as pd
+import pytest
+
+import trade_analytics
+from trade_analytics import Trade, TradeAnalytics, apply_ledger_write, get_trade_analytics
+from trade_store import apply_editor_changes, fetch_trade_rows, load_trades, open_trade_store
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    pd.DataFrame(
+        {
+            "Date": ["2026-08-01", "2026-08-02", "2026-08-03"],
+            "Ticker": ["SPY", "QQQ", "SPY"],
+            "Call/Put": ["Call", "Put", "Call"],
+            "Buy Amount": [100.0, 200.0, 300.0],
+            "Sell Amount": [150.0, 150.0, 330.0],
+        }
+    ).to_excel(tmp_path / "trade_tracker.xlsx", index=False)
+    return open_trade_store(str(tmp_path))
+
+
+def rebuilt(db_path: str) -> TradeAnalytics:
+    version, rows = fetch_trade_rows(db_path)
+    return TradeAnalytics((Trade.from_row(row) for row in rows), version)
+
+
+def assert_same_analytics(actual: TradeAnalytics, expected: TradeAnalytics) -> None:
+    assert actual.version == expected.version
+    assert actual.trades == expected.trades
+    assert actual.totals.trades == expected.totals.trades
+    assert actual.totals.pnl == pytest.approx(expected.totals.pnl)
+    assert actual.totals.win_rate == pytest.approx(expected.totals.win_rate)
+    pd.testing.assert_frame_equal(actual.equity_curve(), expected.equity_curve())
+    pd.testing.assert_frame_equal(actual.breakdown_frame(), expected.breakdown_frame())
+    assert actual.path().max_drawdown == expected.path().max_drawdown
+
+
+def test_applied_write_matches_a_full_rebuild(db_path):
+    analytics = get_trade_analytics(db_path)
+    analytics.equity_curve()
+    _, row_ids = load_trades(db_path)
+
+    write = apply_editor_changes(
+        db_path,
+        row_ids,
+        {
+            "edited_rows": {1: {"Sell Amount": 260}},
+            "deleted_rows": [0],
+            "added_rows": [{"Date": "2026-08-04", "Ticker": "IWM", "Call/Put": "Put", "Buy Amount": 50, "Sell Amount": 40}],
+        },
+    )
+    apply_ledger_write(db_path, write)
+
+    assert get_trade_analytics(db_path) is analytics
+    assert_same_analytics(analytics, rebuilt(db_path))
+
+
+def test_write_appended_at_the_end_extends_the_equity_path(db_path):
+    analytics = get_trade_analytics(db_path)
+    path = analytics.path()
+    _, row_ids = load_trades(db_path)
+
+    write = apply_editor_changes(
+        db_path,
+        row_ids,
+        {"added_rows": [{"Date": "2026-08-05", "Ticker": "SPY", "Call/Put": "Call", "Buy Amount": 10, "Sell Amount": 5}]},
+    )
+    apply_ledger_write(db_path, write)
+
+    assert analytics.path() is path
+    assert path.longest_loss_streak == 1
+    assert_same_analytics(analytics, rebuilt(db_path))
+
+
+def test_write_after_another_writer_drops_the_cache(db_path):
+    analytics = get_trade_analytics(db_path)
+    _, row_ids = load_trades(db_path)
+    # Another process commits first, so this session's write is two versions ahead.
+    apply_editor_changes(db_path, row_ids, {"edited_rows": {2: {"Sell Amount": 100}}})
+    write = apply_editor_changes(db_path, row_ids, {"deleted_rows": [0]})
+
+    apply_ledger_write(db_path, write)
+
+    assert db_path not in trade_analytics._analytics
+    fresh = get_trade_analytics(db_path)
+    assert fresh is not analytics
+    assert_same_analytics(fresh, rebuilt(db_path))
+
+
+def test_write_that_raced_a_later_commit_drops_the_cache(db_path):
+    get_trade_analytics(db_path)
+    _, row_ids = load_trades(db_path)
+    write = apply_editor_changes(db_path, row_ids, {"edited_rows": {0: {"Ticker": "DIA"}}})
+    # A later commit lands before this session folds its own write in.
+    apply_editor_changes(db_path, row_ids, {"edited_rows": {0: {"Ticker": "XLF"}}})
+
+    apply_ledger_write(db_path, write)
+
+    assert db_path not in trade_analytics._analytics
+    assert {trade.ticker for trade in get_trade_analytics(db_path).trades.values()} == {"XLF", "QQQ", "SPY"}
+
+
+def test_placeholder_edits_preview_what_the_save_stores(tmp_path):
+    db_path = open_trade_store(str(tmp_path))
+    analytics = get_trade_analytics(db_path)
+    # The editor shows one placeholder row (id None) with 0.0 amounts for an empty ledger.
+    changes = {"edited_rows": {0: {"Ticker": "SPY", "Sell Amount": 25}}, "added_rows": [{"Ticker": ""}]}
+
+    preview = analytics.preview_totals(analytics.editor_changes([None], changes))
+    apply_ledger_write(db_path, apply_editor_changes(db_path, [None], changes))
+
+    assert (preview.trades, preview.buy, preview.sell) == (1, 0.0, 25.0)
+    saved = get_trade_analytics(db_path).totals
+    assert (saved.trades, saved.buy, saved.sell) == (preview.trades, preview.buy, preview.sell)
+    assert list(load_trades(db_path)[0]["Ticker"]) == ["SPY"]
@@ -0,0 +1,93 @@
+import pandas as pd
+import pytest
+
+from trade_store import apply_editor_changes, import_xlsx, load_trades, open_trade_store, read_ledger_version
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    pd.DataFrame(
+        {
+            "Date": ["2026-08-01", "2026-08-02", "2026-08-03"],
+            "Ticker": ["SPY", "QQQ", "IWM"],
+            "Call/Put": ["Call", "Put", "Call"],
+            "Buy Amount": [100.0, 200.0, 300.0],
+            "Sell Amount": [150.0, None, 250.0],
+        }
+    ).to_excel(tmp_path / "trade_tracker.xlsx", index=False)
+    return open_trade_store(str(tmp_path))
+
+
+def test_open_trade_store_seeds_from_the_legacy_xlsx(db_path):
+    df, row_ids = load_trades(db_path)
+
+    assert list(df["Ticker"]) == ["SPY", "QQQ", "IWM"]
+    assert len(set(row_ids)) == 3
+    assert pd.isna(df.loc[1, "Sell Amount"])
+    assert read_ledger_version(db_path) == 1
+
+
+def test_editor_diff_updates_deletes_and_inserts_only_touched_rows(db_path):
+    _, row_ids = load_trades(db_path)
+    changes = {
+        "edited_rows": {0: {"Sell Amount": "175"}, 2: {"Ticker": "DIA"}},
+        "deleted_rows": [1],
+        "added_rows": [{"Date": "2026-08-04", "Ticker": " TSLA ", "Buy Amount": 50}],
+    }
+
+    write = apply_editor_changes(db_path, row_ids, changes)
+
+    assert write.version == 2
+    assert write.updated_ids == (row_ids[0], row_ids[2])
+    assert write.deleted_ids == (row_ids[1],)
+    assert len(write.inserted_ids) == 1
+    df, new_ids = load_trades(db_path)
+    assert list(df["Ticker"]) == ["SPY", "DIA", "TSLA"]
+    assert df.loc[0, "Sell Amount"] == 175.0
+    assert new_ids == [row_ids[0], row_ids[2], write.inserted_ids[0]]
+
+
+def test_edit_of_a_deleted_row_is_dropped(db_path):
+    _, row_ids = load_trades(db_path)
+
+    write = apply_editor_changes(db_path, row_ids, {"edited_rows": {"1": {"Ticker": "XLE"}}, "deleted_rows": [1]})
+
+    assert write.updated_ids == ()
+    assert "XLE" not in list(load_trades(db_path)[0]["Ticker"])
+
+
+def test_edits_to_placeholder_rows_become_inserts_and_blank_rows_are_skipped(db_path):
+    _, row_ids = load_trades(db_path)
+
+    write = apply_editor_changes(
+        db_path,
+        [*row_ids, None, None],
+        {"edited_rows": {"3": {"Ticker": "NVDA"}, "4": {"Ticker": ""}}, "added_rows": [{}]},
+    )
+
+    assert len(write.inserted_ids) == 1
+    assert list(load_trades(db_path)[0]["Ticker"]) == ["SPY", "QQQ", "IWM", "NVDA"]
+
+
+def test_rows_deleted_by_another_session_are_skipped(db_path):
+    _, row_ids = load_trades(db_path)
+    apply_editor_changes(db_path, row_ids, {"deleted_rows": [0]})
+
+    # A second session still shows the old rows and edits the one that is gone.
+    write = apply_editor_changes(db_path, row_ids, {"edited_rows": {0: {"Ticker": "GONE"}}, "deleted_rows": [0]})
+
+    assert write.updated_ids == ()
+    assert write.deleted_ids == ()
+    assert write.version == 3
+    assert list(load_trades(db_path)[0]["Ticker"]) == ["QQQ", "IWM"]
+
+
+def test_import_replace_swaps_the_ledger(db_path, tmp_path):
+    _, row_ids = load_trades(db_path)
+    source = tmp_path / "other.xlsx"
+    pd.DataFrame({"Date": ["2026-09-01"], "Ticker": ["GLD"], "Call/Put": ["Call"], "Buy Amount": [10], "Sell Amount": [12]}).to_excel(source, index=False)
+
+    write = import_xlsx(db_path, str(source), replace=True)
+
+    assert sorted(write.deleted_ids) == sorted(row_ids)
+    assert list(load_trades(db_path)[0]["Ticker"]) == ["GLD"]
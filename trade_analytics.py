@@ -0,0 +1,335 @@
+import functools
+import threading
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+
+import pandas as pd
+
+from trade_store import PLACEHOLDER_ROW, TRADE_COLUMNS, LedgerWrite, cell_value, fetch_trade_rows, is_blank_row, read_ledger_version
+
+DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%m-%d-%Y")
+# The browser only needs enough points to draw the curve's shape.
+EQUITY_CHART_POINTS = 2000
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_trade_date(text: str) -> date | None:
+    text = (text or "").strip()[:10]
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+@dataclass(frozen=True)
+class Trade:
+    trade_id: int | None
+    trade_date: str
+    ticker: str
+    call_put: str
+    buy_amount: float | None
+    sell_amount: float | None
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "Trade":
+        return cls(*row)
+
+    @classmethod
+    def from_editor(cls, trade_id: int | None, cells: dict) -> "Trade":
+        return cls(trade_id, **{name: cell_value(column, cells.get(column)) for column, name in TRADE_COLUMNS.items()})
+
+    def with_edits(self, edits: dict) -> "Trade":
+        return replace(self, **{TRADE_COLUMNS[column]: cell_value(column, value) for column, value in edits.items() if column in TRADE_COLUMNS})
+
+    @property
+    def closed(self) -> bool:
+        # Same rule as the Live Summary: a trade counts once both amounts are known.
+        return self.buy_amount is not None and self.sell_amount is not None
+
+    @property
+    def pnl(self) -> float:
+        return self.sell_amount - self.buy_amount
+
+    @property
+    def pct_gain(self) -> float | None:
+        if not self.closed or self.buy_amount == 0:
+            return None
+        return self.pnl / self.buy_amount * 100
+
+    @property
+    def sort_key(self) -> tuple[date, int]:
+        # Undated trades follow every dated one, in entry order.
+        return (parse_trade_date(self.trade_date) or date.max, self.trade_id or 0)
+
+
+@dataclass
+class TradeTotals:
+    """Additive counters over closed trades; adding or removing one trade is O(1)."""
+
+    trades: int = 0
+    buy: float = 0.0
+    sell: float = 0.0
+    gain_sum: float = 0.0
+    gain_count: int = 0
+    wins: int = 0
+
+    def add(self, trade: Trade, sign: int = 1) -> None:
+        if not trade.closed:
+            return
+        self.trades += sign
+        self.buy += sign * trade.buy_amount
+        self.sell += sign * trade.sell_amount
+        gain = trade.pct_gain
+        if gain is not None:
+            self.gain_sum += sign * gain
+            self.gain_count += sign
+            if gain > 0:
+                self.wins += sign
+
+    @property
+    def pnl(self) -> float:
+        return self.sell - self.buy
+
+    @property
+    def avg_gain(self) -> float:
+        return self.gain_sum / self.gain_count if self.gain_count else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.trades * 100 if self.trades else 0.0
+
+
+@dataclass
+class EquityPath:
+    """Running equity curve state over closed trades in date order."""
+
+    keys: list[tuple[date, int]] = field(default_factory=list)
+    trade_ids: list[int] = field(default_factory=list)
+    pnl: list[float] = field(default_factory=list)
+    equity: list[float] = field(default_factory=list)
+    drawdown: list[float] = field(default_factory=list)
+    peak: float = 0.0
+    max_drawdown: float = 0.0
+    streak: int = 0
+    longest_win_streak: int = 0
+    longest_loss_streak: int = 0
+
+    def append(self, trade: Trade) -> None:
+        equity = (self.equity[-1] if self.equity else 0.0) + trade.pnl
+        self.peak = max(self.peak, equity)
+        drawdown = equity - self.peak
+        self.max_drawdown = min(self.max_drawdown, drawdown)
+        if trade.pnl > 0:
+            self.streak = self.streak + 1 if self.streak > 0 else 1
+            self.longest_win_streak = max(self.longest_win_streak, self.streak)
+        elif trade.pnl < 0:
+            self.streak = self.streak - 1 if self.streak < 0 else -1
+            self.longest_loss_streak = max(self.longest_loss_streak, -self.streak)
+        else:
+            self.streak = 0
+        self.keys.append(trade.sort_key)
+        self.trade_ids.append(trade.trade_id)
+        self.pnl.append(trade.pnl)
+        self.equity.append(equity)
+        self.drawdown.append(drawdown)
+
+
+class TradeAnalytics:
+    """Ledger analytics kept current one trade at a time.
+
+    Totals and the Call/Put x ticker breakdown update in O(1) per changed
+    trade. The equity curve, drawdown and streaks also extend in O(1) when a
+    trade lands at the end of the timeline; any other change to a closed
+    trade marks the path stale and it is replayed on the next read.
+    Instances are shared between sessions, so every method takes the lock.
+    """
+
+    def __init__(self, trades=(), version: int = 0):
+        self._lock = threading.RLock()
+        self.version = version
+        self.trades: dict[int, Trade] = {}
+        self.totals = TradeTotals()
+        self.breakdown: dict[tuple[str, str], TradeTotals] = {}
+        self._path: EquityPath | None = EquityPath()
+        self._frames: dict[str, pd.DataFrame] = {}
+        for trade in sorted(trades, key=lambda trade: trade.sort_key):
+            self._upsert(trade)
+
+    def _count(self, trade: Trade, sign: int) -> None:
+        self.totals.add(trade, sign)
+        group = (trade.call_put or "-", trade.ticker.upper() or "-")
+        totals = self.breakdown.setdefault(group, TradeTotals())
+        totals.add(trade, sign)
+        if totals.trades == 0 and sign < 0:
+            del self.breakdown[group]
+
+    def upsert(self, trade: Trade) -> None:
+        with self._lock:
+            self._upsert(trade)
+
+    def _upsert(self, trade: Trade) -> None:
+        previous = self.trades.pop(trade.trade_id, None)
+        if previous is not None:
+            self._count(previous, -1)
+        self.trades[trade.trade_id] = trade
+        self._count(trade, 1)
+        self._frames.clear()
+        if self._path is None:
+            return
+        if previous is not None and previous.closed:
+            self._path = None
+        elif trade.closed:
+            if self._path.keys and trade.sort_key < self._path.keys[-1]:
+                self._path = None
+            else:
+                self._path.append(trade)
+
+    def delete(self, trade_id: int) -> None:
+        with self._lock:
+            previous = self.trades.pop(trade_id, None)
+            if previous is None:
+                return
+            self._count(previous, -1)
+            self._frames.clear()
+            if previous.closed:
+                self._path = None
+
+    def path(self) -> EquityPath:
+        with self._lock:
+            if self._path is None:
+                path = EquityPath()
+                for trade in sorted((trade for trade in self.trades.values() if trade.closed), key=lambda trade: trade.sort_key):
+                    path.append(trade)
+                self._path = path
+            return self._path
+
+    def equity_curve(self) -> pd.DataFrame:
+        with self._lock:
+            return self._equity_curve()
+
+    def _equity_curve(self) -> pd.DataFrame:
+        if "equity" not in self._frames:
+            path = self.path()
+            trades = [self.trades[trade_id] for trade_id in path.trade_ids]
+            self._frames["equity"] = pd.DataFrame(
+                {
+                    "Trade": range(1, len(trades) + 1),
+                    "Date": [trade.trade_date for trade in trades],
+                    "Ticker": [trade.ticker for trade in trades],
+                    "P/L": path.pnl,
+                    "Equity": path.equity,
+                    "Drawdown": path.drawdown,
+                }
+            )
+        return self._frames["equity"]
+
+    def equity_chart_frame(self) -> pd.DataFrame:
+        """The equity curve thinned to EQUITY_CHART_POINTS, keeping each bucket's last equity and deepest drawdown."""
+        with self._lock:
+            if "equity_chart" not in self._frames:
+                curve = self._equity_curve()[["Trade", "Equity", "Drawdown"]]
+                if len(curve) > EQUITY_CHART_POINTS:
+                    buckets = curve["Trade"].sub(1) * EQUITY_CHART_POINTS // len(curve)
+                    curve = curve.groupby(buckets).agg({"Trade": "last", "Equity": "last", "Drawdown": "min"})
+                self._frames["equity_chart"] = curve.set_index("Trade")
+            return self._frames["equity_chart"]
+
+    def breakdown_frame(self) -> pd.DataFrame:
+        with self._lock:
+            return self._breakdown_frame()
+
+    def _breakdown_frame(self) -> pd.DataFrame:
+        if "breakdown" not in self._frames:
+            rows = [
+                {
+                    "Call/Put": call_put,
+                    "Ticker": ticker,
+                    "Trades": totals.trades,
+                    "Total P/L": round(totals.pnl, 2),
+                    "Average % Gain": round(totals.avg_gain, 2),
+                    "Win Rate": round(totals.win_rate, 2),
+                }
+                for (call_put, ticker), totals in self.breakdown.items()
+                if totals.trades
+            ]
+            frame = pd.DataFrame(rows, columns=["Call/Put", "Ticker", "Trades", "Total P/L", "Average % Gain", "Win Rate"])
+            self._frames["breakdown"] = frame.sort_values("Total P/L", ascending=False, ignore_index=True)
+        return self._frames["breakdown"]
+
+    def editor_changes(self, row_ids: list[int | None], changes: dict) -> list[tuple[Trade | None, Trade | None]]:
+        """Turn a ``st.data_editor`` diff into (old, new) trade pairs against the current ledger."""
+        pairs: list[tuple[Trade | None, Trade | None]] = []
+        deleted_positions = set(changes.get("deleted_rows", []))
+        with self._lock:
+            for position in deleted_positions:
+                pairs.append((self.trades.get(row_ids[position]), None))
+            for position, edits in changes.get("edited_rows", {}).items():
+                position = int(position)
+                if position in deleted_positions:
+                    continue
+                if row_ids[position] is None:
+                    # A placeholder row keeps its displayed values in the cells the diff leaves out.
+                    pairs.append((None, new_trade({**PLACEHOLDER_ROW, **edits})))
+                    continue
+                old = self.trades.get(row_ids[position])
+                pairs.append((old, old.with_edits(edits) if old else None))
+        pairs.extend((None, new_trade(row)) for row in changes.get("added_rows", []))
+        return pairs
+
+    def preview_totals(self, changes: list[tuple[Trade | None, Trade | None]]) -> TradeTotals:
+        """Totals as if each (old, new) pair were applied, without touching the ledger state.
+
+        Costs O(len(changes)), so the Live Summary can follow every keystroke.
+        """
+        with self._lock:
+            totals = replace(self.totals)
+        for old, new in changes:
+            if old is not None:
+                totals.add(old, -1)
+            if new is not None:
+                totals.add(new, 1)
+        return totals
+
+
+def new_trade(row: dict) -> Trade | None:
+    # Blank rows are skipped on save, so they must not count in the preview either.
+    return None if is_blank_row(row) else Trade.from_editor(None, row)
+
+
+_analytics_lock = threading.Lock()
+_analytics: dict[str, TradeAnalytics] = {}
+
+
+def get_trade_analytics(db_path: str) -> TradeAnalytics:
+    """Return process-wide analytics for ``db_path``, rebuilding only when another writer moved the ledger."""
+    version = read_ledger_version(db_path)
+    with _analytics_lock:
+        analytics = _analytics.get(db_path)
+        if analytics is not None and analytics.version == version:
+            return analytics
+    version, rows = fetch_trade_rows(db_path)
+    analytics = TradeAnalytics((Trade.from_row(row) for row in rows), version)
+    with _analytics_lock:
+        _analytics[db_path] = analytics
+    return analytics
+
+
+def apply_ledger_write(db_path: str, write: LedgerWrite) -> None:
+    """Fold a committed write into the cached analytics, re-reading only the rows it touched."""
+    with _analytics_lock:
+        analytics = _analytics.get(db_path)
+        if analytics is None or analytics.version != write.version - 1:
+            # Another writer committed in between; the next read rebuilds.
+            _analytics.pop(db_path, None)
+            return
+        version, rows = fetch_trade_rows(db_path, [*write.inserted_ids, *write.updated_ids])
+        if version != write.version:
+            _analytics.pop(db_path, None)
+            return
+        for trade_id in write.deleted_ids:
+            analytics.delete(trade_id)
+        for trade in sorted(map(Trade.from_row, rows), key=lambda trade: trade.sort_key):
+            analytics.upsert(trade)
+        analytics.version = write.version
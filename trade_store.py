@@ -0,0 +1,240 @@
+import argparse
+import io
+import os
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+
+import pandas as pd
+
+import sqlite_store
+
+TRADE_DB_FILE_NAME = "trade_tracker.sqlite3"
+TRADE_XLSX_FILE_NAME = "trade_tracker.xlsx"
+# Editor column -> SQLite column. "% Gain" is derived, never stored.
+TRADE_COLUMNS = {
+    "Date": "trade_date",
+    "Ticker": "ticker",
+    "Call/Put": "call_put",
+    "Buy Amount": "buy_amount",
+    "Sell Amount": "sell_amount",
+}
+NUMERIC_COLUMNS = ("Buy Amount", "Sell Amount")
+# What the editor shows for an empty ledger (row id None). Edits to it only
+# carry the touched cells; the rest keep these displayed values.
+PLACEHOLDER_ROW = {"Date": "", "Ticker": "", "Call/Put": "", "Buy Amount": 0.0, "Sell Amount": 0.0}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    trade_date TEXT NOT NULL DEFAULT '',
+    ticker TEXT NOT NULL DEFAULT '',
+    call_put TEXT NOT NULL DEFAULT '',
+    buy_amount REAL,
+    sell_amount REAL,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+@dataclass(frozen=True)
+class LedgerWrite:
+    """Rows touched by one committed write and the ledger version it produced."""
+
+    version: int
+    inserted_ids: tuple[int, ...] = ()
+    updated_ids: tuple[int, ...] = ()
+    deleted_ids: tuple[int, ...] = ()
+
+
+def trade_db_path(data_dir: str) -> str:
+    return os.path.join(data_dir, TRADE_DB_FILE_NAME)
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    return sqlite_store.connect(db_path, SCHEMA)
+
+
+def ledger_version(connection: sqlite3.Connection) -> int:
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def bump_ledger_version(connection: sqlite3.Connection) -> int:
+    # Called inside the write transaction, so the version moves exactly once per commit.
+    version = ledger_version(connection) + 1
+    connection.execute(f"PRAGMA user_version = {version}")
+    return version
+
+
+def read_ledger_version(db_path: str) -> int:
+    with closing(connect(db_path)) as connection:
+        return ledger_version(connection)
+
+
+def cell_value(column: str, value):
+    """Normalise an editor or spreadsheet cell for storage."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None if column in NUMERIC_COLUMNS else ""
+    if column in NUMERIC_COLUMNS:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    if isinstance(value, pd.Timestamp):
+        return value.date().isoformat()
+    return str(value).strip()
+
+
+def is_blank_row(row: dict) -> bool:
+    return all(cell_value(column, row.get(column)) in ("", None, 0.0) for column in TRADE_COLUMNS)
+
+
+def insert_rows(connection: sqlite3.Connection, rows: list[dict]) -> list[int]:
+    statement = f"INSERT INTO trades ({', '.join(TRADE_COLUMNS.values())}) VALUES ({', '.join('?' * len(TRADE_COLUMNS))})"
+    inserted_ids = []
+    for row in rows:
+        if not is_blank_row(row):
+            cursor = connection.execute(statement, tuple(cell_value(column, row.get(column)) for column in TRADE_COLUMNS))
+            inserted_ids.append(cursor.lastrowid)
+    return inserted_ids
+
+
+def import_xlsx(db_path: str, source, replace: bool = False) -> LedgerWrite:
+    """Append (or, with ``replace``, swap in) the trades of an xlsx ledger."""
+    df = pd.read_excel(source)
+    with closing(connect(db_path)) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            deleted_ids = ()
+            if replace:
+                deleted_ids = tuple(row[0] for row in connection.execute("SELECT id FROM trades"))
+                connection.execute("DELETE FROM trades")
+            inserted_ids = insert_rows(connection, df.to_dict("records"))
+            version = bump_ledger_version(connection)
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+    return LedgerWrite(version, tuple(inserted_ids), deleted_ids=deleted_ids)
+
+
+def open_trade_store(data_dir: str) -> str:
+    """Return the ledger database path, seeding it from trade_tracker.xlsx on first use."""
+    db_path = trade_db_path(data_dir)
+    if os.path.exists(db_path):
+        return db_path
+    xlsx_path = os.path.join(data_dir, TRADE_XLSX_FILE_NAME)
+    if os.path.exists(xlsx_path):
+        try:
+            import_xlsx(db_path, xlsx_path)
+        except Exception:
+            # An unreadable legacy ledger starts an empty store, as before.
+            pass
+    with closing(connect(db_path)):
+        pass
+    return db_path
+
+
+def fetch_trade_rows(db_path: str, trade_ids: list[int] | None = None) -> tuple[int, list[tuple]]:
+    """Return the ledger version and (id, *TRADE_COLUMNS) rows, optionally only ``trade_ids``."""
+    query = f"SELECT id, {', '.join(TRADE_COLUMNS.values())} FROM trades"
+    with closing(connect(db_path)) as connection:
+        connection.execute("BEGIN")
+        try:
+            version = ledger_version(connection)
+            if trade_ids is None:
+                rows = connection.execute(f"{query} ORDER BY id").fetchall()
+            else:
+                rows = []
+                for start in range(0, len(trade_ids), 500):
+                    chunk = trade_ids[start:start + 500]
+                    rows += connection.execute(f"{query} WHERE id IN ({', '.join('?' * len(chunk))})", chunk).fetchall()
+        finally:
+            connection.execute("COMMIT")
+    return version, rows
+
+
+def load_trades(db_path: str) -> tuple[pd.DataFrame, list[int]]:
+    """Return the ledger in editor columns plus the row ids in the same order."""
+    _, rows = fetch_trade_rows(db_path)
+    df = pd.DataFrame([row[1:] for row in rows], columns=list(TRADE_COLUMNS))
+    df[list(NUMERIC_COLUMNS)] = df[list(NUMERIC_COLUMNS)].astype(float)
+    return df, [row[0] for row in rows]
+
+
+def apply_editor_changes(db_path: str, row_ids: list[int | None], changes: dict) -> LedgerWrite:
+    """Apply a ``st.data_editor`` diff as row-level writes in one transaction.
+
+    ``row_ids`` maps editor row positions to trade ids (None for placeholder
+    rows). Rows another session deleted in the meantime are skipped.
+    """
+    updated_ids: list[int] = []
+    deleted_ids: list[int] = []
+    deleted_positions = set(changes.get("deleted_rows", []))
+    new_rows = list(changes.get("added_rows", []))
+    with closing(connect(db_path)) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for position in deleted_positions:
+                if row_ids[position] is not None:
+                    cursor = connection.execute("DELETE FROM trades WHERE id = ?", (row_ids[position],))
+                    if cursor.rowcount:
+                        deleted_ids.append(row_ids[position])
+            for position, edits in changes.get("edited_rows", {}).items():
+                position = int(position)
+                if position in deleted_positions:
+                    continue
+                row_id = row_ids[position]
+                if row_id is None:
+                    new_rows.append({**PLACEHOLDER_ROW, **edits})
+                    continue
+                assignments = {TRADE_COLUMNS[column]: cell_value(column, value) for column, value in edits.items() if column in TRADE_COLUMNS}
+                if not assignments:
+                    continue
+                cursor = connection.execute(
+                    f"UPDATE trades SET {', '.join(f'{name} = ?' for name in assignments)}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    (*assignments.values(), row_id),
+                )
+                if cursor.rowcount:
+                    updated_ids.append(row_id)
+            inserted_ids = insert_rows(connection, new_rows)
+            version = bump_ledger_version(connection)
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+    return LedgerWrite(version, tuple(inserted_ids), tuple(updated_ids), tuple(deleted_ids))
+
+
+def export_xlsx_bytes(db_path: str) -> bytes:
+    df, _ = load_trades(db_path)
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import or export the trade tracker ledger as xlsx.")
+    parser.add_argument(
+        "data_dir",
+        nargs="?",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads"),
+    )
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--import-xlsx", metavar="PATH", help="Append the trades of an xlsx ledger.")
+    action.add_argument("--export-xlsx", metavar="PATH", help="Write the ledger to an xlsx file.")
+    parser.add_argument("--replace", action="store_true", help="With --import-xlsx, replace the ledger instead of appending.")
+    args = parser.parse_args()
+
+    db_path = open_trade_store(args.data_dir)
+    if args.import_xlsx:
+        write = import_xlsx(db_path, args.import_xlsx, replace=args.replace)
+        print(f"{len(write.inserted_ids)} trades imported into {db_path}")
+    else:
+        with open(args.export_xlsx, "wb") as f:
+            f.write(export_xlsx_bytes(db_path))
+        print(f"Ledger exported to {args.export_xlsx}")
+
+
+if __name__ == "__main__":
+    main()
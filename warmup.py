@@ -0,0 +1,176 @@
+import argparse
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from asset_catalog import AssetCatalog, get_asset_catalog
+from frame_cache import FRAME_CACHE, file_cache_key
+from scoreboard import SUMMARY_FAMILY_PREFIX, TrendSummary, store_trend_summaries, summarize_trend_frame
+from sidecars import read_with_sidecar, sidecar_path, write_sidecar_frame
+
+WARMUP_EXTENSIONS = {".xlsx": "excel", ".csv": "csv"}
+STOP_TIMEOUT_SECONDS = 10.0
+
+# Set at interpreter exit: running warm-ups stop handing out files.
+_stopping = threading.Event()
+
+
+def warmup_workers() -> int:
+    return max(1, int(os.environ.get("DASHBOARD_WARMUP_WORKERS", 0)) or os.cpu_count() or 1)
+
+
+def warmup_paths(catalog: AssetCatalog) -> list[str]:
+    """Latest xlsx/csv of every family, the files the tabs open on a first page load."""
+    paths = []
+    for extension in WARMUP_EXTENSIONS:
+        for family in catalog.families("", extension):
+            for path in (catalog.latest(family, extension), catalog.latest_folded(family, extension)):
+                if path and path not in paths:
+                    paths.append(path)
+    return paths
+
+
+def parse_upload(path: str) -> tuple[str, int, int, pd.DataFrame | None, TrendSummary | None]:
+    """Worker: parse one upload, write its Parquet sidecar and, for trend summaries, its scoreboard row."""
+    stat_result = os.stat(path)
+    target = sidecar_path(path, stat_result)
+    fresh = os.path.exists(target)
+    try:
+        df = read_with_sidecar(path)
+    except Exception:
+        return path, stat_result.st_size, stat_result.st_mtime_ns, None, None
+    if not fresh:
+        after = os.stat(path)
+        # Name the sidecar after the version that was parsed, never one rewritten meanwhile.
+        if (after.st_size, after.st_mtime_ns) == (stat_result.st_size, stat_result.st_mtime_ns):
+            write_sidecar_frame(df, target)
+    summary = None
+    if os.path.basename(path).startswith(SUMMARY_FAMILY_PREFIX) and path.lower().endswith(".xlsx"):
+        summary = summarize_trend_frame(df, path, stat_result.st_size, stat_result.st_mtime_ns)
+    return path, stat_result.st_size, stat_result.st_mtime_ns, df, summary
+
+
+def run_warmup(data_dir: str, workers: int | None = None) -> dict[str, int]:
+    """Parse every uncached upload into the shared frame cache, its sidecar and the scoreboard.
+
+    Files are fanned out over a process pool; sessions that ask for a file
+    still in flight wait for its result instead of parsing it a second time.
+    """
+    counts = {"parsed": 0, "cached": 0, "failed": 0}
+    workers = workers or warmup_workers()
+    futures: dict[str, tuple[tuple, Future]] = {}
+    for path in warmup_paths(get_asset_catalog(data_dir)):
+        try:
+            key = file_cache_key(path, WARMUP_EXTENSIONS[os.path.splitext(path)[1].lower()])
+        except OSError:
+            continue
+        if FRAME_CACHE.contains(key) or FRAME_CACHE.pending(key) is not None:
+            counts["cached"] += 1
+            continue
+        future = Future()
+        FRAME_CACHE.expect(key, future)
+        futures[path] = (key, future)
+    if not futures:
+        return counts
+
+    summaries = {}
+
+    def publish(path: str, size: int, mtime_ns: int, df: pd.DataFrame | None, summary: TrendSummary | None) -> None:
+        key, future = futures[path]
+        # Only cache what matches the key; a file rewritten meanwhile is re-read on demand.
+        if df is not None and (size, mtime_ns) == key[1:3]:
+            FRAME_CACHE.put(key, df)
+            counts["parsed"] += 1
+            if summary is not None:
+                summaries[path] = summary
+        else:
+            df = None
+            counts["failed"] += 1
+        future.set_result(df)
+
+    try:
+        if workers > 1 and len(futures) > 1:
+            # spawn, not fork: forking a process that runs Streamlit's threads can deadlock.
+            with ProcessPoolExecutor(min(workers, len(futures)), mp_context=multiprocessing.get_context("spawn")) as executor:
+                submitted = {executor.submit(parse_upload, path): path for path in futures}
+                for done in as_completed(submitted):
+                    if _stopping.is_set():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+                    try:
+                        publish(*done.result())
+                    except Exception:
+                        publish(submitted[done], -1, -1, None, None)
+        else:
+            for path in futures:
+                if _stopping.is_set():
+                    break
+                try:
+                    publish(*parse_upload(path))
+                except Exception:
+                    publish(path, -1, -1, None, None)
+    finally:
+        for _, future in futures.values():
+            if not future.done():
+                future.set_result(None)
+    if summaries:
+        store_trend_summaries(data_dir, summaries)
+    return counts
+
+
+_warmup_lock = threading.Lock()
+_warmups: dict[str, tuple[threading.Thread, object]] = {}
+
+
+def start_warmup(data_dir: str) -> bool:
+    """Warm the caches on a daemon thread, once per catalog version; return whether one is running."""
+    if os.environ.get("DASHBOARD_WARMUP", "1") == "0" or _stopping.is_set():
+        return False
+    catalog = get_asset_catalog(data_dir)
+    with _warmup_lock:
+        thread, warmed_catalog = _warmups.get(data_dir, (None, None))
+        if thread is not None and thread.is_alive():
+            return True
+        if warmed_catalog is catalog:
+            return False
+        thread = threading.Thread(target=run_warmup, args=(data_dir,), name="cache-warmup", daemon=True)
+        thread.start()
+        _warmups[data_dir] = (thread, catalog)
+    return True
+
+
+def stop_warmups() -> None:
+    """Stop the warm-ups between files and wait for them, so none is still parsing at interpreter shutdown."""
+    _stopping.set()
+    with _warmup_lock:
+        threads = [thread for thread, _ in _warmups.values()]
+    for thread in threads:
+        thread.join(STOP_TIMEOUT_SECONDS)
+
+
+atexit.register(stop_warmups)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time a full parse of the latest uploads, as the server warm-up does.")
+    parser.add_argument(
+        "data_dir",
+        nargs="?",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads"),
+    )
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (default: DASHBOARD_WARMUP_WORKERS or the CPU count).")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = run_warmup(args.data_dir, args.workers or None)
+    elapsed = time.perf_counter() - started
+    print(f"{counts['parsed']} parsed, {counts['cached']} already cached, {counts['failed']} failed in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,32 @@
 import streamlit as st
 import streamlit.components.v1 as components
 import base64
+import json
+import time
 import pandas as pd
 import os
 from datetime import date, timedelta
-import glob
-import re
+from urllib.parse import urlsplit
+
+from asset_catalog import AssetCatalog, current_version, get_asset_catalog, page_number
+from blob_store import dedupe_images
+from chart_rendering import BarChartStyle, chart_stats, render_bar_chart
+from data_watcher import start_data_watcher
+from dataset_bundle import DatasetBundle
+from donut_charts import DONUT_CELL_HEIGHT, bull_pct_donut_grid_html, bull_pct_donut_svg, slice_paths
+from frame_cache import FRAME_CACHE
+from image_derivatives import CONTAINER_WIDTH, ensure_derivative
+from image_server import DEFAULT_HOST as IMAGE_SERVER_DEFAULT_HOST, DEFAULT_PORT as IMAGE_SERVER_DEFAULT_PORT, image_url_path, start_image_server
+from instrumentation import measure, note, section, start_profile, stop_profile, timed
+from page_runs import archive_superseded_runs
+from png_validation import check_png, flush_validations
+from publish import read_manifest
+from table_view import PAGE_SIZES, TableView
+from snapshot_store import bull_pct_history, snapshot_db_path, start_background_ingest, trend_streaks
+from scoreboard import MISSING_SCORE, BULL_PCT_LABELS, TrendSummary, summarize_trend_frame
+from trade_analytics import TradeAnalytics, apply_ledger_write, get_trade_analytics
+from trade_store import PLACEHOLDER_ROW, TRADE_XLSX_FILE_NAME, apply_editor_changes, export_xlsx_bytes, import_xlsx, load_trades, open_trade_store
+from warmup import start_warmup
 
 # Set to Wide Mode
 st.set_page_config(layout="wide")
@@ -73,6 +94,10 @@ def check_password():
 
 check_password()
 
+# Opt-in hot-path profiling: ?profile=1 or DASHBOARD_PROFILE=1 adds a Diagnostics tab.
+PROFILING = os.environ.get("DASHBOARD_PROFILE") == "1" or st.query_params.get("profile") == "1"
+RUN_PROFILE = start_profile() if PROFILING else None
+
 
 def find_matching_column(df: pd.DataFrame, candidates: list[str]) -> str | None:
     normalized_map = {
@@ -87,13 +112,13 @@ def find_matching_column(df: pd.DataFrame, candidates: list[str]) -> str | None:
 
 
 def _directory_asset_score(path: str) -> int:
-    return (
-        len(glob.glob(os.path.join(path, "*.png")))
-        + len(glob.glob(os.path.join(path, "*.xlsx")))
-    )
+    return get_asset_catalog(path).asset_count(".png", ".xlsx")
 
 
 def resolve_data_dir() -> str:
+    # Benchmarks and load tests point the app at a generated tree.
+    if os.environ.get("DASHBOARD_DATA_DIR"):
+        return os.environ["DASHBOARD_DATA_DIR"]
     script_dir = os.path.dirname(__file__)
     parent_dir = os.path.dirname(script_dir)
     candidates = [
@@ -109,139 +134,124 @@ def resolve_data_dir() -> str:
     return script_dir
 
 
-def is_valid_png(file_path: str) -> bool:
-    try:
-        if os.path.getsize(file_path) <= 8:
-            return False
-        with open(file_path, "rb") as image_file:
-            return image_file.read(8) == b"\x89PNG\r\n\x1a\n"
-    except OSError:
-        return False
+def show_image(image_path: str, width: int | None = None, use_container_width: bool = False) -> None:
+    """st.image that serves a pre-resized, palette-optimized copy of the chart.
+
+    The derivative already has the display width and PNG format, so Streamlit
+    passes its bytes through instead of resizing the full-resolution file on every rerun.
+    With DASHBOARD_IMAGE_SERVER=1 the image is a hashed URL on the image server instead.
+    """
+    display_width = CONTAINER_WIDTH if use_container_width or width is None else width
+    served_path = ensure_derivative(image_path, display_width)
+    url_path = image_url_path(served_path) if IMAGE_SERVER_RUNNING else None
+    if url_path is not None:
+        # The browser fetches (and caches for good) the hashed URL; no bytes pass through Streamlit.
+        served_path = image_base_url() + url_path
+    elif PROFILING:
+        note("image", nbytes=os.path.getsize(served_path))
+    if use_container_width:
+        st.image(served_path, use_container_width=True, output_format="PNG")
+    elif width is None:
+        st.image(served_path, output_format="PNG")
+    else:
+        st.image(served_path, width=width, output_format="PNG")
+
+
+def image_base_url() -> str:
+    if IMAGE_BASE_URL:
+        return IMAGE_BASE_URL
+    # Same scheme and host the viewer reached the dashboard on, image server port.
+    app_url = urlsplit(st.context.url or "http://localhost")
+    return f"{app_url.scheme}://{app_url.hostname}:{IMAGE_SERVER_PORT}"
 
 
-def latest_valid_png(pattern: str, exclude_substring: str | None = None) -> str | None:
-    matches = glob.glob(pattern)
-    if exclude_substring:
-        matches = [path for path in matches if exclude_substring not in os.path.basename(path)]
-    valid_matches = [path for path in matches if is_valid_png(path)]
-    if valid_matches:
-        return max(valid_matches, key=os.path.getmtime)
+@timed("discovery")
+def latest_valid_png(catalog: AssetCatalog, family: str, folded: bool = False) -> str | None:
+    versions = catalog.folded_versions(family, ".png") if folded else catalog.versions(family, ".png")
+    for version in reversed(versions):
+        version = current_version(version)
+        if version is not None and check_png(version.path, version.inode, version.size, version.mtime_ns):
+            return version.path
     return None
 
 
-def render_bull_pct_donut(df: pd.DataFrame) -> None:
-    def polar_to_cartesian(center_x: float, center_y: float, radius: float, angle_in_degrees: float) -> tuple[float, float]:
-        angle_in_radians = (angle_in_degrees - 90.0) * 3.141592653589793 / 180.0
-        return (
-            center_x + radius * float(__import__("math").cos(angle_in_radians)),
-            center_y + radius * float(__import__("math").sin(angle_in_radians)),
-        )
+CHART_RENDERER = os.environ.get("DASHBOARD_CHART_RENDERER", "png")
+ATH_CHART_STYLE = BarChartStyle(
+    title="Sector ETFs — % From ATH",
+    xlabel="Ticker",
+    ylabel="% From ATH",
+    ylim=(-100, 0),
+    reference_y=-20,
+    reference_color="#e74c3c",
+    reference_width=1,
+    reference_label="-20% threshold",
+    inches_per_bar=0.7,
+    percent_axis=True,
+)
+CLOSE_SCORE_CHART_STYLE = BarChartStyle(
+    title="ETF Candle Strength - Close Score",
+    xlabel="Ticker",
+    ylabel="Close Score (0-100)",
+    ylim=(0, 100),
+    reference_y=50,
+    reference_color="white",
+    reference_width=1.5,
+    reference_label="50 (Neutral)",
+    inches_per_bar=0.6,
+)
+
+
+@timed("chart")
+def show_bar_chart(labels: list, values: list, colors: list[str], style: BarChartStyle) -> None:
+    # DASHBOARD_CHART_RENDERER picks png (default), svg or vega-lite.
+    chart = render_bar_chart(labels, values, colors, style, CHART_RENDERER)
+    if CHART_RENDERER == "vega-lite":
+        st.vega_lite_chart(chart, use_container_width=True)
+    elif CHART_RENDERER == "svg":
+        st.image(chart, use_container_width=True)
+    else:
+        st.image(chart, use_container_width=True, output_format="PNG")
 
-    def describe_arc(center_x: float, center_y: float, radius: float, start_angle: float, end_angle: float) -> str:
-        start_x, start_y = polar_to_cartesian(center_x, center_y, radius, end_angle)
-        end_x, end_y = polar_to_cartesian(center_x, center_y, radius, start_angle)
-        large_arc_flag = "1" if end_angle - start_angle > 180 else "0"
-        return (
-            f"M {center_x} {center_y} "
-            f"L {start_x:.2f} {start_y:.2f} "
-            f"A {radius} {radius} 0 {large_arc_flag} 0 {end_x:.2f} {end_y:.2f} "
-            "Z"
-        )
 
-    bull_pct_column = None
-    for column in df.columns:
-        normalized = str(column).strip().upper().replace(" ", "_")
-        if normalized == "BULL_PCT":
-            bull_pct_column = column
-            break
+def html_component(document: str, height: int, scrolling: bool = False) -> None:
+    # Every components.html iframe ships its whole document to the browser, so record its size too.
+    started = time.perf_counter()
+    components.html(document, height=height, scrolling=scrolling)
+    if PROFILING:
+        note("iframe", time.perf_counter() - started, nbytes=len(document.encode("utf-8")))
 
-    if bull_pct_column is None:
-        return
 
-    numeric_values = pd.to_numeric(df[bull_pct_column], errors="coerce").dropna().round(2)
-    if numeric_values.empty:
-        return
+def render_bull_pct_donut(df: pd.DataFrame) -> None:
+    render_bull_pct_donut_summary(summarize_trend_frame(df))
 
-    target_values = [0.0, 33.33, 66.67, 100.0]
-    counts = [
-        int(((numeric_values == 0.0) | (numeric_values == 0)).sum()) if target_values[0] == 0.0 else 0,
-        int(((numeric_values >= 32.99) & (numeric_values <= 33.67)).sum()) if target_values[1] == 33.33 else 0,
-        int(((numeric_values >= 66.0) & (numeric_values <= 67.34)).sum()) if target_values[2] == 66.67 else 0,
-        int(((numeric_values == 100.0) | (numeric_values == 100)).sum()) if target_values[3] == 100.0 else 0,
-    ]
-    if sum(counts) == 0:
+
+def render_bull_pct_donut_summary(summary: TrendSummary) -> None:
+    counts = summary.bull_pct_counts
+    if counts is None or sum(counts) == 0:
         return
+    html_component(bull_pct_donut_svg(tuple(counts)), height=DONUT_CELL_HEIGHT)
+
 
-    colors = ["#F04444", "#FFFFFF", "#FFFFFF", "#2ECC71"]
-    labels = ["0", "33.33", "66.67", "100"]
-
-    total = sum(counts)
-    center_x = 90.0
-    center_y = 90.0
-    radius = 72.0
-    stroke_width = 28.0
-    current_angle = 0.0
-    svg_paths = []
-
-    for count, color in zip(counts, colors):
-        if count <= 0:
-            continue
-        sweep_angle = 360.0 * (count / total)
-        start_angle = current_angle
-        end_angle = current_angle + sweep_angle
-        
-        # Handle full 360° arc by splitting into two 180° arcs
-        if sweep_angle >= 359.99:
-            path1 = describe_arc(center_x, center_y, radius, start_angle, start_angle + 180.0)
-            path2 = describe_arc(center_x, center_y, radius, start_angle + 180.0, start_angle + 360.0)
-            svg_paths.append(f'<path d="{path1}" fill="{color}" stroke="#666666" stroke-width="1.5" />')
-            svg_paths.append(f'<path d="{path2}" fill="{color}" stroke="#666666" stroke-width="1.5" />')
+def render_bull_pct_donut_grid(cells: list[tuple[str, TrendSummary | None, str]]) -> None:
+    """Render every (title, summary, missing-data warning) donut in a single component."""
+    grid_cells = []
+    for title, summary, warning in cells:
+        if summary and summary.readable:
+            counts = summary.bull_pct_counts
+            grid_cells.append((title, tuple(counts) if counts else None, None))
         else:
-            path = describe_arc(center_x, center_y, radius, start_angle, end_angle)
-            svg_paths.append(
-                f'<path d="{path}" fill="{color}" stroke="#666666" stroke-width="1.5" />'
-            )
-        current_angle = end_angle
-
-    legend_text = " | ".join(f"{label}: {count}" for label, count in zip(labels, counts))
-    svg = f'''
-    <div style="display:flex; justify-content:center; margin:0.35rem 0 0.75rem 0;">
-      <svg width="220" height="220" viewBox="0 0 180 180" role="img" aria-label="BULL_PCT donut chart">
-        <circle cx="90" cy="90" r="{radius}" fill="#FFFFFF" stroke="#D0D0D0" stroke-width="1" />
-        {''.join(svg_paths)}
-        <circle cx="90" cy="90" r="{radius - stroke_width}" fill="#FFFFFF" stroke="#D0D0D0" stroke-width="1" />
-        <text x="90" y="86" text-anchor="middle" font-size="12" font-weight="700" fill="#111111">BULL_PCT</text>
-        <text x="90" y="104" text-anchor="middle" font-size="10" fill="#444444">{total} rows</text>
-      </svg>
-    </div>
-    <div style="text-align:center; font-size:0.8rem; color:#444444; margin-top:-0.35rem; margin-bottom:0.75rem;">
-      {legend_text}
-    </div>
-    '''
-
-    components.html(svg, height=320, scrolling=False)
+            grid_cells.append((title, None, warning))
+    document, height = bull_pct_donut_grid_html(grid_cells)
+    html_component(document, height=height)
 
 
 def render_trend_pie_charts(df: pd.DataFrame) -> None:
     """Render pie charts for DAILY, WEEKLY, and MONTHLY BULL vs BEAR counts."""
-    def polar_to_cartesian(center_x: float, center_y: float, radius: float, angle_in_degrees: float) -> tuple[float, float]:
-        angle_in_radians = (angle_in_degrees - 90.0) * 3.141592653589793 / 180.0
-        return (
-            center_x + radius * float(__import__("math").cos(angle_in_radians)),
-            center_y + radius * float(__import__("math").sin(angle_in_radians)),
-        )
+    render_trend_pie_charts_summary(summarize_trend_frame(df))
 
-    def describe_arc(center_x: float, center_y: float, radius: float, start_angle: float, end_angle: float) -> str:
-        start_x, start_y = polar_to_cartesian(center_x, center_y, radius, end_angle)
-        end_x, end_y = polar_to_cartesian(center_x, center_y, radius, start_angle)
-        large_arc_flag = "1" if end_angle - start_angle > 180 else "0"
-        return (
-            f"M {center_x} {center_y} "
-            f"L {start_x:.2f} {start_y:.2f} "
-            f"A {radius} {radius} 0 {large_arc_flag} 0 {end_x:.2f} {end_y:.2f} "
-            "Z"
-        )
 
+def render_trend_pie_charts_summary(summary: TrendSummary) -> None:
+    """Render the DAILY/WEEKLY/MONTHLY pie charts from precomputed scoreboard counts."""
     def create_pie_svg(bull_count: int, bear_count: int, title: str) -> str:
         total = bull_count + bear_count
         if total == 0:
@@ -250,40 +260,11 @@ def render_trend_pie_charts(df: pd.DataFrame) -> None:
         bull_percentage = (bull_count / total) * 100
         bear_percentage = (bear_count / total) * 100
 
-        center_x = 90.0
-        center_y = 90.0
-        radius = 65.0
-        current_angle = 0.0
-        svg_paths = []
-
-        # Red arc for BEAR
-        if bear_count > 0:
-            sweep_angle = 360.0 * (bear_count / total)
-            start_angle = current_angle
-            end_angle = current_angle + sweep_angle
-            if sweep_angle >= 359.99:
-                path1 = describe_arc(center_x, center_y, radius, start_angle, start_angle + 180.0)
-                path2 = describe_arc(center_x, center_y, radius, start_angle + 180.0, start_angle + 360.0)
-                svg_paths.append(f'<path d="{path1}" fill="#E74C3C" stroke="#FFFFFF" stroke-width="2" />')
-                svg_paths.append(f'<path d="{path2}" fill="#E74C3C" stroke="#FFFFFF" stroke-width="2" />')
-            else:
-                path = describe_arc(center_x, center_y, radius, start_angle, end_angle)
-                svg_paths.append(f'<path d="{path}" fill="#E74C3C" stroke="#FFFFFF" stroke-width="2" />')
-            current_angle = end_angle
-
-        # Green arc for BULL
-        if bull_count > 0:
-            sweep_angle = 360.0 * (bull_count / total)
-            start_angle = current_angle
-            end_angle = current_angle + sweep_angle
-            if sweep_angle >= 359.99:
-                path1 = describe_arc(center_x, center_y, radius, start_angle, start_angle + 180.0)
-                path2 = describe_arc(center_x, center_y, radius, start_angle + 180.0, start_angle + 360.0)
-                svg_paths.append(f'<path d="{path1}" fill="#27AE60" stroke="#FFFFFF" stroke-width="2" />')
-                svg_paths.append(f'<path d="{path2}" fill="#27AE60" stroke="#FFFFFF" stroke-width="2" />')
-            else:
-                path = describe_arc(center_x, center_y, radius, start_angle, end_angle)
-                svg_paths.append(f'<path d="{path}" fill="#27AE60" stroke="#FFFFFF" stroke-width="2" />')
+        # BEAR first in red, then BULL in green.
+        svg_paths = [
+            f'<path d="{path}" fill="{("#E74C3C", "#27AE60")[segment]}" stroke="#FFFFFF" stroke-width="2" />'
+            for segment, path in slice_paths((bear_count, bull_count), radius=65.0)
+        ]
 
         svg = f'''
         <div style="display:flex; flex-direction:column; align-items:center; margin:0.5rem 0;">
@@ -298,113 +279,57 @@ def render_trend_pie_charts(df: pd.DataFrame) -> None:
         '''
         return svg
 
-    timeframe_columns = [
-        ('DAILY_CURRENT_TREND', 'DAILY'),
-        ('WEEKLY_CURRENT_TREND', 'WEEKLY'),
-        ('MONTHLY_CURRENT_TREND', 'MONTHLY'),
-    ]
-
     pie_charts_html = '<div style="display:flex; justify-content:center; gap:1.5rem; margin:1rem 0; flex-wrap:wrap;">'
     
-    for col_name, display_name in timeframe_columns:
-        trend_column = None
-        for column in df.columns:
-            normalized = str(column).strip().upper().replace(" ", "_")
-            if normalized == col_name:
-                trend_column = column
-                break
+    for display_name, bull_count, bear_count in summary.trend_counts():
+        pie_charts_html += create_pie_svg(bull_count, bear_count, display_name)
 
-        if trend_column is None:
-            continue
+    pie_charts_html += '</div>'
+    html_component(pie_charts_html, height=360)
 
-        trend_values = df[trend_column].dropna()
-        bull_count = int((trend_values.str.upper() == 'BULL').sum())
-        bear_count = int((trend_values.str.upper() == 'BEAR').sum())
 
-        pie_charts_html += create_pie_svg(bull_count, bear_count, display_name)
+def render_bull_pct_history(family: str, days: int = 90) -> None:
+    """Line chart of a trend family's average BULL_PCT over its dated snapshots."""
+    ingesting = start_background_ingest(DATA_DIR)
+    history = bull_pct_history(snapshot_db_path(DATA_DIR), family, days)
+    if len(history) > 1:
+        st.line_chart(history.set_index("date")[["bull_pct"]], y_label="Average BULL_PCT")
+    elif ingesting:
+        st.info("Building trend history from the dated files; check back shortly.")
+    else:
+        st.info("Not enough dated snapshots for a history yet.")
 
-    pie_charts_html += '</div>'
-    components.html(pie_charts_html, height=360, scrolling=False)
-
-
-def get_bull_minus_bear_score_from_xlsx(xlsx_path: str | None) -> int:
-    if not xlsx_path:
-        return -10**9
-
-    try:
-        df = pd.read_excel(xlsx_path)
-    except Exception:
-        return -10**9
-
-    bull_pct_column = None
-    for column in df.columns:
-        normalized = str(column).strip().upper().replace(" ", "_")
-        if normalized == "BULL_PCT":
-            bull_pct_column = column
-            break
-
-    if bull_pct_column is None:
-        return -10**9
-
-    numeric_values = pd.to_numeric(df[bull_pct_column], errors="coerce").dropna().round(2)
-    if numeric_values.empty:
-        return -10**9
-
-    green_count = int((numeric_values == 100.0).sum())
-    red_count = int((numeric_values == 0.0).sum())
-    return green_count - red_count
-
-
-def get_latest_sector_xlsx(base_dir: str, sector_name: str) -> str | None:
-    def build_sector_variants(name: str) -> set[str]:
-        space_name = name.replace("_", " ")
-        underscore_name = name.replace(" ", "_")
-        return {
-            name,
-            space_name,
-            underscore_name,
-            space_name.title(),
-            underscore_name.title(),
-            space_name.upper(),
-            underscore_name.upper(),
-            space_name.lower(),
-            underscore_name.lower(),
-        }
 
-    xlsx_matches = []
-    for sector_variant in build_sector_variants(sector_name):
-        xlsx_matches.extend(
-            glob.glob(
-                os.path.join(
-                    base_dir,
-                    f"CURRENT_TREND_SUMMARY_ALL_STOCKS_{sector_variant}_*.xlsx",
-                )
-            )
-        )
-    xlsx_matches = list(set(xlsx_matches))
-    if not xlsx_matches:
-        return None
-    return max(xlsx_matches, key=os.path.getmtime)
+def get_trend_scoreboard(xlsx_paths: list[str | None]) -> dict[str, TrendSummary]:
+    # Parsed once per file version; sorting, donuts and pies all read these rows.
+    return DATASET.trend_summaries([path for path in xlsx_paths if path])
+
+
+@timed("discovery")
+def get_latest_sector_xlsx(catalog: AssetCatalog, sector_name: str) -> str | None:
+    # Sector files are written with inconsistent casing and spaces vs underscores
+    # ("Basic Material", "CONSUMER_DISCRETIONARY"), so match on the folded family name.
+    return catalog.latest_folded(f"CURRENT_TREND_SUMMARY_ALL_STOCKS_{sector_name}", ".xlsx")
+
 
+@timed("discovery")
+def get_latest_sector_png(catalog: AssetCatalog, sector_name: str) -> str | None:
+    return catalog.latest_folded(f"CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_{sector_name}", ".png")
 
-def discover_industry_tokens(base_dir: str) -> list[str]:
+
+@timed("discovery")
+def discover_industry_tokens(catalog: AssetCatalog) -> list[str]:
     tokens: set[str] = set()
-    xlsx_pattern = re.compile(
-        r"^CURRENT_TREND_SUMMARY_ALL_STOCKS_INDUSTRIES_(.+)_(\d{2}_\d{2}_\d{4}|\d{4}-\d{2}-\d{2})\.xlsx$"
-    )
-    png_pattern = re.compile(
-        r"^CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_INDUSTRIES_(.+)_(\d{2}_\d{2}_\d{4}|\d{4}-\d{2}-\d{2})\.png$"
-    )
+    xlsx_prefix = "CURRENT_TREND_SUMMARY_ALL_STOCKS_INDUSTRIES_"
+    png_prefix = "CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_INDUSTRIES_"
 
-    for path in glob.glob(os.path.join(base_dir, "CURRENT_TREND_SUMMARY_ALL_STOCKS_INDUSTRIES_*.xlsx")):
-        match = xlsx_pattern.match(os.path.basename(path))
-        if match:
-            tokens.add(match.group(1))
+    for family in catalog.families(xlsx_prefix, ".xlsx"):
+        if any(version.date_token for version in catalog.versions(family, ".xlsx")):
+            tokens.add(family[len(xlsx_prefix):])
 
-    for path in glob.glob(os.path.join(base_dir, "CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_INDUSTRIES_*.png")):
-        match = png_pattern.match(os.path.basename(path))
-        if match:
-            tokens.add(match.group(1))
+    for family in catalog.families(png_prefix, ".png"):
+        if any(version.date_token for version in catalog.versions(family, ".png")):
+            tokens.add(family[len(png_prefix):])
 
     return sorted(tokens)
 
@@ -413,39 +338,130 @@ def industry_label_from_token(token: str) -> str:
     return token.replace("_", " ").title()
 
 
-def get_latest_industry_xlsx(base_dir: str, industry_token: str) -> str | None:
-    matches = glob.glob(
-        os.path.join(base_dir, f"CURRENT_TREND_SUMMARY_ALL_STOCKS_INDUSTRIES_{industry_token}_*.xlsx")
-    )
-    if not matches:
-        return None
-    return max(matches, key=os.path.getmtime)
+@timed("discovery")
+def get_latest_industry_xlsx(catalog: AssetCatalog, industry_token: str) -> str | None:
+    return catalog.latest(f"CURRENT_TREND_SUMMARY_ALL_STOCKS_INDUSTRIES_{industry_token}", ".xlsx")
 
 
-def get_latest_industry_png(base_dir: str, industry_token: str) -> str | None:
-    matches = glob.glob(
-        os.path.join(base_dir, f"CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_INDUSTRIES_{industry_token}_*.png")
-    )
-    valid_matches = [path for path in matches if is_valid_png(path)]
-    if not valid_matches:
-        return None
-    return max(valid_matches, key=os.path.getmtime)
+def get_latest_industry_png(catalog: AssetCatalog, industry_token: str) -> str | None:
+    return latest_valid_png(catalog, f"CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_INDUSTRIES_{industry_token}")
 
 
-DATA_DIR = resolve_data_dir()
+def lazy_tabs(key: str, labels: list[str]):
+    # With on_change="rerun" only the selected tab reports ``open``, so callers
+    # can skip the file I/O and rendering of every hidden tab body.
+    return st.tabs(labels, key=f"{key}_tabs", on_change="rerun")
 
-####################################################################################################################################################################
 
-# Tabs
-tab0, tab_trade_tracker, tab1, tab_sector_analysis, tab_spy_vix, tab_spy_analysis, tab_ytd, tab_candle_strength, tab_beta, tab_fed_funds_spy, tab_mercury, tab2, tab3, tab3b, tab_sector_summary, tab_industry_summary, tab8, tab9, tab10, tab11 = st.tabs([
-                                                          "Mindset", "Trade Tracker", "Seasonality", "Sector Analysis", "SPY/VIX Analysis", "SPY Analysis", "YTD Analysis", "Candle Strength", "Beta", "Fed Funds Rate - SPY", "Mercury Retrograde Analysis", "Tail Candles (D-W-M)", "Close Above/Below Tickers", "Close Above/Below Summary", "Close Above/Below Sector Summary", "Close Above/Below Industry Summary",
-                                                          "Upcoming Earnings", "20/50ma Crossover", 
-                                                          "NAAIM Data", "Notes"])
+def render_table_view(key: str, view: TableView, row_height: int) -> None:
+    """Filter (on the view's group columns), sort and page ``view`` on the server; only the visible rows reach the browser."""
+    page_key = f"{key}_page"
+
+    def first_page() -> None:
+        st.session_state[page_key] = 1
+
+    filters: dict[str, list[str]] = {}
+    with st.popover("🔎 Filter Table"):
+        if view.group_columns:
+            filter_cols = st.columns(len(view.group_columns))
+            for filter_col, column in zip(filter_cols, view.group_columns):
+                # Each list only offers values left by the filters before it.
+                filters[column] = filter_col.multiselect(
+                    column,
+                    view.options(column, filters),
+                    key=f"{key}_{column.lower()}_filter",
+                    on_change=first_page,
+                )
+        else:
+            st.caption("No `Sector` or `Industry` columns were found in this file.")
+        shown_columns = st.multiselect("Columns", view.columns, placeholder="All columns", key=f"{key}_columns")
+
+    sort_col, order_col, size_col, page_col = st.columns([3, 2, 2, 2])
+    sort_by = sort_col.selectbox("Sort by", ["File order", *view.columns], key=f"{key}_sort", on_change=first_page)
+    descending = order_col.toggle("Descending", key=f"{key}_descending", on_change=first_page)
+    page_size = size_col.selectbox("Rows per page", PAGE_SIZES, index=1, key=f"{key}_page_size", on_change=first_page)
+    rows = view.rows(view.filter_rows(filters), None if sort_by == "File order" else sort_by, not descending)
+    pages = max(1, -(-len(rows) // page_size))
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = page_col.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+
+    page_df = view.page(rows, shown_columns, page - 1, page_size)
+    first_row = (page - 1) * page_size
+    st.caption(f"Showing {first_row + min(1, len(page_df)):,}–{first_row + len(page_df):,} of {len(rows):,} rows ({len(view):,} total)")
+    st.dataframe(
+        page_df,
+        use_container_width=True,
+        height=min(900, max(360, row_height * (len(page_df) + 1) + 12)),
+        hide_index=True,
+        row_height=row_height,
+    )
+
+
+DATA_DIR = resolve_data_dir()
+# The watcher keeps the catalog current as files land, so reruns never rescan.
+DATA_WATCHER = start_data_watcher(DATA_DIR) if os.environ.get("DASHBOARD_WATCH_DATA_DIR", "1") != "0" else None
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_dataset_bundle(data_dir: str, version: int, _catalog: AssetCatalog) -> DatasetBundle:
+    # Keyed on the catalog generation: the first run after a data drop builds
+    # the next bundle and evicts the old one once its sessions finish with it.
+    return DatasetBundle(data_dir, _catalog)
+
+
+def current_dataset_bundle() -> DatasetBundle:
+    catalog = get_asset_catalog(DATA_DIR)
+    return load_dataset_bundle(DATA_DIR, catalog.generation, catalog)
+
+
+# Each run renders from one bundle end to end, even if new data lands midway.
+DATASET = current_dataset_bundle()
+ASSET_CATALOG = DATASET.catalog
+# Parse every upload in the background (once per catalog version) so the
+# first page load after a restart or a data drop reads from a warm cache.
+start_warmup(DATA_DIR)
+if DATA_WATCHER is not None:
+    DATA_WATCHER.add_listener(start_warmup)
+    # Drop validations of removed PNGs off the render path.
+    DATA_WATCHER.add_listener(flush_validations)
+    if os.environ.get("DASHBOARD_DEDUPE_IMAGES") == "1":
+        # Opt-in: link dropped images to the blob store. This replaces the
+        # producers' files with shared inodes, so only enable it when every
+        # producer replaces files rather than rewriting them in place.
+        DATA_WATCHER.add_listener(dedupe_images)
+    if os.environ.get("DASHBOARD_ARCHIVE_PAGE_RUNS") == "1":
+        # Opt-in: move Fed/Mercury/20-50 MA pages of superseded runs to .archive/ after each drop.
+        DATA_WATCHER.add_listener(archive_superseded_runs)
+# Opt-in: serve derivatives and blobs from a sidecar with immutable caching
+# headers, so repeat visits and tab switches cost no image bytes.
+IMAGE_SERVER_PORT = int(os.environ.get("DASHBOARD_IMAGE_SERVER_PORT", IMAGE_SERVER_DEFAULT_PORT))
+# Remote viewers need DASHBOARD_IMAGE_SERVER_HOST=0.0.0.0 or a proxy plus DASHBOARD_IMAGE_BASE_URL.
+IMAGE_SERVER_HOST = os.environ.get("DASHBOARD_IMAGE_SERVER_HOST", IMAGE_SERVER_DEFAULT_HOST)
+IMAGE_BASE_URL = os.environ.get("DASHBOARD_IMAGE_BASE_URL", "").rstrip("/")
+# With a base URL set, a standalone image_server.py (or a proxy) may own the port.
+IMAGE_SERVER_RUNNING = os.environ.get("DASHBOARD_IMAGE_SERVER") == "1" and (
+    start_image_server(DATA_DIR, IMAGE_SERVER_PORT, IMAGE_SERVER_HOST) or bool(IMAGE_BASE_URL)
+)
+AUTO_REFRESH_SECONDS = float(os.environ.get("DASHBOARD_AUTO_REFRESH_SECONDS", "0"))
+
+
+@st.fragment(run_every=AUTO_REFRESH_SECONDS or None)
+def refresh_on_new_data() -> None:
+    # Cheap per-session check; only a new batch from the watcher reruns the page.
+    seen_version = st.session_state.setdefault("data_watcher_version", DATA_WATCHER.version)
+    if DATA_WATCHER.version != seen_version:
+        st.session_state["data_watcher_version"] = DATA_WATCHER.version
+        st.rerun()
+
+
+if DATA_WATCHER is not None and AUTO_REFRESH_SECONDS > 0:
+    refresh_on_new_data()
 
 ###############################################################################################################################################################
 
 # Mindset
-with tab0:
+def render_mindset_tab() -> None:
     st.header("Psychology")
     st.write("Psychology is the most important aspect of trading")
     st.write("Psycology alone is the reason I have blown up accounts.")
@@ -470,43 +486,57 @@ with tab0:
 ###############################################################################################################################################################
 
 # Trade Tracker
-with tab_trade_tracker:
-    st.header("Trade Tracker")
-
-    base_dir = DATA_DIR
-    tracker_file = os.path.join(base_dir, "trade_tracker.xlsx")
+def load_trade_snapshot(db_path: str) -> None:
+    # The editor diff refers to row positions, so each session keeps the
+    # snapshot it is editing until it saves or reloads.
+    df, row_ids = load_trades(db_path)
+    if df.empty:
+        df = pd.DataFrame([PLACEHOLDER_ROW])
+        row_ids = [None]
+    buy_amounts = pd.to_numeric(df["Buy Amount"], errors="coerce")
+    sell_amounts = pd.to_numeric(df["Sell Amount"], errors="coerce")
+    pct_gain = ((sell_amounts - buy_amounts) / buy_amounts) * 100
+    pct_gain = pd.to_numeric(pct_gain.replace([float("inf"), float("-inf")], pd.NA), errors="coerce")
+    df["% Gain"] = pct_gain.round(2)
+    st.session_state["trade_tracker_df"] = df
+    st.session_state["trade_tracker_ids"] = row_ids
+    # A new editor key starts the reloaded snapshot with an empty diff.
+    st.session_state["trade_tracker_generation"] = st.session_state.get("trade_tracker_generation", 0) + 1
+
+
+def render_trade_analytics(analytics: TradeAnalytics) -> None:
+    st.subheader("Performance (saved trades)")
+    path = analytics.path()
+    perf_col1, perf_col2, perf_col3, perf_col4 = st.columns(4)
+    perf_col1.metric("Max Drawdown", f"${path.max_drawdown:,.2f}")
+    perf_col2.metric("Current Streak", f"{abs(path.streak)} {'W' if path.streak > 0 else 'L' if path.streak < 0 else '-'}")
+    perf_col3.metric("Longest Win Streak", f"{path.longest_win_streak}")
+    perf_col4.metric("Longest Loss Streak", f"{path.longest_loss_streak}")
+
+    analytics_tabs = lazy_tabs("trade_analytics", ["Equity Curve", "Call/Put x Ticker"])
+    with analytics_tabs[0]:
+        if analytics_tabs[0].open:
+            chart_frame = analytics.equity_chart_frame()
+            if chart_frame.empty:
+                st.info("No closed trades yet.")
+            else:
+                st.line_chart(chart_frame[["Equity"]], y_label="Cumulative P/L ($)")
+                st.area_chart(chart_frame[["Drawdown"]], y_label="Drawdown ($)", color="#E74C3C")
+    with analytics_tabs[1]:
+        if analytics_tabs[1].open:
+            st.dataframe(analytics.breakdown_frame(), use_container_width=True, hide_index=True)
 
-    if "trade_tracker_df" not in st.session_state:
-        if os.path.exists(tracker_file):
-            try:
-                loaded_df = pd.read_excel(tracker_file)
-            except Exception:
-                loaded_df = pd.DataFrame(columns=["Date", "Ticker", "Call/Put", "Buy Amount", "Sell Amount", "% Gain"])
-        else:
-            loaded_df = pd.DataFrame(columns=["Date", "Ticker", "Call/Put", "Buy Amount", "Sell Amount", "% Gain"])
-        st.session_state["trade_tracker_df"] = loaded_df
 
-    tracker_df = st.session_state["trade_tracker_df"].copy()
+def render_trade_tracker_tab() -> None:
+    st.header("Trade Tracker")
 
-    if tracker_df.empty:
-        tracker_df = pd.DataFrame(
-            [
-                {
-                    "Date": "",
-                    "Ticker": "",
-                    "Call/Put": "",
-                    "Buy Amount": 0.0,
-                    "Sell Amount": 0.0,
-                    "% Gain": 0.0,
-                }
-            ]
-        )
+    db_path = open_trade_store(DATA_DIR)
+    if "trade_tracker_df" not in st.session_state:
+        with measure("trade_store"):
+            load_trade_snapshot(db_path)
 
-    buy_amounts = pd.to_numeric(tracker_df["Buy Amount"], errors="coerce")
-    sell_amounts = pd.to_numeric(tracker_df["Sell Amount"], errors="coerce")
-    pct_gain = ((sell_amounts - buy_amounts) / buy_amounts) * 100
-    pct_gain = pd.to_numeric(pct_gain.replace([float("inf"), float("-inf")], pd.NA), errors="coerce")
-    tracker_df["% Gain"] = pct_gain.round(2)
+    tracker_df = st.session_state["trade_tracker_df"]
+    editor_key = f"trade_tracker_editor_{st.session_state['trade_tracker_generation']}"
 
     edited_tracker_df = st.data_editor(
         tracker_df,
@@ -521,57 +551,77 @@ with tab_trade_tracker:
             "% Gain": st.column_config.NumberColumn("% Gain", disabled=True, format="%.2f%%"),
         },
         hide_index=True,
-        key="trade_tracker_editor",
+        key=editor_key,
     )
 
-    summary_df = edited_tracker_df.copy()
-    summary_df["Buy Amount"] = pd.to_numeric(summary_df["Buy Amount"], errors="coerce")
-    summary_df["Sell Amount"] = pd.to_numeric(summary_df["Sell Amount"], errors="coerce")
-    summary_df["% Gain"] = pd.to_numeric(summary_df["% Gain"], errors="coerce")
-    summary_df = summary_df.dropna(subset=["Buy Amount", "Sell Amount"])
+    # Saved ledger plus this session's unsaved edits, without rescanning the ledger.
+    analytics = get_trade_analytics(db_path)
+    totals = analytics.preview_totals(
+        analytics.editor_changes(st.session_state["trade_tracker_ids"], st.session_state.get(editor_key, {}))
+    )
 
     st.subheader("Live Summary")
     summary_col1, summary_col2, summary_col3, summary_col4 = st.columns(4)
-    total_trades = len(summary_df)
-    total_buy_amount = float(summary_df["Buy Amount"].sum()) if total_trades else 0.0
-    total_sell_amount = float(summary_df["Sell Amount"].sum()) if total_trades else 0.0
-    total_pl = total_sell_amount - total_buy_amount
-    avg_pct_gain = float(summary_df["% Gain"].mean()) if total_trades and summary_df["% Gain"].notna().any() else 0.0
-    win_rate = float((summary_df["% Gain"] > 0).mean() * 100) if total_trades and summary_df["% Gain"].notna().any() else 0.0
-
-    summary_col1.metric("Trades", f"{total_trades}")
-    summary_col2.metric("Total Buy", f"${total_buy_amount:,.2f}")
-    summary_col3.metric("Total Sell", f"${total_sell_amount:,.2f}")
-    summary_col4.metric("Total P/L", f"${total_pl:,.2f}")
+    summary_col1.metric("Trades", f"{totals.trades}")
+    summary_col2.metric("Total Buy", f"${totals.buy:,.2f}")
+    summary_col3.metric("Total Sell", f"${totals.sell:,.2f}")
+    summary_col4.metric("Total P/L", f"${totals.pnl:,.2f}")
 
     summary_col5, summary_col6 = st.columns(2)
-    summary_col5.metric("Average % Gain", f"{avg_pct_gain:.2f}%")
-    summary_col6.metric("Win Rate", f"{win_rate:.2f}%")
+    summary_col5.metric("Average % Gain", f"{totals.avg_gain:.2f}%")
+    summary_col6.metric("Win Rate", f"{totals.win_rate:.2f}%")
 
-    save_col1, save_col2 = st.columns([1, 4])
+    save_col1, save_col2, save_col3 = st.columns([1, 1, 3])
     with save_col1:
         if st.button("Save Trade Tracker"):
             try:
-                save_df = edited_tracker_df.copy()
-                save_df.to_excel(tracker_file, index=False)
-                st.session_state["trade_tracker_df"] = save_df
-                st.success(f"Saved to {tracker_file}")
+                # Only the rows touched in the editor are written, in one transaction.
+                write = apply_editor_changes(db_path, st.session_state["trade_tracker_ids"], st.session_state[editor_key])
+                apply_ledger_write(db_path, write)
+                load_trade_snapshot(db_path)
+                st.toast(f"Saved: {len(write.inserted_ids)} added, {len(write.updated_ids)} updated, {len(write.deleted_ids)} deleted")
+                st.rerun()
             except Exception as e:
                 st.error(f"Could not save trade tracker: {e}")
 
     with save_col2:
+        if st.button("Reload"):
+            load_trade_snapshot(db_path)
+            st.rerun()
+
+    with save_col3:
         st.caption("% Gain is calculated as (Sell Amount - Buy Amount) / Buy Amount * 100 and updates when saved.")
 
-    st.session_state["trade_tracker_df"] = edited_tracker_df
+    render_trade_analytics(analytics)
+
+    with st.expander("Import / export xlsx"):
+        st.download_button(
+            "Download ledger (xlsx)",
+            # Built only when clicked, not on every rerun of the tab.
+            data=lambda: export_xlsx_bytes(db_path),
+            file_name=TRADE_XLSX_FILE_NAME,
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+        uploaded_ledger = st.file_uploader("Import trades from xlsx", type=["xlsx"], key="trade_tracker_import")
+        replace_ledger = st.checkbox("Replace the current ledger instead of appending", key="trade_tracker_import_replace")
+        if uploaded_ledger is not None and st.button("Import"):
+            try:
+                write = import_xlsx(db_path, uploaded_ledger, replace=replace_ledger)
+                apply_ledger_write(db_path, write)
+                load_trade_snapshot(db_path)
+                st.toast(f"Imported {len(write.inserted_ids)} trades")
+                st.rerun()
+            except Exception as e:
+                st.error(f"Could not import trades: {e}")
 
 ###############################################################################################################################################################
 
 # Home Page
-with tab1:
+def render_seasonality_tab() -> None:
     st.header("Seasonality")
 
-    base_dir = DATA_DIR
-    season_tab1, season_tab2, season_tab3, season_tab4 = st.tabs([
+    catalog = ASSET_CATALOG
+    season_tab1, season_tab2, season_tab3, season_tab4 = lazy_tabs("seasonality", [
         "SPY",
         "QQQ",
         "IWM",
@@ -579,114 +629,97 @@ with tab1:
     ])
 
     with season_tab1:
-        pattern = os.path.join(base_dir, "spy_seasonality_*.png")
-        latest_file = latest_valid_png(pattern)
-        if latest_file:
-            st.image(latest_file, width=1500)
-        else:
-            st.warning("SPY seasonality image not found.")
+        if season_tab1.open:
+            latest_file = latest_valid_png(catalog, "spy_seasonality")
+            if latest_file:
+                show_image(latest_file, width=1500)
+            else:
+                st.warning("SPY seasonality image not found.")
 
     with season_tab2:
-        pattern = os.path.join(base_dir, "qqq_seasonality_*.png")
-        latest_file = latest_valid_png(pattern)
-        if latest_file:
-            st.image(latest_file, width=1500)
-        else:
-            st.warning("QQQ seasonality image not found.")
+        if season_tab2.open:
+            latest_file = latest_valid_png(catalog, "qqq_seasonality")
+            if latest_file:
+                show_image(latest_file, width=1500)
+            else:
+                st.warning("QQQ seasonality image not found.")
 
     with season_tab3:
-        pattern = os.path.join(base_dir, "iwm_seasonality_*.png")
-        latest_file = latest_valid_png(pattern)
-        if latest_file:
-            st.image(latest_file, width=1500)
-        else:
-            st.warning("IWM seasonality image not found.")
+        if season_tab3.open:
+            latest_file = latest_valid_png(catalog, "iwm_seasonality")
+            if latest_file:
+                show_image(latest_file, width=1500)
+            else:
+                st.warning("IWM seasonality image not found.")
 
     with season_tab4:
-        pattern = os.path.join(base_dir, "VIX_seasonality_*.png")
-        latest_file = latest_valid_png(pattern)
-        if latest_file:
-            st.image(latest_file, width=1500)
-        else:
-            st.warning("VIX seasonality image not found.")
+        if season_tab4.open:
+            latest_file = latest_valid_png(catalog, "VIX_seasonality")
+            if latest_file:
+                show_image(latest_file, width=1500)
+            else:
+                st.warning("VIX seasonality image not found.")
 
 ###############################################################################################################################################################
 
 # Sector Analysis
-with tab_sector_analysis:
+def render_sector_analysis_tab() -> None:
     st.header("Sector Analysis")
 
-    base_dir = DATA_DIR
+    catalog = ASSET_CATALOG
     sector_chart_width = 1200
     yearly_chart_width = 1600
 
-    def latest_sector_chart(*filename_patterns: str) -> str | None:
-        matches: list[str] = []
-        for filename_pattern in filename_patterns:
-            matches.extend(glob.glob(os.path.join(base_dir, filename_pattern)))
-        unique_matches = list(set(matches))
-        valid_matches = [path for path in unique_matches if is_valid_png(path)]
-        if not valid_matches:
-            return None
-        return max(valid_matches, key=os.path.getmtime)
+    def latest_sector_chart(family: str) -> str | None:
+        # Dated ("..._2026-08-21.png") and undated ("....png") charts share one family.
+        return latest_valid_png(catalog, family)
 
-    sub_tab_yearly, sub_tab_ytd, sub_tab_qtd = st.tabs(["Yearly Table", "Year-to-Date", "Quarter-to-Date"])
+    sub_tab_yearly, sub_tab_ytd, sub_tab_qtd = lazy_tabs("sector_analysis", ["Yearly Table", "Year-to-Date", "Quarter-to-Date"])
 
     with sub_tab_yearly:
-        latest_file = latest_sector_chart(
-            "sector_etf_yearly_gain_table_*.png",
-            "sector_etf_yearly_gain_table.png",
-        )
-        if latest_file:
-            st.image(latest_file, width=yearly_chart_width)
-        else:
-            st.warning("Yearly gain table image not found.")
+        if sub_tab_yearly.open:
+            latest_file = latest_sector_chart("sector_etf_yearly_gain_table")
+            if latest_file:
+                show_image(latest_file, width=yearly_chart_width)
+            else:
+                st.warning("Yearly gain table image not found.")
 
     with sub_tab_ytd:
-        latest_file = latest_sector_chart(
-            "etf_ytd_bar_chart_*.png",
-            "etf_ytd_bar_chart.png",
-        )
-        if latest_file:
-            st.image(latest_file, width=sector_chart_width)
-        else:
-            st.warning("YTD bar chart image not found.")
+        if sub_tab_ytd.open:
+            latest_file = latest_sector_chart("etf_ytd_bar_chart")
+            if latest_file:
+                show_image(latest_file, width=sector_chart_width)
+            else:
+                st.warning("YTD bar chart image not found.")
 
     with sub_tab_qtd:
-        latest_file = latest_sector_chart(
-            "etf_qtd_bar_chart_*.png",
-            "etf_qtd_bar_chart.png",
-        )
-        if latest_file:
-            st.image(latest_file, width=sector_chart_width)
-        else:
-            st.warning("QTD bar chart image not found.")
+        if sub_tab_qtd.open:
+            latest_file = latest_sector_chart("etf_qtd_bar_chart")
+            if latest_file:
+                show_image(latest_file, width=sector_chart_width)
+            else:
+                st.warning("QTD bar chart image not found.")
 
 ###############################################################################################################################################################
 
 # Tail Candles (Daily/Weekly/Monthly)
-with tab2:
+def render_tail_candles_tab() -> None:
     st.header("Tail Candles (D-W-M)")
     st.write("Daily Bottoming Tail Candles minus Topping Tail Candles. Helps to identify the institutional distribution in stocks.")
-    base_dir = DATA_DIR
-
-    def show_latest_png(file_pattern: str, not_found_message: str, width: int = 1500, exclude_substring: str | None = None) -> None:
-        matches = glob.glob(os.path.join(base_dir, file_pattern))
-        if exclude_substring:
-            matches = [path for path in matches if exclude_substring not in os.path.basename(path)]
+    catalog = ASSET_CATALOG
 
-        if matches:
-            latest_file = max(matches, key=os.path.getmtime)
-            st.image(latest_file, width=width)
+    def show_latest_png(family: str, not_found_message: str, width: int = 1500) -> None:
+        latest_file = catalog.latest(family, ".png")
+        if latest_file:
+            show_image(latest_file, width=width)
         else:
             st.warning(not_found_message)
 
-    def show_wick_table(file_pattern: str, signal: str, heading: str, not_found_message: str) -> None:
-        matches = glob.glob(os.path.join(base_dir, file_pattern))
-        if matches:
-            latest_file = max(matches, key=os.path.getmtime)
+    def show_wick_table(family: str, signal: str, heading: str, not_found_message: str) -> None:
+        latest_file = catalog.latest(family, ".xlsx")
+        if latest_file:
             try:
-                df = pd.read_excel(latest_file)
+                df = DATASET.frame(latest_file)
                 filtered = df[df["Candle Signal"] == signal]
                 st.subheader(f"{heading} — Count: {len(filtered)}")
                 if not filtered.empty:
@@ -702,7 +735,7 @@ with tab2:
         tc_tab1, tc_tab2, tc_tab3, tc_tab4,
         tc_tab5, tc_tab6, tc_tab7, tc_tab8,
         tc_tab9, tc_tab10, tc_tab11, tc_tab12,
-    ) = st.tabs([
+    ) = lazy_tabs("tail_candles", [
         "Daily Count",
         "Daily Count (Separate)",
         "Daily Bullish Wick",
@@ -718,101 +751,110 @@ with tab2:
     ])
 
     with tc_tab1:
-        show_latest_png(
-            "daily_tail_candle_count_*.png",
-            "Daily Tail Candle Count image not found.",
-            exclude_substring="daily_tail_candle_count_separate_",
-        )
+        if tc_tab1.open:
+            show_latest_png(
+                "daily_tail_candle_count",
+                "Daily Tail Candle Count image not found.",
+            )
 
     with tc_tab2:
-        show_latest_png(
-            "daily_tail_candle_count_separate_*.png",
-            "Daily Tail Candle Count (Separate) image not found.",
-        )
+        if tc_tab2.open:
+            show_latest_png(
+                "daily_tail_candle_count_separate",
+                "Daily Tail Candle Count (Separate) image not found.",
+            )
 
     with tc_tab3:
-        show_wick_table(
-            "daily_summary_data_*.xlsx",
-            "Bullish Wick",
-            "Daily Bullish Wick Candles",
-            "Daily Summary Data file not found.",
-        )
+        if tc_tab3.open:
+            show_wick_table(
+                "daily_summary_data",
+                "Bullish Wick",
+                "Daily Bullish Wick Candles",
+                "Daily Summary Data file not found.",
+            )
 
     with tc_tab4:
-        show_wick_table(
-            "daily_summary_data_*.xlsx",
-            "Bearish Wick",
-            "Daily Bearish Wick Candles",
-            "Daily Summary Data file not found.",
-        )
+        if tc_tab4.open:
+            show_wick_table(
+                "daily_summary_data",
+                "Bearish Wick",
+                "Daily Bearish Wick Candles",
+                "Daily Summary Data file not found.",
+            )
 
     with tc_tab5:
-        show_latest_png(
-            "weekly_tail_candle_count_*.png",
-            "Weekly Tail Candle Count image not found.",
-            exclude_substring="weekly_tail_candle_count_separate_",
-        )
+        if tc_tab5.open:
+            show_latest_png(
+                "weekly_tail_candle_count",
+                "Weekly Tail Candle Count image not found.",
+            )
 
     with tc_tab6:
-        show_latest_png(
-            "weekly_tail_candle_count_separate_*.png",
-            "Weekly Tail Candle Count (Separate) image not found.",
-        )
+        if tc_tab6.open:
+            show_latest_png(
+                "weekly_tail_candle_count_separate",
+                "Weekly Tail Candle Count (Separate) image not found.",
+            )
 
     with tc_tab7:
-        show_wick_table(
-            "weekly_summary_data_*.xlsx",
-            "Bullish Wick",
-            "Weekly Bullish Wick Candles",
-            "Weekly Summary Data file not found.",
-        )
+        if tc_tab7.open:
+            show_wick_table(
+                "weekly_summary_data",
+                "Bullish Wick",
+                "Weekly Bullish Wick Candles",
+                "Weekly Summary Data file not found.",
+            )
 
     with tc_tab8:
-        show_wick_table(
-            "weekly_summary_data_*.xlsx",
-            "Bearish Wick",
-            "Weekly Bearish Wick Candles",
-            "Weekly Summary Data file not found.",
-        )
+        if tc_tab8.open:
+            show_wick_table(
+                "weekly_summary_data",
+                "Bearish Wick",
+                "Weekly Bearish Wick Candles",
+                "Weekly Summary Data file not found.",
+            )
 
     with tc_tab9:
-        show_latest_png(
-            "monthly_tail_candle_count_*.png",
-            "Monthly Tail Candle Count image not found.",
-            exclude_substring="monthly_tail_candle_count_separate_",
-        )
+        if tc_tab9.open:
+            show_latest_png(
+                "monthly_tail_candle_count",
+                "Monthly Tail Candle Count image not found.",
+            )
 
     with tc_tab10:
-        show_latest_png(
-            "monthly_tail_candle_count_separate_*.png",
-            "Monthly Tail Candle Count (Separate) image not found.",
-        )
+        if tc_tab10.open:
+            show_latest_png(
+                "monthly_tail_candle_count_separate",
+                "Monthly Tail Candle Count (Separate) image not found.",
+            )
 
     with tc_tab11:
-        show_wick_table(
-            "monthly_summary_data_*.xlsx",
-            "Bullish Wick",
-            "Monthly Bullish Wick Candles",
-            "Monthly Summary Data file not found.",
-        )
+        if tc_tab11.open:
+            show_wick_table(
+                "monthly_summary_data",
+                "Bullish Wick",
+                "Monthly Bullish Wick Candles",
+                "Monthly Summary Data file not found.",
+            )
 
     with tc_tab12:
-        show_wick_table(
-            "monthly_summary_data_*.xlsx",
-            "Bearish Wick",
-            "Monthly Bearish Wick Candles",
-            "Monthly Summary Data file not found.",
-        )
+        if tc_tab12.open:
+            show_wick_table(
+                "monthly_summary_data",
+                "Bearish Wick",
+                "Monthly Bearish Wick Candles",
+                "Monthly Summary Data file not found.",
+            )
 
 ###############################################################################################################################################################
 
 # Close Above/Below Summary
-with tab3:
+def render_close_above_below_tab() -> None:
     st.header("Close Above/Below Tickers")
     st.write("Daily Close Above Candles minus Daily Close Below Candles. Helps to identify the institutional distribution in stocks and overall trend.")
 
-    base_dir = DATA_DIR
-    cab_tab0, cab_tab1, cab_tab2, cab_tab3, cab_tab4, cab_tab5, cab_tab6, cab_tab7, cab_tab8 = st.tabs([
+    catalog = ASSET_CATALOG
+    cab_tab0, cab_tab1, cab_tab2, cab_tab3, cab_tab4, cab_tab5, cab_tab6, cab_tab7, cab_tab8 = lazy_tabs("close_above_below", [
         "Daily",
         "Weekly",
         "Monthly",
@@ -825,94 +867,88 @@ with tab3:
     ])
 
     with cab_tab0:
-        st.subheader("Daily Close Above/Below")
-        pattern = os.path.join(base_dir, "daily_close_above_below_count_*.png")
-        matching_files = glob.glob(pattern)
-        if matching_files:
-            latest_file = max(matching_files, key=os.path.getmtime)
-            st.image(latest_file, width=1500)
-        else:
-            st.warning("Daily Close Above Below Count image not found.")
+        if cab_tab0.open:
+            st.subheader("Daily Close Above/Below")
+            latest_file = catalog.latest("daily_close_above_below_count", ".png")
+            if latest_file:
+                show_image(latest_file, width=1500)
+            else:
+                st.warning("Daily Close Above Below Count image not found.")
 
     with cab_tab1:
-        st.subheader("Weekly Close Above/Below")
-        pattern = os.path.join(base_dir, "weekly_close_above_below_count_*.png")
-        matching_files = glob.glob(pattern)
-        if matching_files:
-            latest_file = max(matching_files, key=os.path.getmtime)
-            st.image(latest_file, width=1500)
-        else:
-            st.warning("Weekly Close Above Below Count image not found.")
+        if cab_tab1.open:
+            st.subheader("Weekly Close Above/Below")
+            latest_file = catalog.latest("weekly_close_above_below_count", ".png")
+            if latest_file:
+                show_image(latest_file, width=1500)
+            else:
+                st.warning("Weekly Close Above Below Count image not found.")
 
     with cab_tab2:
-        st.subheader("Monthly Close Above/Below")
-        pattern = os.path.join(base_dir, "monthly_close_above_below_count_*.png")
-        matching_files = glob.glob(pattern)
-        if matching_files:
-            latest_file = max(matching_files, key=os.path.getmtime)
-            st.image(latest_file, width=1500)
-        else:
-            st.warning("Monthly Close Above Below Count image not found.")
+        if cab_tab2.open:
+            st.subheader("Monthly Close Above/Below")
+            latest_file = catalog.latest("monthly_close_above_below_count", ".png")
+            if latest_file:
+                show_image(latest_file, width=1500)
+            else:
+                st.warning("Monthly Close Above Below Count image not found.")
 
     with cab_tab3:
-        matches = [
-            p for p in glob.glob(os.path.join(base_dir, "BULL_Percentage_Trend_Daily_*.png"))
-            if "_ALL_STOCKS_" not in os.path.basename(p)
-        ]
-        if matches:
-            st.image(max(matches, key=os.path.getmtime), width=850)
-        else:
-            st.warning("Daily Close Trend image not found.")
+        if cab_tab3.open:
+            latest_file = catalog.latest("BULL_Percentage_Trend_Daily", ".png")
+            if latest_file:
+                show_image(latest_file, width=850)
+            else:
+                st.warning("Daily Close Trend image not found.")
 
     with cab_tab4:
-        matches = [
-            p for p in glob.glob(os.path.join(base_dir, "BULL_Percentage_Trend_Weekly_*.png"))
-            if "_ALL_STOCKS_" not in os.path.basename(p)
-        ]
-        if matches:
-            st.image(max(matches, key=os.path.getmtime), width=850)
-        else:
-            st.warning("Weekly Close Trend image not found.")
+        if cab_tab4.open:
+            latest_file = catalog.latest("BULL_Percentage_Trend_Weekly", ".png")
+            if latest_file:
+                show_image(latest_file, width=850)
+            else:
+                st.warning("Weekly Close Trend image not found.")
 
     with cab_tab5:
-        matches = [
-            p for p in glob.glob(os.path.join(base_dir, "BULL_Percentage_Trend_Monthly_*.png"))
-            if "_ALL_STOCKS_" not in os.path.basename(p)
-        ]
-        if matches:
-            st.image(max(matches, key=os.path.getmtime), width=850)
-        else:
-            st.warning("Monthly Close Trend image not found.")
+        if cab_tab5.open:
+            latest_file = catalog.latest("BULL_Percentage_Trend_Monthly", ".png")
+            if latest_file:
+                show_image(latest_file, width=850)
+            else:
+                st.warning("Monthly Close Trend image not found.")
 
     with cab_tab6:
-        matches = glob.glob(os.path.join(base_dir, "BULL_Percentage_Trend_Daily_ALL_STOCKS_*.png"))
-        if matches:
-            st.image(max(matches, key=os.path.getmtime), width=850)
-        else:
-            st.warning("Daily Close Trend - All Stocks image not found.")
+        if cab_tab6.open:
+            latest_file = catalog.latest("BULL_Percentage_Trend_Daily_ALL_STOCKS", ".png")
+            if latest_file:
+                show_image(latest_file, width=850)
+            else:
+                st.warning("Daily Close Trend - All Stocks image not found.")
 
     with cab_tab7:
-        matches = glob.glob(os.path.join(base_dir, "BULL_Percentage_Trend_Weekly_ALL_STOCKS_*.png"))
-        if matches:
-            st.image(max(matches, key=os.path.getmtime), width=850)
-        else:
-            st.warning("Weekly Close Trend - All Stocks image not found.")
+        if cab_tab7.open:
+            latest_file = catalog.latest("BULL_Percentage_Trend_Weekly_ALL_STOCKS", ".png")
+            if latest_file:
+                show_image(latest_file, width=850)
+            else:
+                st.warning("Weekly Close Trend - All Stocks image not found.")
 
     with cab_tab8:
-        matches = glob.glob(os.path.join(base_dir, "BULL_Percentage_Trend_Monthly_ALL_STOCKS_*.png"))
-        if matches:
-            st.image(max(matches, key=os.path.getmtime), width=850)
-        else:
-            st.warning("Monthly Close Trend - All Stocks image not found.")
+        if cab_tab8.open:
+            latest_file = catalog.latest("BULL_Percentage_Trend_Monthly_ALL_STOCKS", ".png")
+            if latest_file:
+                show_image(latest_file, width=850)
+            else:
+                st.warning("Monthly Close Trend - All Stocks image not found.")
 
 ###############################################################################################################################################################
 
 # Close Above/Below Summary
-with tab3b:
+def render_close_above_below_summary_tab() -> None:
     st.header("Close Above/Below Summary")
     st.write("Current trend summary tables and percentage trend analysis for ETFs/indices and the all-stocks universe.")
 
-    base_dir = DATA_DIR
+    catalog = ASSET_CATALOG
     sector_name_tokens = [
         "MAG7",
         "SEMICONDUCTORS",
@@ -930,101 +966,95 @@ with tab3b:
         "FINANCIAL",
         "UTILITY",
     ]
-    cab_summary_tab1, cab_summary_tab2 = st.tabs([
+    cab_summary_tab1, cab_summary_tab2, cab_summary_tab3 = lazy_tabs("close_above_below_summary", [
         "CURRENT_TREND_SUMMARY",
         "CURRENT_TREND_SUMMARY_ALL_STOCKS",
+        "Trend Streaks",
     ])
 
     with cab_summary_tab1:
-        pattern = os.path.join(base_dir, "CURRENT_TREND_SUMMARY_*.xlsx")
-        matching_files = [
-            p for p in glob.glob(pattern)
-            if "CURRENT_TREND_SUMMARY_ALL_STOCKS_" not in os.path.basename(p)
-        ]
-        if matching_files:
-            latest_file = max(matching_files, key=os.path.getmtime)
-            try:
-                df = pd.read_excel(latest_file)
-                st.subheader("Trend Distribution by Timeframe")
-                render_trend_pie_charts(df)
-                st.subheader("BULL Percentage Distribution")
-                render_bull_pct_donut(df)
-                st.subheader("Detailed Summary")
-                st.dataframe(df, use_container_width=True)
-            except Exception as e:
-                st.error(f"⚠️ Failed to load CURRENT_TREND_SUMMARY XLSX file: {e}")
-        else:
-            st.warning("CURRENT_TREND_SUMMARY XLSX file not found.")
+        if cab_summary_tab1.open:
+            latest_file = catalog.latest("CURRENT_TREND_SUMMARY", ".xlsx")
+            if latest_file:
+                try:
+                    df = DATASET.frame(latest_file)
+                    st.subheader("Trend Distribution by Timeframe")
+                    render_trend_pie_charts(df)
+                    st.subheader("BULL Percentage Distribution")
+                    render_bull_pct_donut(df)
+                    st.subheader("Detailed Summary")
+                    st.dataframe(df, use_container_width=True)
+                except Exception as e:
+                    st.error(f"⚠️ Failed to load CURRENT_TREND_SUMMARY XLSX file: {e}")
+            else:
+                st.warning("CURRENT_TREND_SUMMARY XLSX file not found.")
 
-        matches = [
-            p for p in glob.glob(os.path.join(base_dir, "CURRENT_TREND_SUMMARY_TABLE_*.png"))
-            if "CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_" not in os.path.basename(p)
-        ]
-        valid_matches = [path for path in matches if is_valid_png(path)]
-        if valid_matches:
-            st.image(max(valid_matches, key=os.path.getmtime), width=1500)
-        else:
-            st.warning("Close Above/Below Summary image not found.")
+            latest_png = latest_valid_png(catalog, "CURRENT_TREND_SUMMARY_TABLE")
+            if latest_png:
+                show_image(latest_png, width=1500)
+            else:
+                st.warning("Close Above/Below Summary image not found.")
 
     with cab_summary_tab2:
-        matches = [
-            path
-            for path in glob.glob(os.path.join(base_dir, "CURRENT_TREND_SUMMARY_ALL_STOCKS_*.xlsx"))
-            if re.match(
-                r"^CURRENT_TREND_SUMMARY_ALL_STOCKS_(\d{2}_\d{2}_\d{4}|\d{4}-\d{2}-\d{2})\.xlsx$",
-                os.path.basename(path),
-            )
-        ]
-        if matches:
-            latest_file = max(matches, key=os.path.getmtime)
-            try:
-                df = pd.read_excel(latest_file)
-                st.subheader("Trend Distribution by Timeframe")
-                render_trend_pie_charts(df)
-                st.subheader("BULL Percentage Distribution")
-                render_bull_pct_donut(df)
-                st.subheader("Detailed Summary")
-                st.dataframe(df, use_container_width=True)
-            except Exception as e:
-                st.error(f"⚠️ Failed to load CURRENT_TREND_SUMMARY_ALL_STOCKS XLSX file: {e}")
-        else:
-            st.warning("CURRENT_TREND_SUMMARY_ALL_STOCKS XLSX file not found.")
-
-        matches = [
-            path
-            for path in glob.glob(os.path.join(base_dir, "CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_*.png"))
-            if re.match(
-                r"^CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_(\d{2}_\d{2}_\d{4}|\d{4}-\d{2}-\d{2})\.png$",
-                os.path.basename(path),
-            )
-        ]
-        valid_matches = [path for path in matches if is_valid_png(path)]
-        if valid_matches:
-            st.image(max(valid_matches, key=os.path.getmtime), width=1500)
-        else:
-            st.warning("Close Above/Below Summary - All Stocks image not found.")
+        if cab_summary_tab2.open:
+            latest_file = catalog.latest("CURRENT_TREND_SUMMARY_ALL_STOCKS", ".xlsx")
+            if latest_file:
+                try:
+                    df = DATASET.frame(latest_file)
+                    st.subheader("Trend Distribution by Timeframe")
+                    render_trend_pie_charts(df)
+                    st.subheader("BULL Percentage Distribution")
+                    render_bull_pct_donut(df)
+                    st.subheader("Detailed Summary")
+                    st.dataframe(df, use_container_width=True)
+                except Exception as e:
+                    st.error(f"⚠️ Failed to load CURRENT_TREND_SUMMARY_ALL_STOCKS XLSX file: {e}")
+            else:
+                st.warning("CURRENT_TREND_SUMMARY_ALL_STOCKS XLSX file not found.")
+
+            latest_png = latest_valid_png(catalog, "CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS")
+            if latest_png:
+                show_image(latest_png, width=1500)
+            else:
+                st.warning("Close Above/Below Summary - All Stocks image not found.")
+
+    with cab_summary_tab3:
+        if cab_summary_tab3.open:
+            st.subheader("All Stocks BULL_PCT (90 days)")
+            render_bull_pct_history("CURRENT_TREND_SUMMARY_ALL_STOCKS")
+            st.subheader("Consecutive Trend Streaks")
+            streak_col1, streak_col2, streak_col3 = st.columns(3)
+            timeframe = streak_col1.selectbox("Timeframe", ["DAILY", "WEEKLY", "MONTHLY"], key="streak_timeframe")
+            trend = streak_col2.selectbox("Trend", ["BULL", "BEAR"], key="streak_trend")
+            min_snapshots = streak_col3.number_input("At least N snapshots", min_value=1, value=5, step=1, key="streak_min")
+            streaks = trend_streaks(snapshot_db_path(DATA_DIR), timeframe=timeframe, trend=trend, min_snapshots=int(min_snapshots))
+            st.caption(f"{len(streaks)} tickers in {timeframe} {trend} for the latest {int(min_snapshots)}+ consecutive snapshots.")
+            st.dataframe(streaks, use_container_width=True, hide_index=True)
 
 ###############################################################################################################################################################
 
 # Close Above/Below Sector Summary
-with tab_sector_summary:
+def render_sector_summary_tab() -> None:
     st.header("Close Above/Below Sector Summary")
     st.write("Sector-specific trend summaries with detailed tables.")
 
-    base_dir = DATA_DIR
+    catalog = ASSET_CATALOG
     
     # Define sectors and their names
     sectors = ['MAG7', 'Semiconductors', 'Software', 'All_Other_Technology', 'Basic Material', 'Communication', 'Energy', 'Healthcare', 'Industrial', 'Consumer_Discretionary', 'Consumer_Defensive', 'Financial', 'Utility']
 
+    sector_xlsx = {sector_name: get_latest_sector_xlsx(catalog, sector_name) for sector_name in sectors}
+    scoreboard = get_trend_scoreboard(list(sector_xlsx.values()))
+
     sector_entries = []
-    for sector_name in sectors:
-        latest_xlsx = get_latest_sector_xlsx(base_dir, sector_name)
-        score = get_bull_minus_bear_score_from_xlsx(latest_xlsx)
+    for sector_name, latest_xlsx in sector_xlsx.items():
+        summary = scoreboard.get(latest_xlsx) if latest_xlsx else None
         sector_entries.append(
             {
                 "name": sector_name,
                 "xlsx": latest_xlsx,
-                "score": score,
+                "summary": summary,
+                "score": summary.score if summary else MISSING_SCORE,
             }
         )
 
@@ -1036,117 +1066,76 @@ with tab_sector_summary:
 
     sorted_sectors = [entry["name"] for entry in sector_entries]
     inner_tabs = ["BULL_PCT_per_SECTOR"] + sorted_sectors
-    sector_tabs = st.tabs(inner_tabs)
-    
-    def build_sector_variants(name: str) -> set[str]:
-        space_name = name.replace("_", " ")
-        underscore_name = name.replace(" ", "_")
-        variants = {
-            name,
-            space_name,
-            underscore_name,
-            space_name.title(),
-            underscore_name.title(),
-            space_name.upper(),
-            underscore_name.upper(),
-            space_name.lower(),
-            underscore_name.lower(),
-        }
-        return variants
+    sector_tabs = lazy_tabs("sector_summary", inner_tabs)
 
     with sector_tabs[0]:
-        st.subheader("BULL_PCT per Sector")
-        donut_columns = st.columns(4)
-        for index, entry in enumerate(sector_entries):
-            with donut_columns[index % 4]:
+        if sector_tabs[0].open:
+            st.subheader("BULL_PCT per Sector")
+            render_bull_pct_donut_grid(
+                [
+                    (
+                        entry["name"],
+                        entry["summary"],
+                        f"{entry['name']} data unreadable." if entry["xlsx"] else f"{entry['name']} XLSX not found.",
+                    )
+                    for entry in sector_entries
+                ]
+            )
+
+    for sector_tab, entry in zip(sector_tabs[1:], sector_entries):
+        with sector_tab:
+            if sector_tab.open:
                 sector_name = entry["name"]
-                st.markdown(
-                    f'<div style="text-align:center; font-size:1.2rem; font-weight:700; margin-bottom:0.5rem;">{sector_name}</div>',
-                    unsafe_allow_html=True,
-                )
+
+                # Display PNG first
+                latest_png = get_latest_sector_png(catalog, sector_name)
+                if latest_png:
+                    show_image(latest_png, width=1500)
+                else:
+                    st.warning(f"{sector_name} summary PNG not found.")
+            
+                # Display XLSX as table
                 latest_xlsx = entry["xlsx"]
                 if latest_xlsx:
                     try:
-                        df = pd.read_excel(latest_xlsx)
-                        render_bull_pct_donut(df)
-                    except Exception:
-                        st.warning(f"{sector_name} data unreadable.")
+                        df = DATASET.frame(latest_xlsx)
+                        st.markdown("---")
+                        st.subheader("Trend Distribution")
+                        render_trend_pie_charts_summary(entry["summary"])
+                        st.markdown("---")
+                        st.subheader("Detailed Table")
+                        st.dataframe(df, use_container_width=True)
+                    except Exception as e:
+                        st.error(f"Failed to load {sector_name} XLSX file: {e}")
                 else:
-                    st.warning(f"{sector_name} XLSX not found.")
-
-    for sector_tab, sector_name in zip(sector_tabs[1:], sorted_sectors):
-        with sector_tab:
-            # Display PNG first
-            png_matches = []
-            for sector_variant in build_sector_variants(sector_name):
-                png_matches.extend(
-                    glob.glob(
-                        os.path.join(
-                            base_dir,
-                            f"CURRENT_TREND_SUMMARY_TABLE_ALL_STOCKS_{sector_variant}_*.png",
-                        )
-                    )
-                )
-            png_matches = list(set(png_matches))
-            
-            if png_matches:
-                latest_png = max(png_matches, key=os.path.getmtime)
-                st.image(latest_png, width=1500)
-            else:
-                st.warning(f"{sector_name} summary PNG not found.")
-            
-            # Display XLSX as table
-            xlsx_matches = []
-            for sector_variant in build_sector_variants(sector_name):
-                xlsx_matches.extend(
-                    glob.glob(
-                        os.path.join(
-                            base_dir,
-                            f"CURRENT_TREND_SUMMARY_ALL_STOCKS_{sector_variant}_*.xlsx",
-                        )
-                    )
-                )
-            xlsx_matches = list(set(xlsx_matches))
-            
-            if xlsx_matches:
-                latest_xlsx = max(xlsx_matches, key=os.path.getmtime)
-                try:
-                    df = pd.read_excel(latest_xlsx)
-                    st.markdown("---")
-                    st.subheader("Trend Distribution")
-                    render_trend_pie_charts(df)
-                    st.markdown("---")
-                    st.subheader("Detailed Table")
-                    st.dataframe(df, use_container_width=True)
-                except Exception as e:
-                    st.error(f"Failed to load {sector_name} XLSX file: {e}")
-            else:
-                st.warning(f"{sector_name} summary XLSX not found.")
+                    st.warning(f"{sector_name} summary XLSX not found.")
 
 ###############################################################################################################################################################
 
 # Close Above/Below Industry Summary
-with tab_industry_summary:
+def render_industry_summary_tab() -> None:
     st.header("Close Above/Below Industry Summary")
     st.write("Industry-specific trend summaries with detailed tables.")
 
-    base_dir = DATA_DIR
-    industry_tokens = discover_industry_tokens(base_dir)
+    catalog = ASSET_CATALOG
+    industry_tokens = discover_industry_tokens(catalog)
 
     if not industry_tokens:
         st.warning("No industry summary files found yet.")
     else:
+        industry_xlsx = {token: get_latest_industry_xlsx(catalog, token) for token in industry_tokens}
+        scoreboard = get_trend_scoreboard(list(industry_xlsx.values()))
+
         industry_entries = []
-        for token in industry_tokens:
-            label = industry_label_from_token(token)
-            latest_xlsx = get_latest_industry_xlsx(base_dir, token)
-            score = get_bull_minus_bear_score_from_xlsx(latest_xlsx)
+        for token, latest_xlsx in industry_xlsx.items():
+            summary = scoreboard.get(latest_xlsx) if latest_xlsx else None
             industry_entries.append(
                 {
                     "token": token,
-                    "label": label,
+                    "label": industry_label_from_token(token),
                     "xlsx": latest_xlsx,
-                    "score": score,
+                    "summary": summary,
+                    "score": summary.score if summary else MISSING_SCORE,
                 }
             )
 
@@ -1158,82 +1147,74 @@ with tab_industry_summary:
 
         industry_labels = [entry["label"] for entry in industry_entries]
         inner_tabs = ["BULL_PCT_per_INDUSTRY"] + industry_labels
-        industry_tabs = st.tabs(inner_tabs)
+        industry_tabs = lazy_tabs("industry_summary", inner_tabs)
 
         with industry_tabs[0]:
-            st.subheader("BULL_PCT per Industry")
-            donut_columns = st.columns(4)
-            for index, entry in enumerate(industry_entries):
-                with donut_columns[index % 4]:
-                    label = entry["label"]
-                    st.markdown(
-                        f'<div style="text-align:center; font-size:1.2rem; font-weight:700; margin-bottom:0.5rem;">{label}</div>',
-                        unsafe_allow_html=True,
-                    )
-                    latest_xlsx = entry["xlsx"]
-                    if latest_xlsx:
-                        try:
-                            df = pd.read_excel(latest_xlsx)
-                            render_bull_pct_donut(df)
-                        except Exception:
-                            st.warning(f"{label} data unreadable.")
-                    else:
-                        st.warning(f"{label} XLSX not found.")
+            if industry_tabs[0].open:
+                st.subheader("BULL_PCT per Industry")
+                render_bull_pct_donut_grid(
+                    [
+                        (
+                            entry["label"],
+                            entry["summary"],
+                            f"{entry['label']} data unreadable." if entry["xlsx"] else f"{entry['label']} XLSX not found.",
+                        )
+                        for entry in industry_entries
+                    ]
+                )
 
         for industry_tab, entry in zip(industry_tabs[1:], industry_entries):
             with industry_tab:
-                token = entry["token"]
-                label = entry["label"]
+                if industry_tab.open:
+                    token = entry["token"]
+                    label = entry["label"]
 
-                latest_png = get_latest_industry_png(base_dir, token)
-                if latest_png:
-                    st.image(latest_png, width=1500)
-                else:
-                    st.warning(f"{label} summary PNG not found.")
+                    latest_png = get_latest_industry_png(catalog, token)
+                    if latest_png:
+                        show_image(latest_png, width=1500)
+                    else:
+                        st.warning(f"{label} summary PNG not found.")
 
-                latest_xlsx = get_latest_industry_xlsx(base_dir, token)
-                if latest_xlsx:
-                    try:
-                        df = pd.read_excel(latest_xlsx)
-                        st.markdown("---")
-                        st.subheader("Trend Distribution")
-                        render_trend_pie_charts(df)
-                        st.markdown("---")
-                        st.subheader("Detailed Table")
-                        st.dataframe(df, use_container_width=True)
-                    except Exception as e:
-                        st.error(f"Failed to load {label} XLSX file: {e}")
-                else:
-                    st.warning(f"{label} summary XLSX not found.")
+                    latest_xlsx = entry["xlsx"]
+                    if latest_xlsx:
+                        try:
+                            df = DATASET.frame(latest_xlsx)
+                            st.markdown("---")
+                            st.subheader("Trend Distribution")
+                            render_trend_pie_charts_summary(entry["summary"])
+                            st.markdown("---")
+                            st.subheader("BULL_PCT History (90 days)")
+                            render_bull_pct_history(f"CURRENT_TREND_SUMMARY_ALL_STOCKS_INDUSTRIES_{token}")
+                            st.markdown("---")
+                            st.subheader("Detailed Table")
+                            st.dataframe(df, use_container_width=True)
+                        except Exception as e:
+                            st.error(f"Failed to load {label} XLSX file: {e}")
+                    else:
+                        st.warning(f"{label} summary XLSX not found.")
 
 ###############################################################################################################################################################
 
 # Upcoming Earnings
-with tab8:
+def render_earnings_tab() -> None:
     st.header("Upcoming Earnings")
     
-    base_dir = DATA_DIR
+    catalog = ASSET_CATALOG
 
     # Display latest earnings calendar graph
-    graph_pattern = os.path.join(base_dir, "earnings_calendar_*_graph.png")
-    graph_files = glob.glob(graph_pattern)
+    latest_graph = catalog.latest("earnings_calendar_graph", ".png")
 
-    if graph_files:
-        latest_graph = max(graph_files, key=os.path.getmtime)
-        st.image(latest_graph, use_container_width=True)
+    if latest_graph:
+        show_image(latest_graph, use_container_width=True)
     else:
         st.warning("earnings calendar graph image not found.")
 
-    # Search for files starting with "earnings_calendar" and ending in .csv
-    pattern = os.path.join(base_dir, "earnings_calendar_*.csv")
-    matching_files = glob.glob(pattern)
+    # Latest "earnings_calendar_<date>.csv"
+    latest_file = catalog.latest("earnings_calendar", ".csv")
 
-    if matching_files:
-        # Grab the most recently modified one
-        latest_file = max(matching_files, key=os.path.getmtime)
-        
+    if latest_file:
         try:
-            df = pd.read_csv(latest_file)
+            df = DATASET.frame(latest_file)
             st.dataframe(df, use_container_width=True)
         except Exception as e:
             st.error(f"⚠️ Failed to load CSV file: {e}")
@@ -1243,7 +1224,7 @@ with tab8:
 ###############################################################################################################################################################
 
 # 20/50ma Crossover
-with tab9:
+def render_ma_crossover_tab() -> None:
     st.header("20/50ma Crossover")
     st.write("SPY daily candlestick pages with MA 20/50 crossover zones and summary stats.")
     st.write("Green Zones show where the 20MA flips above the 50MA. Red Zones show where the 20MA flips below the 50MA.")
@@ -1252,72 +1233,50 @@ with tab9:
     st.write("The price action following a 20/50ma crossover is not guaranteed but the odds increase for a certain direction.")
     st.write("The zones were calculated by looking for the maximum price gain or decline within the zone. This simply gives an idea to what direction price should be heading short term.")
     
-    base_dir = DATA_DIR
-
-    # Search for files starting with "spy_daily_data" and ending in "_graph.png"
-    pattern = os.path.join(base_dir, "spy_daily_data_*_page_*_graph.png")
-    matching_files = glob.glob(pattern)
+    catalog = ASSET_CATALOG
 
-    if matching_files:
-        # Pick the latest date-run by using the newest modified file, then matching its date prefix
-        latest_file = max(matching_files, key=os.path.getmtime)
-        latest_name = os.path.basename(latest_file)
-        latest_prefix = latest_name.split("_page_")[0]
+    # "spy_daily_data_<date>_page_<n>_graph.png": only the pages of the latest complete run
+    page_run = catalog.latest_page_run("spy_daily_data_page_", ".png", "_graph")
 
-        latest_run_pages = [
-            file_path for file_path in matching_files
-            if os.path.basename(file_path).startswith(latest_prefix + "_page_")
-        ]
-
-        def extract_page_number(path: str) -> int:
-            name = os.path.basename(path)
-            try:
-                return int(name.split("_page_")[1].split("_graph.png")[0])
-            except Exception:
-                return 999999
-
-        latest_run_pages = sorted(latest_run_pages, key=extract_page_number, reverse=True)
-        ma_tab_labels = [f"Page {extract_page_number(p)}" for p in latest_run_pages]
-        ma_tabs = st.tabs(ma_tab_labels)
-        for tab, page_path in zip(ma_tabs, latest_run_pages):
+    if page_run:
+        latest_run_pages = page_run.pages[::-1]
+        ma_tab_labels = [f"Page {page_number(version.family)}" for version in latest_run_pages]
+        ma_tabs = lazy_tabs("ma_crossover", ma_tab_labels)
+        for tab, page_version in zip(ma_tabs, latest_run_pages):
             with tab:
-                st.image(page_path, use_container_width=True)
+                if tab.open:
+                    show_image(page_version.path, use_container_width=True)
     else:
         st.warning("20/50ma crossover graph images not found.")
 
 ###############################################################################################################################################################
 
 # NAAIM Data
-with tab10:
+def render_naaim_tab() -> None:
     st.header("NAAIM Data")
     st.write("Above 90 seems to be an area where you should start to see a stock market pullback/selloff. Below 40 seems to be an area where you should start to see a stock market rally.")
     
-    base_dir = DATA_DIR
+    catalog = ASSET_CATALOG
 
-    # Search for files starting with "naaim_plot" and ending in .png
-    pattern = os.path.join(base_dir, "naaim_plot_*.png")
-    matching_files = glob.glob(pattern)
+    # Latest "naaim_plot_<date>.png"
+    latest_file = catalog.latest("naaim_plot", ".png")
 
-    if matching_files:
-        # Grab the most recently modified one
-        latest_file = max(matching_files, key=os.path.getmtime)
-        st.image(latest_file, width=1500)
+    if latest_file:
+        show_image(latest_file, width=1500)
     else:
         st.warning("NAAIM Plot image not found.")
 
     st.subheader("NAAIM + SPY Overlay")
 
-    combined_pattern = os.path.join(base_dir, "naaim_spy_combined_*_graph.png")
-    combined_files = glob.glob(combined_pattern)
+    latest_combined = catalog.latest("naaim_spy_combined_graph", ".png")
 
-    if combined_files:
-        latest_combined = max(combined_files, key=os.path.getmtime)
-        st.image(latest_combined, width=1500)
+    if latest_combined:
+        show_image(latest_combined, width=1500)
     else:
         st.warning("NAAIM + SPY combined graph image not found.")
 
 # Notes
-with tab11:
+def render_notes_tab() -> None:
     st.write("Trading Psychology:")
     st.write("FOMO:")
     st.write("Afraid of watching the market move in a direction without me.")
@@ -1337,14 +1296,14 @@ with tab11:
 #######################################################################################################################################################################
 
 # SPY/VIX Analysis
-with tab_spy_vix:
+def render_spy_vix_tab() -> None:
     st.header("SPY/VIX Analysis")
 
-    base_dir = DATA_DIR
+    catalog = ASSET_CATALOG
 
     (
         svix_tab1, svix_tab2, svix_tab3, svix_tab4, svix_tab5, svix_tab6
-    ) = st.tabs([
+    ) = lazy_tabs("spy_vix", [
         "VIX Daily Returns & % Positive Rate",
         "SPY Daily Returns & % Positive Rate",
         "VIX Avg Price & STD Dev Bands",
@@ -1354,63 +1313,66 @@ with tab_spy_vix:
     ])
 
     with svix_tab1:
-        vix_weekday_matches = glob.glob(os.path.join(base_dir, "vix_weekday_*_graph.png"))
-        if vix_weekday_matches:
-            latest_vix_weekday = max(vix_weekday_matches, key=os.path.getmtime)
-            st.image(latest_vix_weekday, width=800)
-        else:
-            st.warning("VIX Weekday Returns & Hit Rate image not found.")
+        if svix_tab1.open:
+            latest_vix_weekday = catalog.latest("vix_weekday_graph", ".png")
+            if latest_vix_weekday:
+                show_image(latest_vix_weekday, width=800)
+            else:
+                st.warning("VIX Weekday Returns & Hit Rate image not found.")
 
     with svix_tab2:
-        spy_weekday_matches = glob.glob(os.path.join(base_dir, "spy_weekday_*_graph.png"))
-        if spy_weekday_matches:
-            latest_spy_weekday = max(spy_weekday_matches, key=os.path.getmtime)
-            st.image(latest_spy_weekday, width=800)
-        else:
-            st.warning("SPY Daily Returns & % Positive Rate image not found.")
+        if svix_tab2.open:
+            latest_spy_weekday = catalog.latest("spy_weekday_graph", ".png")
+            if latest_spy_weekday:
+                show_image(latest_spy_weekday, width=800)
+            else:
+                st.warning("SPY Daily Returns & % Positive Rate image not found.")
 
     with svix_tab3:
-        matches = glob.glob(os.path.join(base_dir, "vix_analysis_*_graph.png"))
-        if matches:
-            st.image(max(matches, key=os.path.getmtime), width=1200)
-        else:
-            st.warning("VIX Avg Price & STD Dev Bands image not found.")
+        if svix_tab3.open:
+            latest_file = catalog.latest("vix_analysis_graph", ".png")
+            if latest_file:
+                show_image(latest_file, width=1200)
+            else:
+                st.warning("VIX Avg Price & STD Dev Bands image not found.")
 
     with svix_tab4:
-        matches = glob.glob(os.path.join(base_dir, "spy_uvxy_positive_*_graph.png"))
-        if matches:
-            st.image(max(matches, key=os.path.getmtime), width=1200)
-        else:
-            st.warning("SPY Candles with UVXY+SPY Positive Dates image not found.")
+        if svix_tab4.open:
+            latest_file = catalog.latest("spy_uvxy_positive_graph", ".png")
+            if latest_file:
+                show_image(latest_file, width=1200)
+            else:
+                st.warning("SPY Candles with UVXY+SPY Positive Dates image not found.")
 
     with svix_tab5:
-        matches = glob.glob(os.path.join(base_dir, "spy_vix_positive_*_graph.png"))
-        if matches:
-            st.image(max(matches, key=os.path.getmtime), width=1200)
-        else:
-            st.warning("SPY Candles with VIX+SPY Positive Dates image not found.")
+        if svix_tab5.open:
+            latest_file = catalog.latest("spy_vix_positive_graph", ".png")
+            if latest_file:
+                show_image(latest_file, width=1200)
+            else:
+                st.warning("SPY Candles with VIX+SPY Positive Dates image not found.")
 
     with svix_tab6:
-        matches = glob.glob(os.path.join(base_dir, "spy_combined_positive_signals_*.xlsx"))
-        if matches:
-            latest_file = max(matches, key=os.path.getmtime)
-            try:
-                combined_df = pd.read_excel(latest_file)
-                st.dataframe(combined_df, use_container_width=True, hide_index=True)
-            except Exception as e:
-                st.error(f"⚠️ Failed to load combined signal XLSX file: {e}")
-        else:
-            st.warning("SPY combined positive signals file not found.")
+        if svix_tab6.open:
+            latest_file = catalog.latest("spy_combined_positive_signals", ".xlsx")
+            if latest_file:
+                try:
+                    combined_df = DATASET.frame(latest_file)
+                    st.dataframe(combined_df, use_container_width=True, hide_index=True)
+                except Exception as e:
+                    st.error(f"⚠️ Failed to load combined signal XLSX file: {e}")
+            else:
+                st.warning("SPY combined positive signals file not found.")
 
 #######################################################################################################################################################################
 
 # SPY Analysis
-with tab_spy_analysis:
+def render_spy_analysis_tab() -> None:
     st.header("SPY Analysis")
 
-    base_dir = DATA_DIR
+    catalog = ASSET_CATALOG
 
-    day_tab1, day_tab2, day_tab3, day_tab4, day_tab5 = st.tabs([
+    day_tab1, day_tab2, day_tab3, day_tab4, day_tab5 = lazy_tabs("spy_analysis", [
         "Daily SPY Gain Chart",
         "SPY Daily Positive Count Ghart",
         "Monthly SPY Gain Chart",
@@ -1419,50 +1381,54 @@ with tab_spy_analysis:
     ])
 
     with day_tab1:
-        gain_chart_path = os.path.join(base_dir, "Daily_SPY_Gain_Chart.png")
-        if os.path.exists(gain_chart_path):
-            st.image(gain_chart_path, use_container_width=True)
-        else:
-            st.warning("Daily SPY Gain Chart image not found.")
+        if day_tab1.open:
+            gain_chart_path = catalog.latest("Daily_SPY_Gain_Chart", ".png")
+            if gain_chart_path:
+                show_image(gain_chart_path, use_container_width=True)
+            else:
+                st.warning("Daily SPY Gain Chart image not found.")
 
     with day_tab2:
-        positive_count_path = os.path.join(base_dir, "SPY_Daily_Positive_Count_Ghart.png")
-        if os.path.exists(positive_count_path):
-            st.image(positive_count_path, use_container_width=True)
-        else:
-            st.warning("SPY Daily Positive Count Ghart image not found.")
+        if day_tab2.open:
+            positive_count_path = catalog.latest("SPY_Daily_Positive_Count_Ghart", ".png")
+            if positive_count_path:
+                show_image(positive_count_path, use_container_width=True)
+            else:
+                st.warning("SPY Daily Positive Count Ghart image not found.")
 
     with day_tab3:
-        monthly_gain_path = os.path.join(base_dir, "MONTHLY_SPY_Gain_Chart.png")
-        if os.path.exists(monthly_gain_path):
-            st.image(monthly_gain_path, width=700)
-        else:
-            st.warning("Monthly SPY Gain Chart image not found.")
+        if day_tab3.open:
+            monthly_gain_path = catalog.latest("MONTHLY_SPY_Gain_Chart", ".png")
+            if monthly_gain_path:
+                show_image(monthly_gain_path, width=700)
+            else:
+                st.warning("Monthly SPY Gain Chart image not found.")
 
     with day_tab4:
-        yearly_gain_path = os.path.join(base_dir, "YEARLY_SPY_Gain_Chart.png")
-        if os.path.exists(yearly_gain_path):
-            st.image(yearly_gain_path, width=700)
-        else:
-            st.warning("Yearly SPY Gain Chart image not found.")
+        if day_tab4.open:
+            yearly_gain_path = catalog.latest("YEARLY_SPY_Gain_Chart", ".png")
+            if yearly_gain_path:
+                show_image(yearly_gain_path, width=700)
+            else:
+                st.warning("Yearly SPY Gain Chart image not found.")
 
     with day_tab5:
-        spy_10wk_matches = glob.glob(os.path.join(base_dir, "spy_last_10_weeks_*_graph.png"))
-        if spy_10wk_matches:
-            latest_spy_10wk = max(spy_10wk_matches, key=os.path.getmtime)
-            st.image(latest_spy_10wk, width=800)
-        else:
-            st.warning("SPY Last 10 Weeks image not found.")
+        if day_tab5.open:
+            latest_spy_10wk = catalog.latest("spy_last_10_weeks_graph", ".png")
+            if latest_spy_10wk:
+                show_image(latest_spy_10wk, width=800)
+            else:
+                st.warning("SPY Last 10 Weeks image not found.")
 
 #######################################################################################################################################################################
 
 # YTD Analysis
-with tab_ytd:
+def render_ytd_tab() -> None:
     st.header("YTD Analysis")
 
-    base_dir = DATA_DIR
-    sector_matches = glob.glob(os.path.join(base_dir, "ytd_analysis_*.xlsx"))
-    all_stocks_matches = glob.glob(os.path.join(base_dir, "all_stocks_ytd_analysis_*.xlsx"))
+    catalog = ASSET_CATALOG
+    latest_sector_file = catalog.latest("ytd_analysis", ".xlsx")
+    latest_all_stocks_file = catalog.latest("all_stocks_ytd_analysis", ".xlsx")
 
     st.markdown(
         """
@@ -1483,143 +1449,62 @@ with tab_ytd:
     )
 
     row_height = 24
-    ytd_sub_sector, ytd_sub_all = st.tabs(["Sector ETFs", "All Stocks"])
+    ytd_sub_sector, ytd_sub_all = lazy_tabs("ytd", ["Sector ETFs", "All Stocks"])
 
     with ytd_sub_sector:
-        st.subheader("Sector ETFs")
-        if sector_matches:
-            latest_sector_file = max(sector_matches, key=os.path.getmtime)
-            try:
-                sector_df = pd.read_excel(latest_sector_file)
-                sector_table_height = min(900, max(360, row_height * (len(sector_df) + 1) + 12))
-                st.dataframe(
-                    sector_df,
-                    use_container_width=True,
-                    height=sector_table_height,
-                    hide_index=True,
-                    row_height=row_height,
-                )
+        if ytd_sub_sector.open:
+            st.subheader("Sector ETFs")
+            if latest_sector_file:
+                try:
+                    sector_df = DATASET.frame(latest_sector_file)
+                    sector_table_height = min(900, max(360, row_height * (len(sector_df) + 1) + 12))
+                    st.dataframe(
+                        sector_df,
+                        use_container_width=True,
+                        height=sector_table_height,
+                        hide_index=True,
+                        row_height=row_height,
+                    )
 
-                # --- %_FROM_ATH chart ---
-                ath_col = find_matching_column(sector_df, ["%_FROM_ATH", "PCT_FROM_ATH", "% From ATH", "pct_from_ath"])
-                ticker_col = find_matching_column(sector_df, ["Ticker", "TICKER", "Symbol", "SYMBOL"])
-                if ath_col and ticker_col:
-                    ath_df = sector_df[[ticker_col, ath_col]].dropna().copy()
-                    ath_df[ath_col] = pd.to_numeric(ath_df[ath_col], errors="coerce")
-                    ath_df = ath_df.dropna(subset=[ath_col])
-                    ath_df = ath_df.sort_values(by=ath_col, ascending=True)  # worst on left
-                    colors = ["#e74c3c" if v <= -20 else "#2ecc71" for v in ath_df[ath_col]]
-
-                    import matplotlib.pyplot as plt
-                    import matplotlib.ticker as mticker
-                    fig, ax = plt.subplots(figsize=(max(10, len(ath_df) * 0.7), 6))
-                    ax.bar(ath_df[ticker_col], ath_df[ath_col], color=colors, edgecolor="black", linewidth=0.5)
-                    ax.set_ylim(-100, 0)
-                    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f"{x:.0f}%"))
-                    ax.axhline(-20, color="#e74c3c", linestyle="--", linewidth=1, label="-20% threshold")
-                    ax.set_title("Sector ETFs — % From ATH", fontsize=14, fontweight="bold")
-                    ax.set_xlabel("Ticker")
-                    ax.set_ylabel("% From ATH")
-                    ax.legend(fontsize=9)
-                    ax.tick_params(axis="x", rotation=45)
-                    fig.patch.set_facecolor("#0e1117")
-                    ax.set_facecolor("#0e1117")
-                    ax.title.set_color("white")
-                    ax.xaxis.label.set_color("white")
-                    ax.yaxis.label.set_color("white")
-                    ax.tick_params(colors="white")
-                    for spine in ax.spines.values():
-                        spine.set_edgecolor("#444")
-                    ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: f"{x:.0f}%"))
-                    plt.tight_layout()
-                    st.pyplot(fig)
-                    plt.close(fig)
-                else:
-                    st.info("No `%_FROM_ATH` or `Ticker` column found in Sector ETF file for chart.")
+                    # --- %_FROM_ATH chart ---
+                    ath_col = find_matching_column(sector_df, ["%_FROM_ATH", "PCT_FROM_ATH", "% From ATH", "pct_from_ath"])
+                    ticker_col = find_matching_column(sector_df, ["Ticker", "TICKER", "Symbol", "SYMBOL"])
+                    if ath_col and ticker_col:
+                        ath_df = sector_df[[ticker_col, ath_col]].dropna().copy()
+                        ath_df[ath_col] = pd.to_numeric(ath_df[ath_col], errors="coerce")
+                        ath_df = ath_df.dropna(subset=[ath_col])
+                        ath_df = ath_df.sort_values(by=ath_col, ascending=True)  # worst on left
+                        colors = ["#e74c3c" if v <= -20 else "#2ecc71" for v in ath_df[ath_col]]
+
+                        show_bar_chart(ath_df[ticker_col].tolist(), ath_df[ath_col].tolist(), colors, ATH_CHART_STYLE)
+                    else:
+                        st.info("No `%_FROM_ATH` or `Ticker` column found in Sector ETF file for chart.")
 
-            except Exception as e:
-                st.error(f"⚠️ Failed to load sector ETF XLSX file: {e}")
-        else:
-            st.warning("Sector ETF YTD analysis file not found.")
+                except Exception as e:
+                    st.error(f"⚠️ Failed to load sector ETF XLSX file: {e}")
+            else:
+                st.warning("Sector ETF YTD analysis file not found.")
 
     with ytd_sub_all:
-        st.subheader("All Stocks")
-        if all_stocks_matches:
-            latest_all_stocks_file = max(all_stocks_matches, key=os.path.getmtime)
-            try:
-                all_stocks_df = pd.read_excel(latest_all_stocks_file)
-
-                sector_col = find_matching_column(all_stocks_df, ["Sector"])
-                industry_col = find_matching_column(all_stocks_df, ["Industry"])
-                filtered_df = all_stocks_df.copy()
-
-                if sector_col or industry_col:
-                    filter_container = getattr(st, "popover", None)
-                    if callable(filter_container):
-                        filter_context = filter_container("🔎 Filter Table")
-                    else:
-                        filter_context = st.expander("🔎 Filter Table", expanded=False)
-
-                    with filter_context:
-                        selected_sectors = []
-                        selected_industries = []
-                        filter_col1, filter_col2 = st.columns(2)
-
-                        if sector_col:
-                            sector_options = sorted(
-                                value for value in all_stocks_df[sector_col].dropna().astype(str).unique() if value.strip()
-                            )
-                            selected_sectors = filter_col1.multiselect(
-                                "Sector",
-                                sector_options,
-                                key="ytd_all_stocks_sector_filter",
-                            )
-                            if selected_sectors:
-                                filtered_df = filtered_df[filtered_df[sector_col].astype(str).isin(selected_sectors)]
-                        else:
-                            filter_col1.caption("No `Sector` column found")
-
-                        if industry_col:
-                            industry_source_df = filtered_df if sector_col and selected_sectors else all_stocks_df
-                            industry_options = sorted(
-                                value for value in industry_source_df[industry_col].dropna().astype(str).unique() if value.strip()
-                            )
-                            selected_industries = filter_col2.multiselect(
-                                "Industry",
-                                industry_options,
-                                key="ytd_all_stocks_industry_filter",
-                            )
-                            if selected_industries:
-                                filtered_df = filtered_df[filtered_df[industry_col].astype(str).isin(selected_industries)]
-                        else:
-                            filter_col2.caption("No `Industry` column found")
-
-                    st.caption(f"Showing {len(filtered_df):,} of {len(all_stocks_df):,} rows")
-                else:
-                    st.caption("No `Sector` or `Industry` columns were found in this file.")
-
-                all_stocks_table_height = min(900, max(360, row_height * (len(filtered_df) + 1) + 12))
-                st.dataframe(
-                    filtered_df,
-                    use_container_width=True,
-                    height=all_stocks_table_height,
-                    hide_index=True,
-                    row_height=row_height,
-                )
-            except Exception as e:
-                st.error(f"⚠️ Failed to load all-stocks XLSX file: {e}")
-        else:
-            st.warning("All stocks YTD analysis file not found.")
+        if ytd_sub_all.open:
+            st.subheader("All Stocks")
+            if latest_all_stocks_file:
+                try:
+                    render_table_view("ytd_all_stocks", DATASET.table_view(latest_all_stocks_file, ("Sector", "Industry")), row_height)
+                except Exception as e:
+                    st.error(f"⚠️ Failed to load all-stocks XLSX file: {e}")
+            else:
+                st.warning("All stocks YTD analysis file not found.")
 
 #######################################################################################################################################################################
 
 # Candle Strength
-with tab_candle_strength:
+def render_candle_strength_tab() -> None:
     st.header("Candle Strength")
 
-    base_dir = DATA_DIR
-    etf_matches = glob.glob(os.path.join(base_dir, "ETF_CANDLE_STRENGTH*.xlsx"))
-    all_stocks_matches = glob.glob(os.path.join(base_dir, "ALL_STOCKS_CANDLE_STRENGTH*.xlsx"))
+    catalog = ASSET_CATALOG
+    latest_etf_file = catalog.latest("ETF_CANDLE_STRENGTH", ".xlsx")
+    latest_all_stocks_file = catalog.latest("ALL_STOCKS_CANDLE_STRENGTH", ".xlsx")
 
     st.markdown(
         """
@@ -1640,97 +1525,66 @@ with tab_candle_strength:
     )
 
     row_height = 24
-    candle_sub_etf, candle_sub_all = st.tabs(["ETF Candle Strength", "All Stocks Candle Strength"])
+    candle_sub_etf, candle_sub_all = lazy_tabs("candle_strength", ["ETF Candle Strength", "All Stocks Candle Strength"])
 
     with candle_sub_etf:
-        st.subheader("ETF Candle Strength")
-        if etf_matches:
-            latest_etf_file = max(etf_matches, key=os.path.getmtime)
-            try:
-                etf_df = pd.read_excel(latest_etf_file)
-                etf_table_height = min(900, max(360, row_height * (len(etf_df) + 1) + 12))
-                st.dataframe(
-                    etf_df,
-                    use_container_width=True,
-                    height=etf_table_height,
-                    hide_index=True,
-                    row_height=row_height,
-                )
+        if candle_sub_etf.open:
+            st.subheader("ETF Candle Strength")
+            if latest_etf_file:
+                try:
+                    etf_df = DATASET.frame(latest_etf_file)
+                    etf_table_height = min(900, max(360, row_height * (len(etf_df) + 1) + 12))
+                    st.dataframe(
+                        etf_df,
+                        use_container_width=True,
+                        height=etf_table_height,
+                        hide_index=True,
+                        row_height=row_height,
+                    )
 
-                # --- CLOSE_SCORE bar chart ---
-                if 'CLOSE_SCORE' in etf_df.columns and 'TICKER' in etf_df.columns:
-                    import matplotlib.pyplot as plt
-                    
-                    chart_df = etf_df[['TICKER', 'CLOSE_SCORE']].dropna().copy()
-                    if len(chart_df) > 0:
-                        chart_df['CLOSE_SCORE'] = pd.to_numeric(chart_df['CLOSE_SCORE'], errors='coerce')
-                        chart_df = chart_df.dropna(subset=['CLOSE_SCORE'])
-                        
+                    # --- CLOSE_SCORE bar chart ---
+                    if 'CLOSE_SCORE' in etf_df.columns and 'TICKER' in etf_df.columns:
+                        chart_df = etf_df[['TICKER', 'CLOSE_SCORE']].dropna().copy()
                         if len(chart_df) > 0:
-                            # Color bars based on score
-                            colors = []
-                            for score in chart_df['CLOSE_SCORE']:
-                                if score >= 75:
-                                    colors.append('#2ecc71')  # Green
-                                elif score <= 25:
-                                    colors.append('#e74c3c')  # Red
-                                else:
-                                    colors.append('#95a5a6')  # Gray
-                            
-                            fig, ax = plt.subplots(figsize=(max(10, len(chart_df) * 0.6), 6))
-                            ax.bar(chart_df['TICKER'], chart_df['CLOSE_SCORE'], color=colors, edgecolor='black', linewidth=0.5)
-                            ax.set_ylim(0, 100)
-                            ax.axhline(50, color='white', linestyle='--', linewidth=1.5, label='50 (Neutral)')
-                            ax.set_title('ETF Candle Strength - Close Score', fontsize=14, fontweight='bold')
-                            ax.set_xlabel('Ticker')
-                            ax.set_ylabel('Close Score (0-100)')
-                            ax.legend(fontsize=9)
-                            ax.tick_params(axis='x', rotation=45)
-                            
-                            fig.patch.set_facecolor('#0e1117')
-                            ax.set_facecolor('#0e1117')
-                            ax.title.set_color('white')
-                            ax.xaxis.label.set_color('white')
-                            ax.yaxis.label.set_color('white')
-                            ax.tick_params(colors='white')
-                            for spine in ax.spines.values():
-                                spine.set_edgecolor('#444')
+                            chart_df['CLOSE_SCORE'] = pd.to_numeric(chart_df['CLOSE_SCORE'], errors='coerce')
+                            chart_df = chart_df.dropna(subset=['CLOSE_SCORE'])
+                        
+                            if len(chart_df) > 0:
+                                # Color bars based on score
+                                colors = []
+                                for score in chart_df['CLOSE_SCORE']:
+                                    if score >= 75:
+                                        colors.append('#2ecc71')  # Green
+                                    elif score <= 25:
+                                        colors.append('#e74c3c')  # Red
+                                    else:
+                                        colors.append('#95a5a6')  # Gray
                             
-                            plt.tight_layout()
-                            st.pyplot(fig)
-                            plt.close(fig)
-            except Exception as e:
-                st.error(f"⚠️ Failed to load ETF candle strength XLSX file: {e}")
-        else:
-            st.warning("ETF candle strength file not found.")
+                                show_bar_chart(chart_df['TICKER'].tolist(), chart_df['CLOSE_SCORE'].tolist(), colors, CLOSE_SCORE_CHART_STYLE)
+                except Exception as e:
+                    st.error(f"⚠️ Failed to load ETF candle strength XLSX file: {e}")
+            else:
+                st.warning("ETF candle strength file not found.")
 
     with candle_sub_all:
-        st.subheader("All Stocks Candle Strength")
-        if all_stocks_matches:
-            latest_all_stocks_file = max(all_stocks_matches, key=os.path.getmtime)
-            try:
-                all_stocks_df = pd.read_excel(latest_all_stocks_file)
-                all_stocks_table_height = min(900, max(360, row_height * (len(all_stocks_df) + 1) + 12))
-                st.dataframe(
-                    all_stocks_df,
-                    use_container_width=True,
-                    height=all_stocks_table_height,
-                    hide_index=True,
-                    row_height=row_height,
-                )
-            except Exception as e:
-                st.error(f"⚠️ Failed to load all-stocks candle strength XLSX file: {e}")
-        else:
-            st.warning("All stocks candle strength file not found.")
+        if candle_sub_all.open:
+            st.subheader("All Stocks Candle Strength")
+            if latest_all_stocks_file:
+                try:
+                    render_table_view("candle_all_stocks", DATASET.table_view(latest_all_stocks_file), row_height)
+                except Exception as e:
+                    st.error(f"⚠️ Failed to load all-stocks candle strength XLSX file: {e}")
+            else:
+                st.warning("All stocks candle strength file not found.")
 
 #######################################################################################################################################################################
 
 # Beta (Average Percent Moves)
-with tab_beta:
+def render_beta_tab() -> None:
     st.header("Beta - Average Daily % Moves")
 
-    base_dir = DATA_DIR
-    beta_matches = glob.glob(os.path.join(base_dir, "AVERAGE_PCT_MOVES_*.xlsx"))
+    catalog = ASSET_CATALOG
+    latest_beta_file = catalog.latest("AVERAGE_PCT_MOVES", ".xlsx")
 
     st.markdown(
         """
@@ -1752,10 +1606,9 @@ with tab_beta:
 
     st.write("Average absolute daily % moves over the past year, sorted from highest to lowest.")
 
-    if beta_matches:
-        latest_beta_file = max(beta_matches, key=os.path.getmtime)
+    if latest_beta_file:
         try:
-            beta_df = pd.read_excel(latest_beta_file)
+            beta_df = DATASET.frame(latest_beta_file)
             beta_table_height = min(900, max(360, 24 * (len(beta_df) + 1) + 12))
             st.dataframe(
                 beta_df,
@@ -1772,62 +1625,49 @@ with tab_beta:
 #######################################################################################################################################################################
 
 # Fed Funds Rate - SPY
-with tab_fed_funds_spy:
+def render_fed_funds_spy_tab() -> None:
     st.header("Fed Funds Rate - SPY")
 
-    base_dir = DATA_DIR
-    fed_page_matches = glob.glob(os.path.join(base_dir, "fed_rates_spy_page_*_graph.png"))
+    catalog = ASSET_CATALOG
+    page_run = catalog.latest_page_run("fed_rates_spy_page_", ".png", "_graph")
 
-    if fed_page_matches:
-        def extract_fed_page_number(path: str) -> int:
-            name = os.path.basename(path)
-            try:
-                return int(name.split("_page_")[1].split("_")[0])
-            except Exception:
-                return -1
-
-        ordered_pages = sorted(fed_page_matches, key=extract_fed_page_number, reverse=True)
-        fed_tab_labels = [f"Page {extract_fed_page_number(p)}" for p in ordered_pages]
-        fed_tabs = st.tabs(fed_tab_labels)
-        for tab, page_path in zip(fed_tabs, ordered_pages):
+    if page_run:
+        ordered_pages = page_run.pages[::-1]
+        fed_tab_labels = [f"Page {page_number(version.family)}" for version in ordered_pages]
+        fed_tabs = lazy_tabs("fed_funds_spy", fed_tab_labels)
+        for tab, page_version in zip(fed_tabs, ordered_pages):
             with tab:
-                st.image(page_path, use_container_width=True)
+                if tab.open:
+                    show_image(page_version.path, use_container_width=True)
     else:
         st.warning("Fed Funds Rate - SPY graph images not found.")
 
 #######################################################################################################################################################################
 
 # Mercury Retrograde Analysis
-with tab_mercury:
+def render_mercury_tab() -> None:
     st.header("Mercury Retrograde Analysis")
 
-    base_dir = DATA_DIR
-
-    def extract_mercury_page_number(path: str) -> int:
-        name = os.path.basename(path)
-        try:
-            return int(name.split("_page_")[1].split("_")[0])
-        except Exception:
-            return -1
+    catalog = ASSET_CATALOG
 
-    summary_matches = glob.glob(os.path.join(base_dir, "mercury_retrograde_summary_*_graph.png"))
-    page_matches = glob.glob(os.path.join(base_dir, "mercury_retrograde_spy_page_*_graph.png"))
-    ordered_pages = sorted(page_matches, key=extract_mercury_page_number, reverse=True)
+    latest_summary = catalog.latest("mercury_retrograde_summary_graph", ".png")
+    page_run = catalog.latest_page_run("mercury_retrograde_spy_page_", ".png", "_graph")
+    ordered_pages = page_run.pages[::-1] if page_run else ()
 
-    merc_tab_labels = ["Summary Stats"] + [f"Page {extract_mercury_page_number(p)}" for p in ordered_pages]
-    merc_tab_items = [None] + ordered_pages  # None placeholder for summary tab
-    merc_tabs = st.tabs(merc_tab_labels)
+    merc_tab_labels = ["Summary Stats"] + [f"Page {page_number(version.family)}" for version in ordered_pages]
+    merc_tabs = lazy_tabs("mercury", merc_tab_labels)
 
     with merc_tabs[0]:
-        if summary_matches:
-            latest_summary = max(summary_matches, key=os.path.getmtime)
-            st.image(latest_summary, use_container_width=True)
-        else:
-            st.warning("Mercury retrograde summary image not found.")
+        if merc_tabs[0].open:
+            if latest_summary:
+                show_image(latest_summary, use_container_width=True)
+            else:
+                st.warning("Mercury retrograde summary image not found.")
 
-    for tab, page_path in zip(merc_tabs[1:], ordered_pages):
+    for tab, page_version in zip(merc_tabs[1:], ordered_pages):
         with tab:
-            st.image(page_path, use_container_width=True)
+            if tab.open:
+                show_image(page_version.path, use_container_width=True)
 
     
              
@@ -1835,6 +1675,79 @@ with tab_mercury:
 
 #######################################################################################################################################################################
 
+#######################################################################################################################################################################
+
+# Diagnostics (only with profiling on)
+def profile_rows(sections: dict) -> list[dict]:
+    return [
+        {"tab": label, "category": category, **stats}
+        for label, categories in sections.items()
+        for category, stats in sorted(categories.items())
+    ]
 
 
+def render_diagnostics_tab() -> None:
+    st.header("Diagnostics")
+    st.caption("Latest run of each tab this session. Switch tabs to profile them.")
+    diagnostics = st.session_state.get("diagnostics", {})
+    if diagnostics:
+        table = pd.DataFrame(profile_rows(diagnostics))
+        table["seconds"] = table["seconds"].round(4)
+        st.dataframe(table, use_container_width=True, hide_index=True)
+    else:
+        st.info("No tab has been profiled yet.")
+
+    st.subheader("Process-wide caches")
+    process_stats = {
+        "frame_cache": FRAME_CACHE.stats(),
+        "chart_cache": dict(chart_stats),
+        "dataset_bundle": DATASET.stats(),
+        "published_run": (read_manifest(DATA_DIR) or {}).get("run_id"),
+    }
+    st.json(process_stats)
 
+    st.download_button(
+        "Download profile (JSON)",
+        data=json.dumps({"tabs": diagnostics, "process": process_stats}, indent=2),
+        file_name="dashboard_profile.json",
+        mime="application/json",
+    )
+
+
+# Tabs
+MAIN_TABS = [
+    ("Mindset", render_mindset_tab),
+    ("Trade Tracker", render_trade_tracker_tab),
+    ("Seasonality", render_seasonality_tab),
+    ("Sector Analysis", render_sector_analysis_tab),
+    ("SPY/VIX Analysis", render_spy_vix_tab),
+    ("SPY Analysis", render_spy_analysis_tab),
+    ("YTD Analysis", render_ytd_tab),
+    ("Candle Strength", render_candle_strength_tab),
+    ("Beta", render_beta_tab),
+    ("Fed Funds Rate - SPY", render_fed_funds_spy_tab),
+    ("Mercury Retrograde Analysis", render_mercury_tab),
+    ("Tail Candles (D-W-M)", render_tail_candles_tab),
+    ("Close Above/Below Tickers", render_close_above_below_tab),
+    ("Close Above/Below Summary", render_close_above_below_summary_tab),
+    ("Close Above/Below Sector Summary", render_sector_summary_tab),
+    ("Close Above/Below Industry Summary", render_industry_summary_tab),
+    ("Upcoming Earnings", render_earnings_tab),
+    ("20/50ma Crossover", render_ma_crossover_tab),
+    ("NAAIM Data", render_naaim_tab),
+    ("Notes", render_notes_tab),
+]
+
+if PROFILING:
+    MAIN_TABS.append(("Diagnostics", render_diagnostics_tab))
+
+main_tabs = lazy_tabs("main", [label for label, _ in MAIN_TABS])
+for main_tab, (label, render_tab) in zip(main_tabs, MAIN_TABS):
+    if main_tab.open:
+        with main_tab, section(label):
+            render_tab()
+
+if PROFILING:
+    # Keep each tab's most recent run; the Diagnostics tab reads them on its next render.
+    st.session_state.setdefault("diagnostics", {}).update(RUN_PROFILE.sections)
+    stop_profile()